@@ -0,0 +1,301 @@
+# src/benchmarks/render_benchmark.py
+"""
+Render benchmark for Quadify's screens, menus and screensavers.
+
+Drives every component with recorded Volumio pushState payloads against a
+headless display backend (default: 'virtual', i.e. the real SSD1322 driver
+and frame-diff path over a no-op serial interface) and reports, per
+component:
+  - draw time per frame (everything except oled.display)
+  - oled.display time per frame
+  - bytes allocated per frame (tracemalloc peak, measured in a separate pass)
+  - achieved frames per second
+
+Run from the src directory:
+    python -m benchmarks.render_benchmark
+    python -m benchmarks.render_benchmark --frames 300 --only modern,clock
+    python -m benchmarks.render_benchmark --json results.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+import yaml
+from blinker import Signal
+
+from display.display_manager import DisplayManager
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG = os.path.join(os.path.dirname(SRC_DIR), "config.yaml")
+DEFAULT_PAYLOADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads", "push_state.json")
+INSTALL_PREFIX = "/home/volumio/Quadify/src"
+
+
+# ------------------------------------------------------------------
+#   Stand-ins for the live Volumio connection and ModeManager
+# ------------------------------------------------------------------
+class RecordedVolumio:
+    """Replays recorded pushState payloads in place of VolumioListener."""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.state_changed = Signal()
+        self.socketIO = None
+        self.current_state = payloads[0] if payloads else {}
+
+    def get_current_state(self):
+        return dict(self.current_state)
+
+    def is_connected(self):
+        return False
+
+
+class BenchModeManager:
+    """Just enough of ModeManager for the screens: a fixed mode and the config."""
+
+    def __init__(self, mode, config):
+        self.mode = mode
+        self.config = config
+
+    def get_mode(self):
+        return self.mode
+
+    def is_state_change_suppressed(self):
+        return False
+
+    def add_on_mode_change_callback(self, callback):
+        pass
+
+
+class TimedDisplay:
+    """Wraps oled.display to accumulate the time spent pushing frames."""
+
+    def __init__(self, oled):
+        self.inner = oled.display
+        self.elapsed = 0.0
+        self.calls = 0
+        oled.display = self
+
+    def __call__(self, image):
+        start = time.perf_counter()
+        self.inner(image)
+        self.elapsed += time.perf_counter() - start
+        self.calls += 1
+
+    def take(self):
+        elapsed, self.elapsed, self.calls = self.elapsed, 0.0, 0
+        return elapsed
+
+
+# ------------------------------------------------------------------
+#   Components
+# ------------------------------------------------------------------
+def _playback_screen(cls, mode, services=None, exclude=None):
+    """
+    Builds a frame function for a playback screen. The screen gets the next
+    recorded payload every `hold` frames; its frame is rendered exactly as the
+    render scheduler would and then pushed to the display.
+    """
+    def build(display_manager, payloads, hold):
+        selected = [p for p in payloads
+                    if (services is None or p.get("service") in services)
+                    and (exclude is None or p.get("service") not in exclude)]
+        volumio = RecordedVolumio(selected)
+        screen = cls(display_manager, volumio, BenchModeManager(mode, display_manager.config))
+        screen.is_active = True
+        counter = {"frame": 0}
+
+        def frame():
+            index = counter["frame"]
+            counter["frame"] += 1
+            # Static layouts only render on new state, so hand them one every frame
+            with screen.state_lock:
+                screen.latest_state = dict(selected[(index // hold) % len(selected)])
+            image = screen.render_frame()
+            if image is not None:
+                display_manager.oled.display(image.convert(display_manager.oled.mode))
+        return frame
+    return build
+
+
+def _clock(display_manager, payloads, hold):
+    from display.screens.clock import Clock
+    clock = Clock(display_manager, {"clock_font_key": "clock_digital", "show_date": True}, RecordedVolumio(payloads))
+    return clock.draw_clock
+
+
+def _menu(display_manager, payloads, hold):
+    from managers.menu_manager import MenuManager
+    menu = MenuManager(display_manager, RecordedVolumio(payloads), BenchModeManager("menu", {}))
+    menu.is_active = True
+    counter = {"frame": 0}
+
+    def frame():
+        counter["frame"] += 1
+        menu.current_selection_index = (counter["frame"] // hold) % len(menu.current_menu_items)
+        menu.display_icon_row_menu()
+    return frame
+
+
+def _screensaver(module, cls_name, method):
+    def build(display_manager, payloads, hold):
+        module_obj = __import__(f"display.screensavers.{module}", fromlist=[cls_name])
+        saver = getattr(module_obj, cls_name)(display_manager)
+        if hasattr(saver, "reset_animation"):
+            saver.reset_animation()
+        return getattr(saver, method)
+    return build
+
+
+def _components():
+    from display.screens.modern_screen import ModernScreen
+    from display.screens.minimal_screen import MinimalScreen
+    from display.screens.original_screen import OriginalScreen
+    from display.screens.webradio_screen import WebRadioScreen
+    from display.screens.airplay_screen import AirPlayScreen
+
+    local_only = ("webradio", "airplay_emulation")
+    return {
+        "modern":   _playback_screen(ModernScreen, "modern", exclude=local_only),
+        "minimal":  _playback_screen(MinimalScreen, "minimal", exclude=local_only),
+        "original": _playback_screen(OriginalScreen, "original", exclude=local_only),
+        "webradio": _playback_screen(WebRadioScreen, "webradio", services=("webradio",)),
+        "airplay":  _playback_screen(AirPlayScreen, "airplay", services=("airplay_emulation",)),
+        "clock":    _clock,
+        "menu":     _menu,
+        "geo":      _screensaver("geo_screensaver", "GeoScreensaver", "refresh_action"),
+        "snake":    _screensaver("snake_screensaver", "SnakeScreensaver", "refresh_action"),
+        "bouncing": _screensaver("bouncing_text_screensaver", "BouncingTextScreensaver", "update_and_draw"),
+    }
+
+
+# ------------------------------------------------------------------
+#   Measurement
+# ------------------------------------------------------------------
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_component(name, build, display_manager, payloads, frames, hold, warmup=5):
+    timer = TimedDisplay(display_manager.oled)
+    try:
+        frame = build(display_manager, payloads, hold)
+        for _ in range(warmup):
+            frame()
+        timer.take()
+
+        # Pass 1: timing, without tracemalloc overhead
+        draw_times, display_times = [], []
+        wall_start = time.perf_counter()
+        for _ in range(frames):
+            start = time.perf_counter()
+            frame()
+            total = time.perf_counter() - start
+            shown = timer.take()
+            display_times.append(shown)
+            draw_times.append(total - shown)
+        wall = time.perf_counter() - wall_start
+
+        # Pass 2: allocations per frame
+        allocations = []
+        tracemalloc.start()
+        try:
+            for _ in range(min(frames, 50)):
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                frame()
+                _, peak = tracemalloc.get_traced_memory()
+                allocations.append(max(0, peak - before))
+        finally:
+            tracemalloc.stop()
+    finally:
+        display_manager.oled.display = timer.inner
+
+    return {
+        "component": name,
+        "frames": frames,
+        "draw_ms_mean": 1000 * sum(draw_times) / frames,
+        "draw_ms_p95": 1000 * _percentile(draw_times, 95),
+        "display_ms_mean": 1000 * sum(display_times) / frames,
+        "display_ms_p95": 1000 * _percentile(display_times, 95),
+        "alloc_kib_mean": sum(allocations) / len(allocations) / 1024 if allocations else 0.0,
+        "alloc_kib_max": max(allocations) / 1024 if allocations else 0.0,
+        "fps": frames / wall if wall > 0 else 0.0,
+    }
+
+
+def _localise_paths(display_config):
+    """Maps the Pi install paths in config.yaml onto this checkout when they don't exist here."""
+    def fix(path):
+        if isinstance(path, str) and path.startswith(INSTALL_PREFIX) and not os.path.exists(path):
+            return SRC_DIR + path[len(INSTALL_PREFIX):]
+        return path
+
+    config = {key: fix(value) for key, value in display_config.items()}
+    config["fonts"] = {
+        key: dict(info, path=fix(info.get("path")))
+        for key, info in display_config.get("fonts", {}).items()
+    }
+    return config
+
+
+def print_report(results):
+    header = f"{'component':<10} {'frames':>6} {'draw ms':>8} {'p95':>7} {'disp ms':>8} {'p95':>7} {'KiB/fr':>8} {'KiB max':>8} {'fps':>7}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['component']:<10} {r['frames']:>6} {r['draw_ms_mean']:>8.2f} {r['draw_ms_p95']:>7.2f} "
+              f"{r['display_ms_mean']:>8.2f} {r['display_ms_p95']:>7.2f} {r['alloc_kib_mean']:>8.1f} "
+              f"{r['alloc_kib_max']:>8.1f} {r['fps']:>7.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Quadify screen rendering on a virtual display.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="config.yaml to take display settings from")
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOADS, help="JSON list of recorded pushState payloads")
+    parser.add_argument("--backend", default="virtual", choices=["virtual", "dummy", "capture"],
+                        help="headless display backend to render against")
+    parser.add_argument("--frames", type=int, default=200, help="frames to time per component")
+    parser.add_argument("--hold", type=int, default=20, help="frames to keep each payload before the next")
+    parser.add_argument("--only", default="", help="comma-separated component names")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.disable(logging.INFO)
+
+    with open(args.config) as f:
+        config = yaml.safe_load(f) or {}
+    display_config = _localise_paths(config.get("display", {}))
+    display_config["backend"] = args.backend
+
+    with open(args.payloads) as f:
+        payloads = json.load(f)
+
+    display_manager = DisplayManager(display_config)
+    components = _components()
+    selected = [n.strip() for n in args.only.split(",") if n.strip()] or list(components)
+
+    results = []
+    for name in selected:
+        if name not in components:
+            parser.error(f"unknown component '{name}' (choose from {', '.join(components)})")
+        results.append(run_component(name, components[name], display_manager, payloads, args.frames, args.hold))
+
+    display_manager.render_scheduler.stop()
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,25 @@
 import logging
+import queue
+import threading
 import time
 import RPi.GPIO as GPIO
+from managers.timer_scheduler import scheduler
 from .gpio_setup_module import GPIOSetup  # Import the GPIO setup module
 
+# Quadrature state table, indexed by (previous_state << 2) | current_state where
+# a state is (CLK << 1) | DT. +1 is a clockwise quarter step, -1 counter-clockwise,
+# 0 no movement or an invalid (skipped) transition.
+QUADRATURE_TABLE = (
+     0, -1, +1,  0,
+    +1,  0,  0, -1,
+    -1,  0,  0, +1,
+     0, +1, -1,  0,
+)
+
+STEPS_PER_DETENT = 4
+BUTTON_DEBOUNCE = 0.02  # Seconds the switch must settle before a level change counts
+
+
 class RotaryControl:
     def __init__(
         self,
@@ -10,10 +27,16 @@ class RotaryControl:
         rotation_callback=None,
         button_callback=None,
         long_press_callback=None,
-        long_press_threshold=2.5  # Long press threshold in seconds
+        long_press_threshold=2.5,  # Long press threshold in seconds
+        mode="interrupt"           # "interrupt" (edge detection) or "poll"
     ):
         """
         Initializes the RotaryControl with GPIO setup already provided.
+
+        In "interrupt" mode the encoder and switch are read from GPIO edge
+        callbacks; in "poll" mode a thread samples them every 10 ms. Either
+        way the readings are turned into events on a queue, and start() runs
+        the callbacks from that queue on its own thread.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed logs
@@ -26,6 +49,7 @@ class RotaryControl:
         self.button_callback = button_callback
         self.long_press_callback = long_press_callback
         self.long_press_threshold = long_press_threshold
+        self.mode = mode
 
         # Use GPIO pins from the provided gpio_setup
         self.CLK_PIN = self.gpio_setup.CLK_PIN
@@ -33,9 +57,20 @@ class RotaryControl:
         self.SW_PIN = self.gpio_setup.SW_PIN
 
         # Variables for rotary state
+        self.encoder_lock = threading.Lock()
         self.last_encoded = self._read_encoder()  # To track the previous state of CLK and DT
         self.full_cycle = 0  # To track full quadrature cycles
+
+        # Button state; a press becomes a long press when long_press_timer fires first
+        self.button_lock = threading.Lock()
         self.button_last_state = self._read_button_state()  # Save the initial state of the button
+        self.button_last_change = 0.0
+        self.long_press_timer = None
+        self.long_press_fired = False
+        self.button_settle_timer = None  # re-reads the switch after an edge inside the debounce window
+
+        self.events = queue.Queue()
+        self._running = False
 
         self.logger.debug("RotaryControl initialized using GPIO setup.")
 
@@ -49,60 +84,121 @@ class RotaryControl:
         """Read the current state of the button."""
         return GPIO.input(self.SW_PIN)
 
+    # ------------------------------------------------------------------
+    #   Event Sources
+    # ------------------------------------------------------------------
+    def _on_encoder_edge(self, channel=None):
+        """Advances the quadrature decoder; queues a rotation per full detent."""
+        with self.encoder_lock:
+            current_encoded = self._read_encoder()
+            if current_encoded == self.last_encoded:
+                return
+            self.full_cycle += QUADRATURE_TABLE[(self.last_encoded << 2) | current_encoded]
+            self.last_encoded = current_encoded
+
+            # Register a single detent after a full cycle
+            if abs(self.full_cycle) >= STEPS_PER_DETENT:
+                direction = 1 if self.full_cycle > 0 else -1
+                self.full_cycle = 0
+                self.events.put(("rotate", direction))
+
+    def _on_button_edge(self, channel=None):
+        """Tracks press/release; a release before the long-press timer is a short press."""
+        with self.button_lock:
+            button_state = self._read_button_state()
+            now = time.monotonic()
+            if button_state == self.button_last_state:
+                return
+            settle = BUTTON_DEBOUNCE - (now - self.button_last_change)
+            if settle > 0:
+                # Too soon to trust, but don't drop it: a lost release would leave the
+                # long-press timer to fire on a button that is already up
+                if self.button_settle_timer:
+                    self.button_settle_timer.reschedule(settle)
+                else:
+                    self.button_settle_timer = scheduler.call_later(settle, self._on_button_settled)
+                return
+            self.button_last_state = button_state
+            self.button_last_change = now
+
+            if button_state == GPIO.LOW:
+                self.long_press_fired = False
+                self.long_press_timer = scheduler.call_later(self.long_press_threshold, self._on_long_press_timeout)
+            else:
+                if self.long_press_timer:
+                    self.long_press_timer.cancel()
+                    self.long_press_timer = None
+                if not self.long_press_fired:
+                    self.events.put(("press", None))
+
+    def _on_button_settled(self):
+        with self.button_lock:
+            self.button_settle_timer = None
+        self._on_button_edge()
+
+    def _on_long_press_timeout(self):
+        with self.button_lock:
+            if self.button_last_state != GPIO.LOW:
+                return
+            self.long_press_fired = True
+            self.long_press_timer = None
+        self.events.put(("long_press", None))
+
+    def _poll_loop(self):
+        """Fallback for when edge detection isn't available."""
+        while self._running:
+            self._on_encoder_edge()
+            self._on_button_edge()
+            # Add a small delay to avoid CPU overuse
+            time.sleep(0.01)
+
+    def _enable_interrupts(self):
+        try:
+            GPIO.add_event_detect(self.CLK_PIN, GPIO.BOTH, callback=self._on_encoder_edge)
+            GPIO.add_event_detect(self.DT_PIN, GPIO.BOTH, callback=self._on_encoder_edge)
+            GPIO.add_event_detect(self.SW_PIN, GPIO.BOTH, callback=self._on_button_edge)
+            return True
+        except RuntimeError as e:
+            self.logger.warning(f"RotaryControl: Edge detection unavailable ({e}); falling back to polling.")
+            for pin in (self.CLK_PIN, self.DT_PIN, self.SW_PIN):
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
+            return False
+
+    # ------------------------------------------------------------------
+    #   Event Dispatch
+    # ------------------------------------------------------------------
     def start(self):
         """Start listening to rotary events."""
-        self.logger.debug("RotaryControl started listening to rotary events.")
-        try:
-            # Read the initial encoder state
+        self.logger.debug(f"RotaryControl started listening to rotary events ({self.mode} mode).")
+        self._running = True
+        with self.encoder_lock:
             self.last_encoded = self._read_encoder()
+            self.full_cycle = 0
 
-            while True:
-                # Read the current encoder state
-                current_encoded = self._read_encoder()
-
-                # Detect changes in state
-                if current_encoded != self.last_encoded:
-                    # Determine direction based on state transitions
-                    if (self.last_encoded == 0b00 and current_encoded == 0b10) or \
-                       (self.last_encoded == 0b10 and current_encoded == 0b11) or \
-                       (self.last_encoded == 0b11 and current_encoded == 0b01) or \
-                       (self.last_encoded == 0b01 and current_encoded == 0b00):
-                        self.full_cycle += 1  # Clockwise step
-                    elif (self.last_encoded == 0b00 and current_encoded == 0b01) or \
-                         (self.last_encoded == 0b01 and current_encoded == 0b11) or \
-                         (self.last_encoded == 0b11 and current_encoded == 0b10) or \
-                         (self.last_encoded == 0b10 and current_encoded == 0b00):
-                        self.full_cycle -= 1  # Counter-clockwise step
-
-                    # Register a single detent after a full cycle
-                    if abs(self.full_cycle) == 4:  # Full quadrature cycle detected
-                        direction = 1 if self.full_cycle > 0 else -1
-                        self.logger.debug(f"Scrolling in direction: {direction}")
+        if self.mode != "interrupt" or not self._enable_interrupts():
+            threading.Thread(target=self._poll_loop, daemon=True).start()
+
+        try:
+            while self._running:
+                event, value = self.events.get()
+                if event is None:
+                    break
+                try:
+                    if event == "rotate":
+                        self.logger.debug(f"Scrolling in direction: {value}")
                         if self.rotation_callback:
-                            self.rotation_callback(direction)
-                        self.full_cycle = 0  # Reset cycle counter
-
-                    self.last_encoded = current_encoded  # Update last state
-
-                # Poll the button state
-                button_state = self._read_button_state()
-                if button_state == GPIO.LOW and self.button_last_state == GPIO.HIGH:
-                    press_start_time = time.time()
-                    while GPIO.input(self.SW_PIN) == GPIO.LOW:
-                        if time.time() - press_start_time > self.long_press_threshold:
-                            if self.long_press_callback:
-                                self.long_press_callback()
-                            break
-                    else:
-                        if time.time() - press_start_time < self.long_press_threshold:
-                            if self.button_callback:
-                                self.button_callback()
-
-                # Update the last state for the button
-                self.button_last_state = button_state
-
-                # Add a small delay to avoid CPU overuse
-                time.sleep(0.01)
+                            self.rotation_callback(value)
+                    elif event == "press":
+                        if self.button_callback:
+                            self.button_callback()
+                    elif event == "long_press":
+                        if self.long_press_callback:
+                            self.long_press_callback()
+                except Exception as e:
+                    self.logger.error(f"RotaryControl: {event} callback failed => {e}")
 
         except KeyboardInterrupt:
             self.logger.info("RotaryControl terminated by user.")
@@ -110,5 +206,14 @@ class RotaryControl:
 
     def stop(self):
         """Cleans up GPIO resources using the GPIOSetup instance."""
+        self._running = False
+        self.events.put((None, None))
+        with self.button_lock:
+            if self.long_press_timer:
+                self.long_press_timer.cancel()
+                self.long_press_timer = None
+            if self.button_settle_timer:
+                self.button_settle_timer.cancel()
+                self.button_settle_timer = None
         self.gpio_setup.cleanup()
         self.logger.info("GPIO cleanup complete.")
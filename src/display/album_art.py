@@ -0,0 +1,186 @@
+# src/display/album_art.py
+
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+
+import requests
+from PIL import Image
+
+
+class AlbumArtService:
+    """
+    Shared album art loader for the playback screens.
+
+    Decoded, pre-resized images are kept in an in-memory LRU keyed by
+    (source, size). Anything not in memory is loaded by a single background
+    worker - from the on-disk cache when possible, otherwise over HTTP (or via
+    a caller-supplied loader for local art) - so a slow art host never blocks
+    the render thread. get() returns None until the art is ready; screens draw
+    a placeholder meanwhile and are told through `on_ready` to redraw.
+    """
+
+    def __init__(self, config, max_entries=32, max_disk_entries=200, failure_ttl=30.0, max_failures=256):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.config = config
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.failure_ttl = failure_ttl
+        self.max_failures = max_failures
+        self.cache_dir = config.get('album_art_cache_dir', "/home/volumio/Quadify/cache/album_art")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"AlbumArtService: cannot create cache dir {self.cache_dir} => {e}")
+
+        self.lock = threading.Lock()
+        self.images = OrderedDict()  # (source, size) -> RGB image, least recently used first
+        self.failures = OrderedDict()  # source -> time of the last failed load, oldest first
+        self.pending = set()
+        self.placeholders = {}
+
+        self.session = requests.Session()
+        self.queue = queue.Queue()
+        self.worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker.start()
+
+    # ------------------------------------------------------------------
+    #   Public API
+    # ------------------------------------------------------------------
+    def get(self, source, size, loader=None, on_ready=None):
+        """
+        Returns the art for `source` resized to `size` if it is ready, else
+        queues a background load and returns None. `loader(source)` may be
+        given to load local art (returns a PIL image or None); by default the
+        source is fetched over HTTP. `on_ready()` is called once the art has
+        been loaded.
+        """
+        if not source:
+            return None
+        if isinstance(size, int):
+            size = (size, size)
+        key = (source, size)
+
+        with self.lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.images.move_to_end(key)
+                return image
+
+            failed_at = self.failures.get(source)
+            if failed_at is not None and time.monotonic() - failed_at < self.failure_ttl:
+                return None
+
+            if key not in self.pending:
+                self.pending.add(key)
+                self.queue.put((key, loader, on_ready))
+        return None
+
+    def get_placeholder(self, size):
+        """Default album art from the display config at `size`, or None if unavailable."""
+        if isinstance(size, int):
+            size = (size, size)
+        with self.lock:
+            if size in self.placeholders:
+                return self.placeholders[size]
+
+        placeholder = None
+        default_path = self.config.get("default_album_art")
+        if default_path and os.path.exists(default_path):
+            try:
+                placeholder = Image.open(default_path).convert("RGB").resize(size, Image.LANCZOS)
+            except Exception as e:
+                self.logger.error(f"AlbumArtService: failed to load default album art from {default_path}: {e}")
+
+        with self.lock:
+            self.placeholders[size] = placeholder
+        return placeholder
+
+    # ------------------------------------------------------------------
+    #   Background Worker
+    # ------------------------------------------------------------------
+    def _worker_loop(self):
+        while True:
+            key, loader, on_ready = self.queue.get()
+            source, size = key
+            try:
+                image = loader(source) if loader else self._load_remote(source)
+            except Exception as e:
+                self.logger.error(f"AlbumArtService: failed to load album art from {source}: {e}")
+                image = None
+
+            with self.lock:
+                self.pending.discard(key)
+                if image is None:
+                    self._record_failure(source)
+                    continue
+                self.failures.pop(source, None)
+                self.images[key] = image.convert("RGB").resize(size, Image.LANCZOS)
+                while len(self.images) > self.max_entries:
+                    self.images.popitem(last=False)
+
+            if on_ready:
+                try:
+                    on_ready()
+                except Exception as e:
+                    self.logger.error(f"AlbumArtService: on_ready callback failed => {e}")
+
+    def _record_failure(self, source):
+        """Remembers a failed load; expired and excess entries are dropped. Call with the lock held."""
+        now = time.monotonic()
+        self.failures[source] = now
+        self.failures.move_to_end(source)
+        # Oldest first, so expired entries are all at the front (a radio box sees endless new URLs)
+        while self.failures:
+            oldest, failed_at = next(iter(self.failures.items()))
+            if now - failed_at < self.failure_ttl and len(self.failures) <= self.max_failures:
+                break
+            del self.failures[oldest]
+
+    def _disk_path(self, source):
+        digest = hashlib.md5(source.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def _load_remote(self, url):
+        path = self._disk_path(url)
+        if os.path.exists(path):
+            try:
+                with Image.open(path) as cached:
+                    return cached.convert("RGB")
+            except Exception as e:
+                self.logger.warning(f"AlbumArtService: discarding unreadable cache file {path}: {e}")
+
+        response = self.session.get(url, timeout=3)
+        response.raise_for_status()
+        image = Image.open(BytesIO(response.content)).convert("RGB")
+
+        # Keep a reduced copy on disk; the screens never need more than a thumbnail
+        stored = image.copy()
+        stored.thumbnail((128, 128), Image.LANCZOS)
+        try:
+            stored.save(path, "PNG")
+            self._prune_disk_cache()
+        except OSError as e:
+            self.logger.warning(f"AlbumArtService: could not write {path}: {e}")
+        return image
+
+    def _prune_disk_cache(self):
+        try:
+            entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)]
+        except OSError:
+            return
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
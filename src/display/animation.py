@@ -0,0 +1,166 @@
+# src/display/animation.py
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from PIL import Image, ImageSequence
+
+DEFAULT_FRAME_DURATION = 0.1  # seconds, for frames without a GIF duration
+
+
+class Animation:
+    """The frames of an image, ready for oled.display(), and how long each is shown (seconds)."""
+
+    def __init__(self, frames, durations, loop=0):
+        self.frames = frames
+        self.durations = durations
+        self.loop = loop  # the GIF's own loop count, 0 = forever
+
+    @property
+    def is_animated(self):
+        return len(self.frames) > 1
+
+    @property
+    def total_duration(self):
+        return sum(self.durations)
+
+    @property
+    def nbytes(self):
+        return sum(len(frame.mode) * frame.width * frame.height for frame in self.frames)
+
+
+def decode_animation(path, size=None, mode="RGB"):
+    """
+    Decodes every frame of `path` once: composited by Pillow, alpha flattened
+    onto black, resized to `size` (None keeps the original) and converted to
+    `mode`. A still image gives a one-frame Animation.
+    """
+    frames, durations = [], []
+    with Image.open(path) as image:
+        loop = image.info.get("loop", 0)
+        for frame in ImageSequence.Iterator(image):
+            duration = frame.info.get("duration") or DEFAULT_FRAME_DURATION * 1000
+            frame = frame.convert("RGBA")
+            flat = Image.new("RGB", frame.size, (0, 0, 0))
+            flat.paste(frame, mask=frame.split()[3])
+            if size and flat.size != tuple(size):
+                flat = flat.resize(tuple(size), Image.LANCZOS)
+            frames.append(flat.convert(mode))
+            durations.append(duration / 1000.0)
+    return Animation(frames, durations, loop)
+
+
+class AnimationCache:
+    """
+    Decoded animations shared by everything that shows an image file: the
+    logo, the loading GIF, the GIF screensaver.
+
+    Keyed by file, modification time, size and mode, so an edited file is
+    decoded again. Least recently used animations are dropped once the
+    frames held exceed `max_bytes`.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> Animation
+        self.total_bytes = 0
+
+    def get(self, path, size=None, mode="RGB"):
+        """The decoded animation for `path`; raises IOError if it can't be read."""
+        key = (os.path.realpath(path), os.stat(path).st_mtime_ns, tuple(size) if size else None, mode)
+        with self.lock:
+            animation = self.entries.get(key)
+            if animation is not None:
+                self.entries.move_to_end(key)
+                return animation
+
+        started = time.monotonic()
+        animation = decode_animation(path, size, mode)
+        self.logger.info(f"AnimationCache: decoded {path} ({len(animation.frames)} frames) in "
+                         f"{(time.monotonic() - started) * 1000:.0f} ms")
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = animation
+                self.total_bytes += animation.nbytes
+                while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                    _, dropped = self.entries.popitem(last=False)
+                    self.total_bytes -= dropped.nbytes
+        return animation
+
+    def discard(self, path):
+        """Drops every cached variant of `path` (e.g. the loading GIF once startup is done)."""
+        path = os.path.realpath(path)
+        with self.lock:
+            for key in [k for k in self.entries if k[0] == path]:
+                self.total_bytes -= self.entries.pop(key).nbytes
+
+
+class AnimationPlayer:
+    """
+    Shows an Animation's frames on a monotonic schedule.
+
+    Frame n is due at start + the durations of the frames before it, so a
+    slow blit doesn't stretch the animation; if the player falls more than a
+    frame behind it skips ahead to the frame that is due instead of drawing
+    the backlog. play() blocks until `stop_event` is set or the loops are
+    done; start() runs it on a daemon thread.
+    """
+
+    def __init__(self, display_manager, animation, loops=None, stop_event=None):
+        """
+        :param loops:       Times to play the frames; None follows the GIF (0 there means forever)
+        :param stop_event:  threading.Event that ends playback; one is created if not given
+        """
+        self.display_manager = display_manager
+        self.animation = animation
+        self.loops = animation.loop if loops is None else loops
+        self.stop_event = stop_event or threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.play, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, wait=True):
+        self.stop_event.set()
+        if wait and self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1)
+
+    def play(self):
+        frames, durations = self.animation.frames, self.animation.durations
+        if not frames:
+            return
+        if len(frames) == 1:
+            self._show(frames[0])
+            return
+
+        loop = 0
+        due = time.monotonic()
+        while not self.stop_event.is_set():
+            index = 0
+            while index < len(frames):
+                now = time.monotonic()
+                # Behind by more than this frame: skip to the one that should be showing now
+                while index < len(frames) - 1 and now >= due + durations[index]:
+                    due += durations[index]
+                    index += 1
+                self._show(frames[index])
+                due += durations[index]
+                if self.stop_event.wait(max(0.0, due - time.monotonic())):
+                    return
+                index += 1
+            loop += 1
+            if self.loops and loop >= self.loops:
+                return
+
+    def _show(self, frame):
+        with self.display_manager.lock:
+            self.display_manager.oled.display(frame)
@@ -0,0 +1,202 @@
+# src/display/asset_pack.py
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+
+from PIL import Image, ImageFont
+
+PACK_MAGIC = b"QIPK"
+PACK_VERSION = 1                 # bump when the layout or the way bitmaps are prepared changes
+HEADER = struct.Struct("<4sHI")  # magic, version, index length
+SOURCE_MAX = 128                 # longest side kept for resizing to sizes that aren't in the pack
+
+
+def flatten(image):
+    """Flattens any alpha channel onto black and returns an RGB image."""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (0, 0, 0))
+        background.paste(image, mask=image.split()[3])
+        return background
+    return image.convert("RGB")
+
+
+def source_signature(icon_dir, names, sizes):
+    """Hash of everything a pack is built from: the PNGs' size and mtime, the sizes and the pack version."""
+    digest = hashlib.sha1(f"{PACK_VERSION}:{SOURCE_MAX}:{sorted(set(sizes))}".encode())
+    for name in sorted(names):
+        try:
+            st = os.stat(os.path.join(icon_dir, f"{name}.png"))
+            digest.update(f"{name}:{st.st_size}:{st.st_mtime_ns};".encode())
+        except OSError:
+            digest.update(f"{name}:missing;".encode())
+    return digest.hexdigest()
+
+
+def compile_icon_pack(icon_dir, names, sizes):
+    """
+    Builds a pack from `icon_dir`/<name>.png: every icon flattened onto black,
+    converted to greyscale and resized (LANCZOS) to each of `sizes`, plus a
+    copy no larger than SOURCE_MAX for other sizes. Returns the pack as bytes.
+
+    Layout: header, JSON index, then raw 8-bit rows. The index maps each name
+    to {"source": [w, h, offset], "variants": {"<size>": [w, h, offset]}},
+    offsets counted from the end of the index.
+    """
+    data = bytearray()
+    icons = {}
+
+    def append(image):
+        entry = [image.width, image.height, len(data)]
+        data.extend(image.tobytes())
+        return entry
+
+    for name in names:
+        path = os.path.join(icon_dir, f"{name}.png")
+        try:
+            with Image.open(path) as image:
+                flat = flatten(image)
+        except IOError:
+            continue  # missing icons fall back to the default at load time
+        source = flat.copy()
+        source.thumbnail((SOURCE_MAX, SOURCE_MAX), Image.LANCZOS)
+        icons[name] = {
+            "source": append(source.convert("L")),
+            "variants": {str(size): append(flat.resize((size, size), Image.LANCZOS).convert("L"))
+                         for size in sorted(set(sizes))},
+        }
+
+    index = json.dumps({
+        "signature": source_signature(icon_dir, names, sizes),
+        "icons": icons,
+    }).encode()
+    return HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)) + index + bytes(data)
+
+
+class IconPack:
+    """
+    Pre-flattened, pre-sized greyscale icons read straight out of a memory-mapped pack.
+
+    IconPack.load() reuses the pack at `pack_path` if it was built from the
+    current icon files, sizes and PACK_VERSION, and recompiles it otherwise,
+    so editing or adding a PNG is picked up on the next start. Bitmaps are
+    handed out as read-only "L" images backed by the mapping; nothing is
+    decoded or resampled on a warm start.
+    """
+
+    def __init__(self, buffer, index, index_length):
+        self.buffer = buffer
+        self.index = index
+        self.data_start = HEADER.size + index_length
+        self.icons = index.get("icons", {})
+
+    @classmethod
+    def load(cls, pack_path, icon_dir, names, sizes):
+        logger = logging.getLogger(cls.__name__)
+        logger.setLevel(logging.INFO)
+        signature = source_signature(icon_dir, names, sizes)
+
+        pack = cls._open(pack_path)
+        if pack is not None and pack.index.get("signature") == signature:
+            logger.info(f"IconPack: using {pack_path} ({len(pack.icons)} icons).")
+            return pack
+
+        logger.info(f"IconPack: compiling {pack_path} from {icon_dir}.")
+        blob = compile_icon_pack(icon_dir, names, sizes)
+        try:
+            os.makedirs(os.path.dirname(pack_path), exist_ok=True)
+            tmp_path = f"{pack_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, pack_path)
+            pack = cls._open(pack_path)
+        except OSError as e:
+            logger.warning(f"IconPack: could not write {pack_path}, keeping the pack in memory. Error: {e}")
+            pack = None
+        return pack or cls._from_buffer(blob)
+
+    @classmethod
+    def _open(cls, pack_path):
+        try:
+            with open(pack_path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None  # missing or empty
+        return cls._from_buffer(buffer)
+
+    @classmethod
+    def _from_buffer(cls, buffer):
+        try:
+            magic, version, index_length = HEADER.unpack_from(buffer, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                return None
+            index = json.loads(bytes(buffer[HEADER.size:HEADER.size + index_length]))
+        except (struct.error, ValueError):
+            return None
+        return cls(buffer, index, index_length)
+
+    def _image(self, entry):
+        width, height, offset = entry
+        start = self.data_start + offset
+        view = memoryview(self.buffer)[start:start + width * height]
+        return Image.frombuffer("L", (width, height), view, "raw", "L", 0, 1)
+
+    def source(self, name):
+        """The icon at up to SOURCE_MAX pixels, or None if it wasn't packed."""
+        icon = self.icons.get(name)
+        return self._image(icon["source"]) if icon else None
+
+    def variant(self, name, size):
+        """The icon pre-sized to `size` (int or square (w, h)), or None if that size isn't packed."""
+        if not isinstance(size, int):
+            if size[0] != size[1]:
+                return None
+            size = size[0]
+        icon = self.icons.get(name)
+        entry = icon["variants"].get(str(size)) if icon else None
+        return self._image(entry) if entry else None
+
+
+class FontRegistry:
+    """
+    Loads each (font file, size) once.
+
+    config.yaml names the same OpenSans file at the same size under many
+    keys; every key now shares one FreeType face instead of opening the
+    file again.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+        self.lock = threading.Lock()
+        self.faces = {}  # (realpath, size) -> FreeTypeFont
+        self.default_font = ImageFont.load_default()
+
+    def get(self, path, size):
+        """The font at `path` in `size`, or PIL's default font if it can't be loaded."""
+        if not path or not os.path.isfile(path):
+            self.logger.warning(f"FontRegistry: font file not found at '{path}', using the default font.")
+            return self.default_font
+        key = (os.path.realpath(path), size)
+        with self.lock:
+            font = self.faces.get(key)
+            if font is None:
+                try:
+                    font = ImageFont.truetype(path, size=size)
+                except IOError as e:
+                    self.logger.error(f"FontRegistry: error loading '{path}' at size {size}. Exception: {e}")
+                    return self.default_font
+                self.faces[key] = font
+            return font
+
+    def load(self, fonts_config):
+        """Resolves a `fonts:` section ({key: {path, size}}) to {key: font}."""
+        fonts = {key: self.get(info.get('path'), info.get('size', 12)) for key, info in fonts_config.items()}
+        self.logger.info(f"FontRegistry: {len(fonts)} font keys share {len(self.faces)} loaded faces.")
+        return fonts
@@ -0,0 +1,116 @@
+# src/display/backends.py
+
+import logging
+import os
+import time
+from collections import deque
+
+from luma.core.device import dummy
+from luma.core.interface.serial import noop
+
+logger = logging.getLogger("DisplayBackends")
+
+# Panel geometry of the SSD1322 every screen is laid out for
+WIDTH = 256
+HEIGHT = 64
+
+
+class CaptureDevice(dummy):
+    """
+    Headless device that records every frame it is given.
+
+    Modes (display.capture.mode in config.yaml):
+      - ring: keep the last `ring_size` frames in memory (see `frames`)
+      - png:  write each frame to <path>/frame_000001.png, ...
+      - gif:  collect frames and write <path>/capture.gif on cleanup, using
+              the real time between frames as the frame durations; only the
+              last `max_frames` frames are kept, so a long run stays bounded
+
+    Frames are stored as the screens drew them (before rotation), each as a
+    (timestamp, image) tuple.
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT, rotate=0, mode="RGB",
+                 capture_mode="ring", path="/tmp/quadify_capture", ring_size=120, max_frames=1000, **kwargs):
+        super().__init__(width=width, height=height, rotate=rotate, mode=mode, **kwargs)
+        self.capture_mode = capture_mode
+        self.path = path
+        self.frame_count = 0
+        self.frames = deque(maxlen=ring_size if capture_mode == "ring" else max_frames)
+
+        if capture_mode in ("png", "gif"):
+            os.makedirs(path, exist_ok=True)
+
+    def display(self, image):
+        super().display(image)
+        self.frame_count += 1
+        frame = image.copy()
+
+        if self.capture_mode == "png":
+            frame.save(os.path.join(self.path, f"frame_{self.frame_count:06d}.png"))
+        else:
+            self.frames.append((time.monotonic(), frame))
+
+    def save_gif(self, filename=None):
+        """Writes the recorded frames as an animated GIF; returns the file path."""
+        if not self.frames:
+            return None
+        filename = filename or os.path.join(self.path, "capture.gif")
+        timestamps = [ts for ts, _ in self.frames]
+        durations = [max(20, int((b - a) * 1000)) for a, b in zip(timestamps, timestamps[1:])] + [100]
+        images = [frame.convert("P") for _, frame in self.frames]
+        images[0].save(filename, save_all=True, append_images=images[1:],
+                       duration=durations, loop=0)
+        return filename
+
+    def cleanup(self):
+        if self.capture_mode == "gif":
+            try:
+                path = self.save_gif()
+                logger.info(f"CaptureDevice: wrote {path}")
+            except Exception as e:
+                logger.error(f"CaptureDevice: failed to write GIF => {e}")
+        super().cleanup()
+
+
+def create_device(config, framebuffer=None):
+    """
+    Creates the OLED device selected by display.backend in config.yaml:
+
+      - ssd1322: the real panel on SPI (default)
+      - virtual: the SSD1322 driver over luma's no-op serial interface, i.e.
+                 the full greyscale packing path without hardware
+      - dummy:   luma's dummy device, which just keeps the last frame
+      - capture: CaptureDevice, recording frames (see display.capture)
+    """
+    backend = config.get('backend', 'ssd1322')
+    rotate = config.get('rotation', 2)
+
+    if backend in ('ssd1322', 'virtual'):
+        from luma.oled.device import ssd1322
+        if backend == 'ssd1322':
+            from luma.core.interface.serial import spi
+            serial = spi(device=0, port=0)  # Default SPI device
+        else:
+            serial = noop()
+        kwargs = {'framebuffer': framebuffer} if framebuffer is not None else {}
+        device = ssd1322(serial, width=WIDTH, height=HEIGHT, rotate=rotate, **kwargs)
+
+    elif backend == 'dummy':
+        device = dummy(width=WIDTH, height=HEIGHT, rotate=rotate, mode="RGB")
+
+    elif backend == 'capture':
+        capture = config.get('capture', {})
+        device = CaptureDevice(
+            width=WIDTH, height=HEIGHT, rotate=rotate, mode="RGB",
+            capture_mode=capture.get('mode', 'ring'),
+            path=capture.get('path', '/tmp/quadify_capture'),
+            ring_size=capture.get('ring_size', 120),
+            max_frames=capture.get('max_frames', 1000),
+        )
+
+    else:
+        raise ValueError(f"Unknown display backend '{backend}'")
+
+    logger.info(f"Using display backend '{backend}'.")
+    return device
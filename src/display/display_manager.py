@@ -1,18 +1,169 @@
 import logging
-from PIL import Image, ImageDraw, ImageFont, ImageSequence
-from luma.core.interface.serial import spi
-from luma.oled.device import ssd1322
+from PIL import Image, ImageDraw, ImageFont
+from luma.core.framebuffer import full_frame
+from display.backends import create_device
+from display.framebuffer import GreyscaleDiffFramebuffer
+from display.album_art import AlbumArtService
+from display.text_strip import TextStripCache
+from display.asset_pack import IconPack, FontRegistry
+from display.animation import AnimationCache, AnimationPlayer
+from managers.timer_scheduler import scheduler
 import threading
-import os
 import time
 
-class DisplayManager:
-    def __init__(self, config):
-        # Initialize SPI connection for the SSD1322 OLED display
-        self.serial = spi(device=0, port=0)  # Default SPI device
-        self.oled = ssd1322(self.serial, width=256, height=64, rotate=2)
+ICON_SIZE = 35  # size of the icons in DisplayManager.icons
+
+class RenderScheduler:
+    """
+    Single render thread that owns the OLED for the playback screens.
+
+    Screens attach a render callback that returns a PIL image (or None when
+    there is nothing to show) and call request_frame() whenever their state
+    changes; an optional interval asks for periodic redraws (progress bar,
+    scrolling text). The interval may also be a callable (typically a
+    FrameGovernor's next_delay) that is asked after every frame how long to
+    sleep until the next one is due, or returns None for no periodic redraw.
+    Requests are coalesced per screen, paced to the frame budget and blitted
+    under DisplayManager.lock, so frames from two screens can never
+    interleave during a mode transition.
+    """
+
+    def __init__(self, display_manager, max_fps=30):
+        self.display_manager = display_manager
+        self.frame_budget = 1.0 / max(1, max_fps)
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
 
+        self.condition = threading.Condition()
+        self.sources = {}  # owner -> source dict (render, interval, dirty, next_due)
+        self.last_blit = 0.0
+        self.running = True
+
+        self.thread = threading.Thread(target=self._render_loop, daemon=True)
+        self.thread.start()
+
+    def attach(self, owner, render, interval=None):
+        """Make `owner` a frame source; its first frame is rendered straight away."""
+        with self.condition:
+            self.sources[owner] = {
+                'render': render,
+                'interval': interval,
+                'dirty': True,
+                'next_due': None,
+            }
+            self.condition.notify()
+        self.logger.debug(f"RenderScheduler: attached {owner.__class__.__name__} (interval={interval}).")
+
+    def detach(self, owner):
+        """Stop rendering for `owner`. No frame of it is blitted after this returns."""
+        with self.condition:
+            self.sources.pop(owner, None)
+            self.condition.notify()
+        self.logger.debug(f"RenderScheduler: detached {owner.__class__.__name__}.")
+
+    def request_frame(self, owner):
+        """Ask for a redraw of `owner`; several requests before the next frame collapse into one."""
+        with self.condition:
+            source = self.sources.get(owner)
+            if source is not None:
+                source['dirty'] = True
+                self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def _due_sources(self, now):
+        due = []
+        next_wake = None
+        for owner, source in self.sources.items():
+            if source['dirty'] or (source['next_due'] is not None and source['next_due'] <= now):
+                due.append((owner, source))
+            elif source['next_due'] is not None:
+                next_wake = source['next_due'] if next_wake is None else min(next_wake, source['next_due'])
+        return due, next_wake
+
+    def _render_loop(self):
+        while True:
+            with self.condition:
+                while True:
+                    if not self.running:
+                        return
+                    now = time.monotonic()
+                    due, next_wake = self._due_sources(now)
+                    if due:
+                        # Respect the frame budget; anything requested meanwhile is coalesced
+                        budget_left = self.last_blit + self.frame_budget - now
+                        if budget_left <= 0:
+                            break
+                        self.condition.wait(budget_left)
+                    else:
+                        self.condition.wait(None if next_wake is None else next_wake - now)
+
+                for owner, source in due:
+                    source['dirty'] = False
+                    interval = source['interval']
+                    source['next_due'] = now + interval if interval and not callable(interval) else None
+
+            frame = None
+            for owner, source in due:
+                try:
+                    image = source['render']()
+                except Exception as e:
+                    self.logger.error(f"RenderScheduler: render of {owner.__class__.__name__} failed => {e}")
+                    continue
+                if image is not None:
+                    frame = (owner, source, image)
+                if callable(source['interval']):
+                    self._schedule_next(owner, source)
+
+            if frame:
+                self._blit(*frame)
+            self.last_blit = time.monotonic()
+
+    def _schedule_next(self, owner, source):
+        try:
+            delay = source['interval']()
+        except Exception as e:
+            self.logger.error(f"RenderScheduler: frame interval of {owner.__class__.__name__} failed => {e}")
+            return
+        if delay is None:
+            return
+        with self.condition:
+            if self.sources.get(owner) is source:
+                source['next_due'] = time.monotonic() + max(0.0, delay)
+
+    def _blit(self, owner, source, image):
+        with self.display_manager.lock:
+            # The screen may have been detached (and the display cleared) while rendering
+            with self.condition:
+                if self.sources.get(owner) is not source:
+                    return
+            if image.mode != self.display_manager.oled.mode:
+                image = image.convert(self.display_manager.oled.mode)
+            self.display_manager.oled.display(image)
+
+
+class DisplayManager:
+    def __init__(self, config, load_assets=True):
+        """
+        :param config:       The `display` section of config.yaml
+        :param load_assets:  Load fonts and icons now; pass False to call load_assets() later
+                             (startup shows the logo first and loads them alongside other stages)
+        """
         self.config = config
+
+        # Only push the rows/columns that changed since the last frame (4-bit compare)
+        if self.config.get('frame_diff', True):
+            self.framebuffer = GreyscaleDiffFramebuffer()
+        else:
+            self.framebuffer = full_frame()
+
+        # SSD1322 on SPI by default; display.backend selects a headless device instead
+        self.oled = create_device(self.config, framebuffer=self.framebuffer)
+
         self.lock = threading.Lock()
 
         # Initialize logger
@@ -33,52 +184,79 @@ class DisplayManager:
 
         self.logger.info("DisplayManager initialized.")
 
-        # Load fonts and icons
+        # One render thread paces and blits the playback screens' frames
+        self.render_scheduler = RenderScheduler(self, max_fps=self.config.get('refresh_rate', 30))
+
+        # Fonts and icons, filled by load_assets()
+        self.font_registry = FontRegistry()
         self.fonts = {}
-        self._load_fonts()
         self.icons = {}
+        self.icon_pack = None
+        self.assets_ready = threading.Event()
+
+        # Pre-rendered text strips for scrolling titles
+        self.text_cache = TextStripCache()
+
+        # Pre-scaled icon variants, keyed by (name, size, mode)
+        self.icon_sources = {}
+        self.icon_cache = {}
+        self.icon_cache_lock = threading.Lock()
+
+        # Album art is decoded and fetched off the render thread, shared by all screens
+        self.album_art = AlbumArtService(self.config)
+
+        # Logo, loading GIF and GIF screensaver frames, decoded once in the OLED's mode
+        self.animations = AnimationCache(max_bytes=self.config.get('animation_cache_mb', 32) * 1024 * 1024)
+        self.animation_player = None
+
+        # Callback list for mode changes
+        self.on_mode_change_callbacks = []
+
+        # Optional draw function painted over every draw_custom() frame (e.g. the fast-scroll letter)
+        self.overlay = None
+
+        if load_assets:
+            self.load_assets()
+
+    def load_assets(self):
+        """Loads the configured fonts and the service icons (from the icon pack), then warms the icon cache."""
+        self._load_fonts()
 
         # Define the services and load their corresponding icons
         services = ["stream", "library", "playlists", "qobuz", "tidal", "airplay", "spop", "spotify", "webradio", "motherearthradio", "radio_paradise", "mpd", "default", "nas", "usb", "back", "config", "irremote", "volume", "displaysettings", "clocksettings", "screensaversettings", "systeminfo", "systemupdate"]
         icon_dir = self.config.get('icon_dir', "/home/volumio/Quadify/src/assets/images")
+        cache_sizes = self.config.get('icon_cache_sizes', [10, 20, 30, 64])
 
-        for service in services:
-            icon_path = os.path.join(icon_dir, f"{service}.png")
-            try:
-                # Load the specific icon for each service
-                icon = Image.open(icon_path)
-
-                # Handle transparency (if icon has an alpha channel)
-                if icon.mode == "RGBA":
-                    # Create a new black background image
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    # Paste the icon onto the background using the alpha channel as mask
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-                    self.logger.info(f"Handled transparency for icon '{service}'.")
-
-                # Resize the icon to fit and convert to RGB mode
-                icon = icon.resize((35, 35), Image.LANCZOS).convert("RGB")
-                self.icons[service] = icon
-                self.logger.info(f"Loaded icon for '{service}' from '{icon_path}'.")
-
-            except IOError:
-                self.logger.warning(f"Icon for '{service}' not found at '{icon_path}', using default icon.")
-                # Fallback to the default icon in case the specific icon is missing
-                self.icons[service] = self.default_icon  # Use the pre-loaded default_icon
+        # Flattened, pre-sized greyscale bitmaps, recompiled whenever an icon file changes
+        pack_path = self.config.get('icon_pack_path', "/home/volumio/Quadify/cache/icons.pack")
+        self.icon_pack = IconPack.load(pack_path, icon_dir, services, [ICON_SIZE] + list(cache_sizes))
 
-
-        # Load the default icon separately, if needed
-        default_icon_path = os.path.join(icon_dir, "default.png")
-        try:
-            self.default_icon = Image.open(default_icon_path).resize((35, 35), Image.ANTIALIAS).convert("RGB")
-            self.logger.info(f"Loaded default icon from '{default_icon_path}'.")
-        except IOError:
+        # Load the default icon first so missing icons can fall back to it
+        self.default_icon_source = self.icon_pack.source("default")
+        if self.default_icon_source is not None:
+            self.default_icon = self.icon_pack.variant("default", ICON_SIZE)
+        else:
             self.logger.warning("Default icon not found. Creating grey placeholder.")
-            self.default_icon = Image.new("RGB", (35, 35), "grey")
+            self.default_icon_source = Image.new("RGB", (ICON_SIZE, ICON_SIZE), "grey")
+            self.default_icon = self.default_icon_source
 
-        # Callback list for mode changes
-        self.on_mode_change_callbacks = []
+        for service in services:
+            icon = self.icon_pack.source(service)
+            if icon is not None:
+                self.icon_sources[service] = icon
+                self.icons[service] = self.icon_pack.variant(service, ICON_SIZE)
+            else:
+                self.logger.warning(f"Icon for '{service}' not found in '{icon_dir}', using default icon.")
+                # Fallback to the default icon in case the specific icon is missing
+                self.icon_sources[service] = self.default_icon_source
+                self.icons[service] = self.default_icon
+
+        # Warm the cache for the sizes the screens and menus paste every frame
+        for size in cache_sizes:
+            for service in self.icon_sources:
+                self.get_icon(service, size)
+        self.logger.info(f"Icon cache warmed with {len(self.icon_cache)} variants.")
+        self.assets_ready.set()
 
     def add_on_mode_change_callback(self, callback):
         """Register a callback to be executed on mode changes."""
@@ -98,62 +276,75 @@ class DisplayManager:
             except Exception as e:
                 self.logger.error(f"Error in callback {callback}: {e}")
 
-    def _load_fonts(self):
-        fonts_config = self.config.get('fonts', {})
-        default_font = ImageFont.load_default()
-        
-        for key, font_info in fonts_config.items():
-            path = font_info.get('path')
-            size = font_info.get('size', 12)
-            if path and os.path.isfile(path):
-                try:
-                    self.fonts[key] = ImageFont.truetype(path, size=size)
-                    self.logger.info(f"Loaded font '{key}' from '{path}' with size {size}.")
-                except IOError as e:
-                    self.logger.error(f"Error loading font '{key}' from '{path}'. Exception: {e}")
-                    self.fonts[key] = default_font
-            else:
-                self.logger.warning(f"Font file not found for '{key}' at '{path}'. Falling back to default font.")
-                self.fonts[key] = default_font
+    def get_icon(self, name, size, mode="RGB", use_default=False):
+        """
+        Returns a ready-to-paste icon scaled to `size` (int or (w, h)) in `mode`.
+        Variants are resampled once and then served from the cache. Returns None
+        for unknown names unless `use_default` is set.
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        source = self.icon_sources.get(name)
+        if source is None:
+            if not use_default:
+                return None
+            name, source = None, self.default_icon_source
+
+        key = (name, size, mode)
+        with self.icon_cache_lock:
+            icon = self.icon_cache.get(key)
+            if icon is None:
+                icon = self.icon_pack.variant(name or "default", size) if self.icon_pack else None
+                if icon is None:
+                    icon = source.resize(size, Image.LANCZOS)
+                if icon.mode != mode:
+                    icon = icon.convert(mode)
+                self.icon_cache[key] = icon
+        return icon
 
+    def _load_fonts(self):
+        # Keys that name the same file at the same size share one face
+        self.fonts = self.font_registry.load(self.config.get('fonts', {}))
         self.logger.info(f"Available fonts after loading: {list(self.fonts.keys())}")
 
     def clear_screen(self):
         """Clears the OLED screen by displaying a blank image."""
+        self.stop_animation()
         with self.lock:
             blank_image = Image.new("RGB", self.oled.size, "black").convert(self.oled.mode)
             self.oled.display(blank_image)
             self.logger.info("Screen cleared.")
 
+    def load_animation(self, image_path, resize=True):
+        """The image's frames, decoded once and cached, ready to display. Raises IOError."""
+        return self.animations.get(image_path, self.oled.size if resize else None, self.oled.mode)
+
+    def stop_animation(self):
+        """Stops the animation started by display_image(), if one is playing."""
+        player, self.animation_player = self.animation_player, None
+        if player:
+            player.stop()
+
     def display_image(self, image_path, resize=True, timeout=None):
-        """Displays an image or animates a GIF if it's an animated file."""
-        with self.lock:
-            try:
-                # Load the image
-                image = Image.open(image_path)
-
-                # Handle transparency (if needed)
-                if image.mode == "RGBA":
-                    background = Image.new("RGB", image.size, (0, 0, 0))
-                    background.paste(image, mask=image.split()[3])
-                    image = background
-
-                # Resize and convert as needed
-                if resize:
-                    image = image.resize(self.oled.size, Image.ANTIALIAS)
-
-                # Convert to match the OLED's mode
-                image = image.convert(self.oled.mode)
-                self.oled.display(image)
-                self.logger.info(f"Displayed image from '{image_path}'.")
-
-                # Set timeout for the image if provided
-                if timeout:
-                    timer = threading.Timer(timeout, self.clear_screen)
-                    timer.start()
-                    self.logger.info(f"Set timeout to clear screen after {timeout} seconds.")
-            except IOError:
-                self.logger.error(f"Failed to load image '{image_path}'.")
+        """Displays an image, or plays it in the background if it's an animated file."""
+        try:
+            animation = self.load_animation(image_path, resize)
+        except IOError:
+            self.logger.error(f"Failed to load image '{image_path}'.")
+            return
+
+        self.stop_animation()
+        player = AnimationPlayer(self, animation)
+        if animation.is_animated:
+            self.animation_player = player.start()
+        else:
+            player.play()
+        self.logger.info(f"Displayed image from '{image_path}'.")
+
+        # Set timeout for the image if provided
+        if timeout:
+            scheduler.call_later_blocking(timeout, self.clear_screen)
+            self.logger.info(f"Set timeout to clear screen after {timeout} seconds.")
 
     def display_text(self, text, position, font_key='default', fill="white"):
         """Displays text at a specified position using a specified font."""
@@ -174,18 +365,21 @@ class DisplayManager:
             image = Image.new("RGB", self.oled.size, "black")
             draw = ImageDraw.Draw(image)
             draw_function(draw)
+            overlay = self.overlay
+            if overlay is not None:
+                overlay(draw)
 
             # Convert to match the OLED mode before displaying
             image = image.convert(self.oled.mode)
             self.oled.display(image)
             self.logger.info("Executed custom draw function.")
 
-    def show_logo(self):
-        """Displays the startup logo on the OLED screen for a set duration."""
+    def show_logo(self, timeout=5):
+        """Displays the startup logo, cleared after `timeout` seconds (None leaves it up)."""
         logo_path = self.config.get('logo_path')
         if logo_path:
-            self.display_image(logo_path, timeout=5)
-            self.logger.info("Displaying startup logo for 5 seconds.")
+            self.display_image(logo_path, timeout=timeout)
+            self.logger.info(f"Displaying startup logo (timeout={timeout}).")
         else:
             self.logger.warning("No logo path configured.")
 
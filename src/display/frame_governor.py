@@ -0,0 +1,48 @@
+# src/display/frame_governor.py
+
+
+class FrameGovernor:
+    """
+    Collects what a screen needs from the next frame and works out when that
+    frame is actually due.
+
+    While drawing, a screen declares its needs for the current frame:
+      - need_fps(n)          something animates (scrolling text, spectrum)
+      - need_progress(...)   a progress bar / elapsed-time readout is shown
+    Anything not declared is static, so a paused or non-scrolling layout gets
+    no periodic redraw at all. Pass `next_delay` to the render scheduler as the
+    attach interval; it returns seconds until the next frame, or None.
+    """
+
+    def __init__(self):
+        self._delay = None
+
+    def begin_frame(self):
+        """Forget the needs of the previous frame."""
+        self._delay = None
+
+    def _due_in(self, seconds):
+        if self._delay is None or seconds < self._delay:
+            self._delay = seconds
+
+    def need_fps(self, fps):
+        """Something on screen animates and wants `fps` frames per second."""
+        if fps > 0:
+            self._due_in(1.0 / fps)
+
+    def need_progress(self, position_s, duration_s, width_px):
+        """
+        A progress indicator `width_px` wide plus an m:ss readout: redraw when
+        the indicator moves to its next pixel or the seconds readout ticks,
+        whichever comes first.
+        """
+        if duration_s <= 0 or width_px <= 0 or position_s >= duration_s:
+            return
+        until_next_second = 1.0 - (position_s % 1.0)
+        seconds_per_pixel = duration_s / width_px
+        until_next_pixel = seconds_per_pixel - (position_s % seconds_per_pixel)
+        self._due_in(min(until_next_second, until_next_pixel))
+
+    def next_delay(self):
+        """Seconds until the next frame is due, or None if the layout is static."""
+        return self._delay
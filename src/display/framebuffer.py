@@ -0,0 +1,83 @@
+# src/display/framebuffer.py
+
+import logging
+import threading
+from PIL import ImageChops, ImageMath
+
+# luma.oled packs RGB pixels into 4-bit greyscale as (306R + 601G + 117B) >> 14.
+# The comparison below does the same integer sum and floor division on 32-bit
+# bands, so it sees exactly the levels the panel will show; a rounded "L"
+# conversion puts some colours (e.g. (18, 18, 0)) one level off.
+_LEVEL_EXPRESSION = "(r * 306 + g * 601 + b * 117) / 16384"
+
+
+def _panel_levels(r, g, b):
+    if hasattr(ImageMath, "lambda_eval"):  # Pillow >= 10.3
+        return ImageMath.lambda_eval(lambda a: (a["r"] * 306 + a["g"] * 601 + a["b"] * 117) / 16384,
+                                     r=r, g=g, b=b)
+    return ImageMath.eval(_LEVEL_EXPRESSION, r=r, g=g, b=b)
+
+
+class GreyscaleDiffFramebuffer:
+    """
+    Framebuffer strategy for the SSD1322 that only pushes what changed.
+
+    The previous frame is kept as a 4-bit greyscale buffer (the panel's native
+    depth). Each new frame is quantised the same way and compared against it;
+    when nothing changed no SPI traffic is generated at all, otherwise a single
+    window covering the changed rows/columns is handed to the device, which
+    then only sets that column/row address range and streams those pixels.
+
+    Implements the luma.core framebuffer interface (``redraw``), so it can be
+    passed straight to the device via ``framebuffer=``.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+
+        self._lock = threading.Lock()
+        self.prev_frame = None
+
+        # Simple counters, handy when profiling the display path
+        self.frames_submitted = 0
+        self.frames_skipped = 0
+        self.pixels_sent = 0
+
+    def invalidate(self):
+        """Forget the previous frame so the next redraw pushes the full screen."""
+        with self._lock:
+            self.prev_frame = None
+
+    def _quantise(self, image):
+        if image.mode != "RGB":
+            image = image.convert("RGB")  # as luma does before packing
+        r, g, b = (band.convert("I") for band in image.split())
+        return _panel_levels(r, g, b).convert("L")
+
+    def redraw(self, image):
+        """
+        Yields at most one ``(image, bounding_box)`` tuple covering the region
+        that differs from the previous frame, or nothing when the frame is
+        unchanged. The first frame (or the one after ``invalidate``) is always
+        sent in full.
+        """
+        frame = self._quantise(image)
+
+        with self._lock:
+            self.frames_submitted += 1
+            if self.prev_frame is None or self.prev_frame.size != frame.size:
+                bounding_box = (0, 0) + image.size
+            else:
+                bounding_box = ImageChops.difference(self.prev_frame, frame).getbbox()
+            self.prev_frame = frame
+
+            if bounding_box is None:
+                self.frames_skipped += 1
+                return
+
+            left, top, right, bottom = bounding_box
+            self.pixels_sent += (right - left) * (bottom - top)
+
+        self.logger.debug(f"GreyscaleDiffFramebuffer: dirty window {bounding_box}")
+        yield image.crop(bounding_box), bounding_box
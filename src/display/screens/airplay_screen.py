@@ -7,6 +7,8 @@ import requests
 from io import BytesIO
 import itertools
 from urllib.parse import urlparse, parse_qs, quote
+from display.frame_governor import FrameGovernor
+from display.text_strip import TextScroller
 
 class AirPlayScreen:
     def __init__(self, display_manager, volumio_listener, mode_manager):
@@ -23,23 +25,22 @@ class AirPlayScreen:
         self.latest_state = None
         self.current_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
 
-        # Scrolling offsets for long text
-        self.scroll_offset_title = 0
-        self.scroll_offset_artist = 0
+        # Time-based scrolling for long text (pixels per second), drawn from cached strips
+        self.scroll_speed = 20
+        self.title_scroller = TextScroller(self.scroll_speed)
+        self.artist_scroller = TextScroller(self.scroll_speed)
+        self.text_cache = display_manager.text_cache
+
+        # Frame pacing: redraw only while long text scrolls
+        self.governor = FrameGovernor()
+        self.scroll_fps = 10
 
         # Load fonts from display manager or fall back to default
         self.font_title = display_manager.fonts.get('radio_title', ImageFont.load_default())
         self.font_small = display_manager.fonts.get('radio_small', ImageFont.load_default())
         self.font_label = display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
 
-        # Start the display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("AirPlayScreen: Started background update thread.")
-
         # Subscribe to Volumio state changes
         if self.volumio_listener:
             self.volumio_listener.state_changed.connect(self.on_volumio_state_change)
@@ -48,7 +49,7 @@ class AirPlayScreen:
         self.last_state = None
 
     # Respond only to active AirPlay state changes
-    def on_volumio_state_change(self, sender, state):
+    def on_volumio_state_change(self, sender, state, **kwargs):
         if not self.is_active:
             self.logger.debug("AirPlayScreen: ignoring state change; screen not active.")
             return
@@ -74,19 +75,18 @@ class AirPlayScreen:
             state["timestamp"] = current_time
             self.last_state = state.copy()
             self.latest_state = state.copy()
-        self.update_event.set()
+        self.display_manager.render_scheduler.request_frame(self)
     
-    # Wait for display updates and render the screen accordingly GS Note that timeout= controls speed of scrolling
-    def update_display_loop(self):
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.update_event.clear()
-            if self.is_active and self.mode_manager.get_mode() == "airplay" and self.current_state:
-                self.draw_display(self.current_state)
+    # Render the newest state for the render scheduler GS Note that scroll_fps controls speed of scrolling
+    def render_frame(self):
+        self.governor.begin_frame()
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+        if self.is_active and self.mode_manager.get_mode() == "airplay" and self.current_state:
+            return self.draw_display(self.current_state)
+        return None
     
     # Enter AirPlay screen mode and refresh state
     def start_mode(self):
@@ -96,14 +96,10 @@ class AirPlayScreen:
         try:
             if self.volumio_listener and self.volumio_listener.socketIO:
                 self.logger.debug("AirPlayScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
+                self.volumio_listener.request_state()
         except Exception as e:
             self.logger.warning(f"AirPlayScreen: Failed to emit 'getState'. Error => {e}")
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("AirPlayScreen: Display update thread restarted.")
+        self.display_manager.render_scheduler.attach(self, self.render_frame, interval=self.governor.next_delay)
     
     # Cleanly shut down the AirPlay screen
     def stop_mode(self):
@@ -112,29 +108,15 @@ class AirPlayScreen:
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("AirPlayScreen: Display update thread stopped.")
+        self.display_manager.render_scheduler.detach(self)
 
         self.display_manager.clear_screen()
         self.logger.info("AirPlayScreen: Stopped mode and cleared screen.")
     
     # GS Experimental Album Art loading script
     # Some symbols in artist and album titles may cause images not to load (, &)
-    def get_albumart(self, url):
-        if not url:
-            default_path = self.display_manager.config.get("default_album_art")
-            if default_path and os.path.exists(default_path):
-                try:
-                    return Image.open(default_path).convert("RGB")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default album art from {default_path}: {e}")
-                    return None
-            return None
-
+    # Runs on the album art service's worker thread, never on the render thread
+    def load_local_albumart(self, url):
         try:
             parsed = urlparse(url)
             query = parse_qs(parsed.query)
@@ -154,22 +136,27 @@ class AirPlayScreen:
                         if fname.lower().endswith((".jpg", ".png", ".webp")):
                             img_path = os.path.join(folder_path, fname)
                             self.logger.debug(f"Loading album art from {img_path}")
-                            return Image.open(img_path).convert("RGB")
+                            with Image.open(img_path) as img:
+                                return img.convert("RGB")
                 self.logger.warning(f"No image file found in {folder_path}") # GS Only uncomment this if debugging
         except Exception as e:
             self.logger.error(f"Error parsing or loading local album art: {e}")
 
         return None
+
+    # Redraw once the album art service has the art ready
+    def on_albumart_ready(self):
+        self.display_manager.render_scheduler.request_frame(self)
         
     # GS Experimental Scroll text horizontally if wider than the screen
-    def scroll_text_simple(self, draw, text, font, y, scroll_offset, screen_width, fill="white"):
-        text_width, _ = draw.textsize(text, font=font)
+    def scroll_text_simple(self, image, text, font, y, scroller, screen_width, fill="white"):
+        text_width = self.text_cache.text_width(text, font)
         if text_width <= screen_width:
-            draw.text((0, y), text, font=font, fill=fill)
-            return 0, False
-        x = screen_width - (scroll_offset % (text_width + screen_width))
-        draw.text((x, y), text, font=font, fill=fill)
-        return scroll_offset + 2, True
+            self.text_cache.draw(image, (0, y), text, font, fill)
+            return False
+        x = screen_width - scroller.offset(text, text_width + screen_width)
+        self.text_cache.draw(image, (x, y), text, font, fill)
+        return True
     
     # Main rendering logic for the AirPlay screen
     def draw_display(self, data):
@@ -193,13 +180,17 @@ class AirPlayScreen:
 
         # Scroll long title/artist text
         scrollable_width = screen_width - 75
-        self.scroll_offset_title, _ = self.scroll_text_simple(
-            draw, title, self.font_title, title_y, self.scroll_offset_title, scrollable_width
+        title_scrolling = self.scroll_text_simple(
+            base_image, title, self.font_title, title_y, self.title_scroller, scrollable_width
         )
-        self.scroll_offset_artist, _ = self.scroll_text_simple(
-            draw, artist, self.font_small, artist_y, self.scroll_offset_artist, scrollable_width
+        artist_scrolling = self.scroll_text_simple(
+            base_image, artist, self.font_small, artist_y, self.artist_scroller, scrollable_width
         )
 
+        # Keep scrolling only while playing; a paused or short layout is static
+        if (title_scrolling or artist_scrolling) and data.get("status", "play") == "play":
+            self.governor.need_fps(self.scroll_fps)
+
         # Draw horizontal line and metadata text
         icon_width = 64
         gap = 11
@@ -211,18 +202,18 @@ class AirPlayScreen:
         # Attempt to fetch and draw album art
         albumart_url = data.get("albumart")
         albumart_image = None
-        if albumart_url and self.mode_manager.get_mode() == "airplay":
-            albumart_image = self.get_albumart(albumart_url)
         icon_size = (64, 64)
+        if albumart_url and self.mode_manager.get_mode() == "airplay":
+            albumart_image = self.display_manager.album_art.get(
+                albumart_url, icon_size, loader=self.load_local_albumart, on_ready=self.on_albumart_ready
+            )
         if albumart_image:
-            albumart_image = albumart_image.resize(icon_size, Image.LANCZOS)
             art_x = screen_width - icon_size[0] - margin
             art_y = margin
             base_image.paste(albumart_image, (art_x, art_y))
         else:
-            airplay_icon = self.display_manager.icons.get("airplay")
+            airplay_icon = self.display_manager.get_icon("airplay", icon_size)
             if airplay_icon:
-                airplay_icon = airplay_icon.resize(icon_size, Image.LANCZOS)
                 art_x = screen_width - icon_size[0] - margin
                 art_y = margin
                 base_image.paste(airplay_icon, (art_x, art_y))
@@ -237,9 +228,9 @@ class AirPlayScreen:
             fill="black"
         )
 
-        # Push final image to display
-        self.display_manager.oled.display(base_image)
-        self.logger.debug("AirPlayScreen: Display updated.")
+        # Hand final image to the render scheduler
+        self.logger.debug("AirPlayScreen: Display rendered.")
+        return base_image
     
     # Adjust system volume based on input delta
     def adjust_volume(self, volume_change):
@@ -287,6 +278,8 @@ class AirPlayScreen:
 
         state = self.volumio_listener.get_current_state()
         if state:
-            self.draw_display(state)
+            with self.state_lock:
+                self.latest_state = state
+            self.display_manager.render_scheduler.request_frame(self)
         else:
             self.logger.warning("AirPlayScreen: No current Volumio state available to display.")
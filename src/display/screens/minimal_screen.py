@@ -1,9 +1,11 @@
 import logging
+import math
 import os
 import threading
 import time
 from PIL import Image, ImageDraw, ImageFont
 from managers.menus.base_manager import BaseManager
+from display.frame_governor import FrameGovernor
 
 class MinimalScreen(BaseManager):
     """
@@ -31,21 +33,17 @@ class MinimalScreen(BaseManager):
         self.font_service = display_manager.fonts.get('minimal_service', ImageFont.load_default())
         self.font_data    = display_manager.fonts.get('minimal_data', ImageFont.load_default())
 
-        # State & threading
+        # State
         self.latest_state  = None
         self.current_state = None
         self.state_lock    = threading.Lock()
-        self.update_event  = threading.Event()
-        self.stop_event    = threading.Event()
         self.is_active     = False
 
         # Initialize a variable to track the last update time for progress simulation
         self.last_update_time = time.time()
 
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("MinimalScreen: Started background update thread.")
+        # Frame pacing: only redraw when the progress circle or time readout changes
+        self.governor = FrameGovernor()
 
         # Connect Volumio state listener
         if self.volumio_listener:
@@ -55,7 +53,7 @@ class MinimalScreen(BaseManager):
     # ------------------------------------------------------------------
     #   Volumio State Change
     # ------------------------------------------------------------------
-    def on_volumio_state_change(self, sender, state):
+    def on_volumio_state_change(self, sender, state, **kwargs):
         if not self.is_active or self.mode_manager.get_mode() != 'minimal':
             self.logger.debug("MinimalScreen: ignoring state change; not active or mode != 'minimal'.")
             return
@@ -65,31 +63,31 @@ class MinimalScreen(BaseManager):
             if "volume" in state:
                 self.current_volume = state["volume"]
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.render_scheduler.request_frame(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Loop
+    #   Frame Rendering (called by DisplayManager's render scheduler)
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_frame(self):
         """
-        Runs in the background, waits on update_event or times out,
-        and simulates progress update so the duration circle refreshes.
+        Takes the newest state, or simulates progress since the last one while
+        playing so the duration circle refreshes, and returns the frame to show.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.last_update_time = time.time()
-                    self.update_event.clear()
-                elif self.current_state and "seek" in self.current_state and "duration" in self.current_state:
-                    # Simulate progress based on elapsed time
-                    elapsed = time.time() - self.last_update_time
-                    self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
-                    self.last_update_time = time.time()
-            if self.is_active and self.mode_manager.get_mode() == 'minimal' and self.current_state:
-                self.draw_display(self.current_state)
+        self.governor.begin_frame()
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+                self.last_update_time = time.time()
+            elif (self.current_state and self.current_state.get("status") == "play"
+                  and "seek" in self.current_state and "duration" in self.current_state):
+                # Simulate progress based on elapsed time
+                elapsed = time.time() - self.last_update_time
+                self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
+                self.last_update_time = time.time()
+        if self.is_active and self.mode_manager.get_mode() == 'minimal' and self.current_state:
+            return self.draw_display(self.current_state)
+        return None
 
     # ------------------------------------------------------------------
     #   Start / Stop
@@ -108,16 +106,12 @@ class MinimalScreen(BaseManager):
         try:
             if self.volumio_listener and self.volumio_listener.socketIO:
                 self.logger.debug("MinimalScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
+                self.volumio_listener.request_state()
         except Exception as e:
             self.logger.warning(f"MinimalScreen: Failed to emit 'getState'. Error => {e}")
 
-        # If update_thread is dead, restart it
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("MinimalScreen: display update thread restarted.")
+        # Let the render scheduler redraw whenever the governor says the progress circle moves
+        self.display_manager.render_scheduler.attach(self, self.render_frame, interval=self.governor.next_delay)
 
     def stop_mode(self):
         """
@@ -128,12 +122,7 @@ class MinimalScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("MinimalScreen: display update thread stopped.")
+        self.display_manager.render_scheduler.detach(self)
 
         self.display_manager.clear_screen()
         self.logger.info("MinimalScreen: Stopped mode and cleared screen.")
@@ -272,11 +261,16 @@ class MinimalScreen(BaseManager):
         text_y = circle_y + (circle_radius * 2 - text_h) // 2
         draw.text((text_x, text_y), current_time, font=duration_font, fill="white")
 
+        # Next frame is due when the arc grows by a pixel or the time readout ticks
+        if state.get("status") == "play":
+            arc_length = int(2 * math.pi * circle_radius)
+            self.governor.need_progress(seek_s, duration_s, arc_length)
+
         # ------------------------------------------------------------------
-        # 6) Display the final image
+        # 6) Hand the final image back to the render scheduler
         # ------------------------------------------------------------------
-        self.display_manager.oled.display(base_image)
-        self.logger.debug("MinimalScreen: Display updated with minimal UI including updated progress indicator.")
+        self.logger.debug("MinimalScreen: Rendered minimal UI including updated progress indicator.")
+        return base_image
 
     def display_playback_info(self):
         """
@@ -288,7 +282,9 @@ class MinimalScreen(BaseManager):
 
         state = self.volumio_listener.get_current_state()
         if state:
-            self.draw_display(state)
+            with self.state_lock:
+                self.latest_state = state
+            self.display_manager.render_scheduler.request_frame(self)
         else:
             self.logger.warning("MinimalScreen: No current volumio state available to display.")
 
@@ -7,6 +7,8 @@ import threading
 import time
 from PIL import Image, ImageDraw, ImageFont, ImageSequence
 from managers.menus.base_manager import BaseManager
+from display.frame_governor import FrameGovernor
+from display.text_strip import TextScroller
 
 FIFO_PATH = "/tmp/display.fifo"  # Path to the FIFO for CAVA data
 
@@ -40,26 +42,26 @@ class ModernScreen(BaseManager):
         self.font_progress = display_manager.fonts.get('progress_bar',ImageFont.load_default())
 
         # Scrolling
-        self.scroll_offset_title  = 0
-        self.scroll_offset_artist = 0
-        self.scroll_speed         = 2  # Adjust for faster or slower horizontal scrolling
+        self.scroll_speed    = 20  # Pixels per second; adjust for faster or slower horizontal scrolling
+        self.title_scroller  = TextScroller(self.scroll_speed)
+        self.artist_scroller = TextScroller(self.scroll_speed)
+        self.text_cache      = display_manager.text_cache
 
-        # State & threads
+        # Frame pacing: only redraw as often as what is on screen needs
+        self.governor     = FrameGovernor()
+        self.scroll_fps   = 10  # Frames per second while artist/title scroll
+        self.spectrum_fps = 20  # Frames per second while CAVA bars are shown
+
+        # State
         self.latest_state    = None
         self.current_state   = None
         self.state_lock      = threading.Lock()
-        self.update_event    = threading.Event()
-        self.stop_event      = threading.Event()
         self.is_active       = False
+        self.last_update_time = time.time()
 
         # Keep track of the last-known service so if we pause/stop, we can still show the same icon
         self.previous_service = None
 
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("ModernScreen: Started background update thread.")
-
         # Connect to Volumio listener
         if self.volumio_listener:
             self.volumio_listener.state_changed.connect(self.on_volumio_state_change)
@@ -69,7 +71,7 @@ class ModernScreen(BaseManager):
     # ------------------------------------------------------------------
     #   Volumio State Change
     # ------------------------------------------------------------------
-    def on_volumio_state_change(self, sender, state):
+    def on_volumio_state_change(self, sender, state, **kwargs):
         """
         Called whenever VolumioListener emits a state_changed signal.
         Only update if:
@@ -83,36 +85,37 @@ class ModernScreen(BaseManager):
         self.logger.debug(f"ModernScreen: state changed => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.render_scheduler.request_frame(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Loop
+    #   Frame Rendering (called by DisplayManager's render scheduler)
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_frame(self):
         """
-        Runs in the background to handle display updates. Waits on update_event
-        or times out, so we can animate the progress bar or scrolling text.
+        Picks up the newest Volumio state (or simulates progress since the last
+        one while playing, so the progress bar animates) and returns the frame
+        to show, or None if there is nothing to draw. draw_display declares to
+        the governor when the next frame is due.
         """
-        last_update_time = time.time()
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    # We got a new state from Volumio
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state  = None
-                    self.update_event.clear()
-                    last_update_time = time.time()
-                elif self.current_state and "seek" in self.current_state and "duration" in self.current_state:
-                    # If we have a playing track, let's simulate progress
-                    elapsed = time.time() - last_update_time
-                    self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
-                    last_update_time = time.time()
-
-            # If active & mode == 'modern' and we have a current state, let's draw
-            if self.is_active and self.mode_manager.get_mode() == 'modern' and self.current_state:
-                self.logger.debug("ModernScreen: drawing updated display.")
-                self.draw_display(self.current_state)
+        self.governor.begin_frame()
+        with self.state_lock:
+            if self.latest_state:
+                # We got a new state from Volumio
+                self.current_state = self.latest_state.copy()
+                self.latest_state  = None
+                self.last_update_time = time.time()
+            elif (self.current_state and self.current_state.get("status") == "play"
+                  and "seek" in self.current_state and "duration" in self.current_state):
+                # If we have a playing track, let's simulate progress
+                elapsed = time.time() - self.last_update_time
+                self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
+                self.last_update_time = time.time()
+
+        # If active & mode == 'modern' and we have a current state, let's draw
+        if self.is_active and self.mode_manager.get_mode() == 'modern' and self.current_state:
+            self.logger.debug("ModernScreen: drawing updated display.")
+            return self.draw_display(self.current_state)
+        return None
 
     # ------------------------------------------------------------------
     #   Start/Stop
@@ -132,7 +135,7 @@ class ModernScreen(BaseManager):
         try:
             if self.volumio_listener and self.volumio_listener.socketIO:
                 self.logger.debug("ModernScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
+                self.volumio_listener.request_state()
         except Exception as e:
             self.logger.warning(f"ModernScreen: Failed to emit 'getState'. Error => {e}")
 
@@ -143,12 +146,8 @@ class ModernScreen(BaseManager):
             self.spectrum_thread.start()
             self.logger.info("ModernScreen: Spectrum reading thread started.")
 
-        # 3) If the update_thread is not alive, restart it
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("ModernScreen: display update thread restarted.")
+        # 3) Hand frame pacing to the render scheduler; the governor decides when to redraw
+        self.display_manager.render_scheduler.attach(self, self.render_frame, interval=self.governor.next_delay)
 
 
     def stop_mode(self):
@@ -160,8 +159,7 @@ class ModernScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
+        self.display_manager.render_scheduler.detach(self)
 
         # Stop spectrum thread
         self.running_spectrum = False
@@ -169,11 +167,6 @@ class ModernScreen(BaseManager):
             self.spectrum_thread.join(timeout=1)
             self.logger.info("ModernScreen: Spectrum thread stopped.")
 
-        # Stop update thread
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("ModernScreen: display update thread stopped.")
-
         self.display_manager.clear_screen()
         self.logger.info("ModernScreen: Stopped mode and cleared screen.")
 
@@ -206,24 +199,21 @@ class ModernScreen(BaseManager):
     def reset_scrolling(self):
         """ Reset scrolling offsets for artist/title text. """
         self.logger.debug("ModernScreen: resetting scroll offsets.")
-        self.scroll_offset_title  = 0
-        self.scroll_offset_artist = 0
+        self.title_scroller.reset()
+        self.artist_scroller.reset()
 
-    def update_scroll(self, text, font, max_width, scroll_offset):
+    def update_scroll(self, text, font, max_width, scroller):
         """
         Basic continuous scrolling logic:
           - If text fits in max_width => no scroll
-          - Else increment scroll_offset => wrap around
+          - Else the offset follows elapsed time => wraps around after the full width
+        Returns (scroll_offset, text_width, scrolling).
         """
-        text_width, _ = font.getsize(text)
+        text_width = self.text_cache.text_width(text, font)
         if text_width <= max_width:
-            return text, 0, False
-
-        scroll_offset += self.scroll_speed
-        if scroll_offset > text_width:
-            scroll_offset = 0
+            return 0, text_width, False
 
-        return text, scroll_offset, True
+        return scroller.offset(text, text_width + 1), text_width, True
 
     def adjust_volume(self, volume_change):
         """
@@ -329,31 +319,29 @@ class ModernScreen(BaseManager):
         # We'll shift the TITLE and INFO text if the spectrum is OFF
         line_shift = 4 if not spectrum_enabled else 0
 
-        # Artist (no shift)
-        artist_disp, self.scroll_offset_artist, artist_scrolling = self.update_scroll(
-            artist_name, self.font_artist, max_text_width, self.scroll_offset_artist
+        # Artist (no shift); text comes from cached strips, scrolling is just an offset paste
+        artist_offset, artist_w, artist_scrolling = self.update_scroll(
+            artist_name, self.font_artist, max_text_width, self.artist_scroller
         )
         if artist_scrolling:
-            artist_x = (screen_width // 2) - self.scroll_offset_artist
+            artist_x = (screen_width // 2) - artist_offset
         else:
-            text_w, _ = self.font_artist.getsize(artist_disp)
-            artist_x = (screen_width - text_w) // 2
+            artist_x = (screen_width - artist_w) // 2
 
         artist_y = margin - 8
-        draw.text((artist_x, artist_y), artist_disp, font=self.font_artist, fill="white")
+        self.text_cache.draw(base_image, (artist_x, artist_y), artist_name, self.font_artist)
 
         # Title (shift if no spectrum)
-        title_disp, self.scroll_offset_title, title_scrolling = self.update_scroll(
-            song_title, self.font_title, max_text_width, self.scroll_offset_title
+        title_offset, title_w, title_scrolling = self.update_scroll(
+            song_title, self.font_title, max_text_width, self.title_scroller
         )
         if title_scrolling:
-            title_x = (screen_width // 2) - self.scroll_offset_title
+            title_x = (screen_width // 2) - title_offset
         else:
-            text_w, _ = self.font_title.getsize(title_disp)
-            title_x = (screen_width - text_w) // 2
+            title_x = (screen_width - title_w) // 2
 
         title_y = (margin + 6) + line_shift
-        draw.text((title_x, title_y), title_disp, font=self.font_title, fill="white")
+        self.text_cache.draw(base_image, (title_x, title_y), song_title, self.font_title)
 
         #
         # 5) Info text: e.g. "48kHz / 16bit" (also shifted if no spectrum)
@@ -392,9 +380,7 @@ class ModernScreen(BaseManager):
         #
         # 7) Volume icon & text
         #
-        volume_icon = self.display_manager.icons.get('volume', self.display_manager.default_icon)
-        if volume_icon:
-            volume_icon = volume_icon.resize((10, 10), Image.LANCZOS)
+        volume_icon = self.display_manager.get_icon('volume', 10, use_default=True)
         vol_icon_x = progress_x - 30
         vol_icon_y = progress_y - 22
         base_image.paste(volume_icon, (vol_icon_x, vol_icon_y))
@@ -406,17 +392,8 @@ class ModernScreen(BaseManager):
         #
         # 8) Place a smaller service icon near total_duration
         #
-        icon = self.display_manager.icons.get(service)
+        icon = self.display_manager.get_icon(service, 20)
         if icon:
-            # Flatten alpha if needed
-            if icon.mode == "RGBA":
-                bg = Image.new("RGB", icon.size, (0, 0, 0))
-                bg.paste(icon, mask=icon.split()[3])
-                icon = bg
-
-            # Resize the icon
-            icon = icon.resize((20, 20), Image.LANCZOS)
-
             # Measure total_duration text so we can figure out where to place the icon
             dur_text_w, dur_text_h = draw.textsize(total_duration, font=self.font_info)
 
@@ -435,10 +412,20 @@ class ModernScreen(BaseManager):
             self.logger.debug(f"ModernScreen: No icon found for service='{service}' => skipping icon.")
 
         #
-        # Finally, display
+        # 9) Declare what the next frame needs: nothing animates while paused
+        #
+        if status == "play":
+            if artist_scrolling or title_scrolling:
+                self.governor.need_fps(self.scroll_fps)
+            if spectrum_enabled:
+                self.governor.need_fps(self.spectrum_fps)
+            self.governor.need_progress(seek_s, duration_s, progress_width)
+
+        #
+        # Finally, hand the frame back to the render scheduler
         #
-        self.display_manager.oled.display(base_image)
-        self.logger.debug("ModernScreen: Display updated with 'modern' playback UI.")
+        self.logger.debug("ModernScreen: Rendered 'modern' playback UI.")
+        return base_image
 
 
     def _draw_spectrum(self, draw):
@@ -488,7 +475,9 @@ class ModernScreen(BaseManager):
         """
         state = self.volumio_listener.get_current_state()
         if state:
-            self.draw_display(state)
+            with self.state_lock:
+                self.latest_state = state
+            self.display_manager.render_scheduler.request_frame(self)
         else:
             self.logger.warning("ModernScreen: No current volumio state available to display.")
 
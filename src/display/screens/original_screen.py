@@ -28,15 +28,8 @@ class OriginalScreen(BaseManager):
         # Thread-safe state handling
         self.latest_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
         self.is_active = False
 
-        # Background update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("OriginalScreen: Started background update thread.")
-
         # Register a callback for Volumio state changes
         if self.volumio_listener:
             self.volumio_listener.state_changed.connect(self.on_volumio_state_change)
@@ -45,7 +38,7 @@ class OriginalScreen(BaseManager):
     # ------------------------------------------------------------------
     #   Volumio State Change Handler
     # ------------------------------------------------------------------
-    def on_volumio_state_change(self, sender, state):
+    def on_volumio_state_change(self, sender, state, **kwargs):
         """
         Callback for volumio_listener.state_changed.
         Only process if:
@@ -73,36 +66,31 @@ class OriginalScreen(BaseManager):
         self.logger.debug(f"OriginalScreen: Received volumio state => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.render_scheduler.request_frame(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Thread
+    #   Frame Rendering (called by DisplayManager's render scheduler)
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_frame(self):
         """
-        Repeatedly waits for the update_event or times out. If signaled,
-        draws the updated display if active & mode == 'original'.
+        Draws the pending state if active & mode == 'original'. This layout
+        has nothing animated, so it is only rendered when a new state arrives.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            if triggered:
-                with self.state_lock:
-                    state_to_process = self.latest_state
-                    self.latest_state = None
-                self.update_event.clear()
-
-                if self.is_active and self.mode_manager.get_mode() == 'original':
-                    if state_to_process:
-                        if self.mode_manager.is_state_change_suppressed():
-                            self.logger.debug(
-                                "OriginalScreen: State change suppressed during update loop."
-                            )
-                            continue
-                        self.draw_display(state_to_process)
-                else:
-                    self.logger.debug(
-                        "OriginalScreen: No update => either not active or mode != 'original'."
-                    )
+        with self.state_lock:
+            state_to_process = self.latest_state
+            self.latest_state = None
+
+        if not self.is_active or self.mode_manager.get_mode() != 'original':
+            self.logger.debug(
+                "OriginalScreen: No update => either not active or mode != 'original'."
+            )
+            return None
+        if not state_to_process:
+            return None
+        if self.mode_manager.is_state_change_suppressed():
+            self.logger.debug("OriginalScreen: State change suppressed during render.")
+            return None
+        return self.draw_display(state_to_process)
 
     # ------------------------------------------------------------------
     #   Start/Stop Mode
@@ -125,17 +113,21 @@ class OriginalScreen(BaseManager):
         try:
             if self.volumio_listener and self.volumio_listener.socketIO:
                 self.logger.debug("OriginalScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
+                self.volumio_listener.request_state()
         except Exception as e:
             self.logger.warning(f"OriginalScreen: Failed to emit 'getState'. => {e}")
 
         # 2) Display current Volumio state if available
         current_state = self.volumio_listener.get_current_state()
         if current_state:
-            self.draw_display(current_state)
+            with self.state_lock:
+                self.latest_state = current_state
         else:
             self.logger.warning("OriginalScreen: No current Volumio state to display.")
 
+        # 3) Redraws are driven by state changes only (no periodic refresh)
+        self.display_manager.render_scheduler.attach(self, self.render_frame)
+
 
     def stop_mode(self):
         """
@@ -147,16 +139,7 @@ class OriginalScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()  # Unblock the thread if it's waiting
-
-        try:
-            if self.update_thread.is_alive():
-                self.update_thread.join(timeout=1)
-                if self.update_thread.is_alive():
-                    self.logger.warning("OriginalScreen: Timed out stopping update thread.")
-        except Exception as e:
-            self.logger.error(f"OriginalScreen: Error stopping update thread => {e}")
+        self.display_manager.render_scheduler.detach(self)
 
         self.display_manager.clear_screen()
         self.logger.info("OriginalScreen: Stopped and cleared display.")
@@ -212,9 +195,9 @@ class OriginalScreen(BaseManager):
         # Additional info (sample rate, bit depth, service icon)
         self._draw_more_info(draw, base_image, data, service)
 
-        # Finally update display
-        self.display_manager.oled.display(base_image)
-        self.logger.info("OriginalScreen: Display updated.")
+        # Finally hand the frame back to the render scheduler
+        self.logger.info("OriginalScreen: Display rendered.")
+        return base_image
 
     def _draw_more_info(self, draw, base_image, data, service):
         """
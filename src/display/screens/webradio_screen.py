@@ -1,10 +1,7 @@
-import os
 import logging
 from PIL import Image, ImageDraw, ImageFont
 import threading
 import time
-import requests
-from io import BytesIO
 
 class WebRadioScreen:
     """
@@ -30,19 +27,12 @@ class WebRadioScreen:
         self.latest_state = None
         self.current_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
 
         # Fonts (ensure these exist in display_manager.fonts or use fallback)
         self.font_title = display_manager.fonts.get('radio_title', ImageFont.load_default())
         self.font_label = display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
         self.font_small = display_manager.fonts.get('radio_small', ImageFont.load_default())
 
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("WebRadioScreen: Started background update thread.")
-
         # Connect to Volumio listener
         if self.volumio_listener:
             self.volumio_listener.state_changed.connect(self.on_volumio_state_change)
@@ -51,7 +41,7 @@ class WebRadioScreen:
     # ------------------------------------------------------------------
     # Volumio State Change
     # ------------------------------------------------------------------
-    def on_volumio_state_change(self, sender, state):
+    def on_volumio_state_change(self, sender, state, **kwargs):
         """
         Update display only if the screen is active, in 'webradio' mode,
         and the service is one of the allowed values.
@@ -71,24 +61,23 @@ class WebRadioScreen:
         self.logger.debug(f"WebRadioScreen: state changed => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.render_scheduler.request_frame(self)
 
     # ------------------------------------------------------------------
-    # Background Update Loop
+    # Frame Rendering (called by DisplayManager's render scheduler)
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_frame(self):
         """
-        Wait for updates (or timeout periodically) and then refresh the display.
+        Take the newest state and return the frame to show. Nothing on this
+        layout animates, so frames are only requested on state changes.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.update_event.clear()
-            if self.is_active and self.mode_manager.get_mode() == 'webradio' and self.current_state:
-                self.draw_display(self.current_state)
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+        if self.is_active and self.mode_manager.get_mode() == 'webradio' and self.current_state:
+            return self.draw_display(self.current_state)
+        return None
 
     # ------------------------------------------------------------------
     # Start/Stop
@@ -107,15 +96,11 @@ class WebRadioScreen:
         try:
             if self.volumio_listener and self.volumio_listener.socketIO:
                 self.logger.debug("WebRadioScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
+                self.volumio_listener.request_state()
         except Exception as e:
             self.logger.warning(f"WebRadioScreen: Failed to emit 'getState'. Error => {e}")
 
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("WebRadioScreen: display update thread restarted.")
+        self.display_manager.render_scheduler.attach(self, self.render_frame)
 
     def stop_mode(self):
         """
@@ -126,12 +111,7 @@ class WebRadioScreen:
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("WebRadioScreen: display update thread stopped.")
+        self.display_manager.render_scheduler.detach(self)
 
         self.display_manager.clear_screen()
         self.logger.info("WebRadioScreen: Stopped mode and cleared screen.")
@@ -177,48 +157,21 @@ class WebRadioScreen:
 
         state = self.volumio_listener.get_current_state()
         if state:
-            self.draw_display(state)
+            with self.state_lock:
+                self.latest_state = state
+            self.display_manager.render_scheduler.request_frame(self)
         else:
             self.logger.warning("WebRadioScreen: No current volumio state available to display.")
 
     # ------------------------------------------------------------------
     # Album Art Helper
     # ------------------------------------------------------------------
-    def get_albumart(self, url):
+    def on_albumart_ready(self):
         """
-        Download and return an Image object from the given album art URL.
-        If no URL is provided or downloading fails, load the default album art
-        specified in the display configuration.
+        Called by the album art service once a background fetch completes,
+        so the real art replaces the placeholder.
         """
-        if not url:
-            default_path = self.display_manager.config.get("default_album_art")
-            if default_path and os.path.exists(default_path):
-                try:
-                    img = Image.open(default_path)
-                    return img.convert("RGB")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default album art from {default_path}: {e}")
-                    return None
-            else:
-                self.logger.error("No album art URL provided and default album art not found.")
-                return None
-
-        try:
-            response = requests.get(url, timeout=3)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            return img.convert("RGB")
-        except Exception as e:
-            self.logger.error(f"Failed to load album art from {url}: {e}")
-            default_path = self.display_manager.config.get("default_album_art")
-            if default_path and os.path.exists(default_path):
-                try:
-                    img = Image.open(default_path)
-                    return img.convert("RGB")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default album art from {default_path}: {e}")
-                    return None
-            return None
+        self.display_manager.render_scheduler.request_frame(self)
 
     # ------------------------------------------------------------------
     # Drawing the Screen
@@ -291,20 +244,22 @@ class WebRadioScreen:
         draw.text((margin, info_y), info_line, font=self.font_label, fill="white")
 
 
-        # Display album art on the upper-right if available.
+        # Display album art on the upper-right if available. It is fetched in the
+        # background; the default art is shown until it is ready.
         albumart_url = data.get("albumart")
         if albumart_url:
-            albumart = self.get_albumart(albumart_url)
+            album_art_size = (album_art_width, album_art_width)
+            albumart = self.display_manager.album_art.get(
+                albumart_url, album_art_size, on_ready=self.on_albumart_ready
+            ) or self.display_manager.album_art.get_placeholder(album_art_size)
             if albumart:
-                album_art_size = (album_art_width, album_art_width)
-                albumart = albumart.resize(album_art_size, Image.LANCZOS)
                 art_x = screen_width - album_art_size[0] - margin
                 art_y = margin
                 base_image.paste(albumart, (art_x, art_y))
 
-        # Send the composed image to the OLED display.
-        self.display_manager.oled.display(base_image)
-        self.logger.debug("WebRadioScreen: Display updated with adjusted vertical offsets.")
+        # Hand the composed image to the render scheduler.
+        self.logger.debug("WebRadioScreen: Rendered display with adjusted vertical offsets.")
+        return base_image
 
     def toggle_play_pause(self):
         """
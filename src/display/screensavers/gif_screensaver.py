@@ -0,0 +1,49 @@
+import logging
+import threading
+
+from display.animation import AnimationPlayer
+
+
+class GifScreensaver:
+    """
+    A screensaver that loops an animated GIF (display.screensaver_gif_path).
+
+    The frames come from DisplayManager's animation cache, so the GIF is
+    decoded the first time the screensaver runs and reused after that.
+    """
+
+    def __init__(self, display_manager, gif_path=None):
+        """
+        :param display_manager:  DisplayManager instance
+        :param gif_path:         GIF to play; defaults to screensaver_gif_path from the display config
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.display_manager = display_manager
+        self.gif_path = gif_path or display_manager.config.get('screensaver_gif_path')
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start_screensaver(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(self.stop_event,), daemon=True)
+        self.thread.start()
+
+    def stop_screensaver(self):
+        self.stop_event.set()
+        if self.thread:
+            # Don't wait out a first-time decode; the thread exits once it sees the event
+            self.thread.join(timeout=1)
+            self.thread = None
+        self.display_manager.clear_screen()
+
+    def run(self, stop_event):
+        try:
+            animation = self.display_manager.load_animation(self.gif_path)
+        except (IOError, TypeError) as e:
+            self.logger.error(f"GifScreensaver: cannot load '{self.gif_path}': {e}")
+            return
+        AnimationPlayer(self.display_manager, animation, loops=0, stop_event=stop_event).play()
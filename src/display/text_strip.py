@@ -0,0 +1,79 @@
+# src/display/text_strip.py
+
+import threading
+import time
+from collections import OrderedDict
+from PIL import Image, ImageDraw
+
+
+class TextStripCache:
+    """
+    Renders each (text, font) pair once into an L-mode strip and keeps the
+    most recently used strips around. Scrolling a long title then becomes a
+    paste of the cached strip at an offset instead of a FreeType render of the
+    whole string on every frame.
+
+    Strips are drawn with the text origin at (0, 0), so pasting one at (x, y)
+    lands exactly where ``draw.text((x, y), text, font=font)`` would.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.strips = OrderedDict()  # (text, font) -> L image
+
+    def get_strip(self, text, font):
+        key = (text, font)
+        with self.lock:
+            strip = self.strips.get(key)
+            if strip is not None:
+                self.strips.move_to_end(key)
+                return strip
+
+        _, _, right, bottom = font.getbbox(text) if text else (0, 0, 0, 0)
+        strip = Image.new("L", (max(1, right), max(1, bottom)), 0)
+        if text:
+            ImageDraw.Draw(strip).text((0, 0), text, font=font, fill=255)
+
+        with self.lock:
+            self.strips[key] = strip
+            while len(self.strips) > self.max_entries:
+                self.strips.popitem(last=False)
+        return strip
+
+    def text_width(self, text, font):
+        """Width of the rendered text in pixels (cached along with the strip)."""
+        return self.get_strip(text, font).width
+
+    def draw(self, image, position, text, font, fill="white"):
+        """Pastes the cached strip for `text` onto `image` at `position` in colour `fill`."""
+        strip = self.get_strip(text, font)
+        x, y = position
+        image.paste(fill, (x, y, x + strip.width, y + strip.height), strip)
+        return strip.width
+
+
+class TextScroller:
+    """
+    Time-based scroll position for one line of text. The offset grows at
+    `speed` pixels per second since the text first appeared, so the scroll
+    speed stays the same however many frames actually get drawn.
+    """
+
+    def __init__(self, speed):
+        self.speed = speed
+        self.text = None
+        self.started = 0.0
+
+    def reset(self):
+        self.text = None
+
+    def offset(self, text, period):
+        """Current offset in pixels, wrapping every `period` pixels."""
+        now = time.monotonic()
+        if text != self.text:
+            self.text = text
+            self.started = now
+        if period <= 0:
+            return 0
+        return int((now - self.started) * self.speed) % period
@@ -8,6 +8,8 @@ from enum import IntEnum
 import yaml
 from pathlib import Path
 
+from managers.timer_scheduler import scheduler
+
 # MCP23017 Register Definitions
 MCP23017_IODIRA = 0x00
 MCP23017_IODIRB = 0x01
@@ -16,6 +18,14 @@ MCP23017_GPIOB  = 0x13
 MCP23017_GPPUA  = 0x0C
 MCP23017_GPPUB  = 0x0D
 
+# Interrupt-on-change registers (IOCON.BANK = 0)
+MCP23017_IOCONA   = 0x0A
+MCP23017_GPINTENB = 0x05
+MCP23017_INTCONB  = 0x09
+MCP23017_INTCAPB  = 0x11
+IOCON_MIRROR      = 0x40   # INTA/INTB both signal a change on either port
+ROW_MASK          = 0x3C   # B2..B5 carry the four matrix rows
+
 DEFAULT_MCP23017_ADDRESS = 0x27
 SWAP_COLUMNS = True  # If your wiring for columns is reversed
 
@@ -52,7 +62,7 @@ class ButtonsLEDController:
     and ephemeral LED override ensures only one LED is lit at a time.
     """
 
-    def __init__(self, config_path='config.yaml', debounce_delay=0.1):
+    def __init__(self, config_path='config.yaml', debounce_delay=0.1, volumio_listener=None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
 
@@ -65,7 +75,12 @@ class ButtonsLEDController:
             self.logger.addHandler(ch)
 
         self.debounce_delay = debounce_delay
+        self.volumio_listener = volumio_listener
         self.bus = None
+        self.int_pin = None           # Pi GPIO (BCM) wired to INTA; None => poll the matrix
+        self.button_debounce = 0.02   # Settle time after an interrupt before scanning
+        self.gpio = None
+        self.scan_event = threading.Event()
 
         # Attempt to open SMBus #1
         try:
@@ -87,6 +102,7 @@ class ButtonsLEDController:
         self.status_led_state = 0            # For showing play/pause
         self.current_button_led_state = 0    # Ephemeral override
         self.current_led_state = 0           # Last hardware state
+        self.led_lock = threading.Lock()     # One computed mask -> at most one GPIOA write
 
         self.mcp23017_address = self._load_config(config_path)
         self._initialize_mcp23017()
@@ -101,6 +117,8 @@ class ButtonsLEDController:
             try:
                 with open(path, "r") as f:
                     data = yaml.safe_load(f)
+                    self.int_pin = data.get("mcp23017_int_pin", self.int_pin)
+                    self.button_debounce = data.get("button_debounce", self.button_debounce)
                     return data.get("mcp23017_address", DEFAULT_MCP23017_ADDRESS)
             except Exception as e:
                 self.logger.error(f"Error reading config: {e}")
@@ -128,18 +146,35 @@ class ButtonsLEDController:
 
     def start(self):
         self.running = True
-        # Thread for reading button presses
-        self.button_thread = threading.Thread(target=self._monitor_buttons_loop, name="ButtonMonitor")
+        # Thread for reading button presses: on INTA edges if wired up, else by polling
+        if self.int_pin is not None and self._enable_button_interrupts():
+            target = self._interrupt_buttons_loop
+        else:
+            target = self._monitor_buttons_loop
+        self.button_thread = threading.Thread(target=target, name="ButtonMonitor")
         self.button_thread.start()
 
-        # Thread for checking volumio => sets PLAY or PAUSE LED
-        self.volumio_monitor_thread = threading.Thread(target=self._monitor_volumio_loop, name="VolumioMonitor")
-        self.volumio_monitor_thread.start()
+        if self.volumio_listener is not None:
+            # PLAY/PAUSE LED follows Volumio's pushed state
+            self.volumio_listener.subscribe(self._on_volumio_status, fields=("status",))
+            self.set_status_led(self.volumio_listener.get_current_state().get("status", ""))
+        else:
+            # Standalone: fall back to checking volumio => sets PLAY or PAUSE LED
+            self.volumio_monitor_thread = threading.Thread(target=self._monitor_volumio_loop, name="VolumioMonitor")
+            self.volumio_monitor_thread.start()
 
         self.logger.info("ButtonsLEDController started.")
 
     def stop(self):
         self.running = False
+        if self.volumio_listener is not None:
+            self.volumio_listener.unsubscribe(self._on_volumio_status)
+        self.scan_event.set()
+        if self.gpio is not None:
+            try:
+                self.gpio.remove_event_detect(self.int_pin)
+            except Exception:
+                pass
         if self.button_thread and self.button_thread.is_alive():
             self.button_thread.join()
         if self.volumio_monitor_thread and self.volumio_monitor_thread.is_alive():
@@ -153,18 +188,86 @@ class ButtonsLEDController:
         while self.running:
             if not self.bus:
                 break
-            matrix = self._read_matrix()
-            for r in range(4):
-                for c in range(2):
-                    curr = matrix[r][c]
-                    prev = self.prev_button_state[r][c]
-                    if curr == 0 and prev == 1:
-                        btn_id = self.button_map[r][c]
-                        self.logger.info(f"Button {btn_id} pressed.")
-                        self.handle_button_press(btn_id)
-                    self.prev_button_state[r][c] = curr
+            self._process_matrix(self._read_matrix())
             time.sleep(self.debounce_delay)
 
+    def _process_matrix(self, matrix):
+        for r in range(4):
+            for c in range(2):
+                curr = matrix[r][c]
+                prev = self.prev_button_state[r][c]
+                if curr == 0 and prev == 1:
+                    btn_id = self.button_map[r][c]
+                    self.logger.info(f"Button {btn_id} pressed.")
+                    self.handle_button_press(btn_id)
+                self.prev_button_state[r][c] = curr
+
+    # -----------------------------------------------------------------
+    # Interrupt-driven scanning (MCP23017 interrupt-on-change => INTA)
+    # -----------------------------------------------------------------
+    def _enable_button_interrupts(self):
+        """
+        Idles both columns low so any press pulls its row low, and has the
+        MCP23017 raise INTA when a row input changes. The matrix is then only
+        scanned after an interrupt; no I2C traffic while nothing is pressed.
+        """
+        if not self.bus:
+            return False
+        try:
+            import RPi.GPIO as GPIO
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self.int_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+            self.bus.write_byte_data(self.mcp23017_address, MCP23017_IOCONA, IOCON_MIRROR)
+            self.bus.write_byte_data(self.mcp23017_address, MCP23017_INTCONB, 0x00)  # any change
+            self._idle_columns()
+            self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPINTENB, ROW_MASK)
+            self.bus.read_byte_data(self.mcp23017_address, MCP23017_INTCAPB)  # clear anything pending
+
+            GPIO.add_event_detect(self.int_pin, GPIO.FALLING, callback=lambda channel: self.scan_event.set())
+            self.gpio = GPIO
+            self.logger.info(f"Button matrix interrupts enabled on GPIO{self.int_pin}.")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Button interrupts unavailable ({e}); polling the matrix instead.")
+            return False
+
+    def _idle_columns(self):
+        # Both columns low (B0/B1 = 0); B2..B7 are inputs so their bits are ignored
+        self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, 0xFC)
+
+    def _interrupt_buttons_loop(self):
+        while self.running:
+            # The timeout also catches an INTA line left low by an edge we missed
+            if not self.scan_event.wait(timeout=1.0):
+                if self.gpio.input(self.int_pin) != self.gpio.LOW:
+                    continue
+            self.scan_event.clear()
+            if not self.running:
+                break
+            time.sleep(self.button_debounce)
+
+            try:
+                # Scanning drives the columns, which itself changes the rows
+                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPINTENB, 0x00)
+                matrix = self._read_matrix()
+                self._idle_columns()
+                rows = self.bus.read_byte_data(self.mcp23017_address, MCP23017_GPIOB)  # also clears INTA
+                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPINTENB, ROW_MASK)
+            except Exception as e:
+                self.logger.error(f"Interrupt scan error: {e}")
+                continue
+
+            self._process_matrix(matrix)
+
+            # A change while interrupts were off won't raise INTA; rescan if the
+            # rows no longer match what the scan saw
+            for r in range(4):
+                row_low = not (rows >> (r + 2)) & 0x01
+                if row_low != (0 in matrix[r]):
+                    self.scan_event.set()
+                    break
+
     def _read_matrix(self):
         default = [[1,1],[1,1],[1,1],[1,1]]
         if not self.bus:
@@ -187,8 +290,22 @@ class ButtonsLEDController:
         return result
 
     # -----------------------------------------------------------------
-    # Volumio Monitor => sets PLAY or PAUSE LED
+    # Volumio State => sets PLAY or PAUSE LED
     # -----------------------------------------------------------------
+    def _on_volumio_status(self, sender, state, **kwargs):
+        self.set_status_led(state.get("status", ""))
+
+    def set_status_led(self, status):
+        # "status" might be "play", "pause", or "stop"
+        status = (status or "").lower()
+        if status == "play":
+            self.status_led_state = LED.PLAY.value
+        elif status in ["pause", "stop"]:
+            self.status_led_state = LED.PAUSE.value
+        else:
+            self.status_led_state = 0
+        self.control_leds()
+
     def _monitor_volumio_loop(self):
         while self.running:
             try:
@@ -206,17 +323,7 @@ class ButtonsLEDController:
                 # 2) Attempt JSON parse
                 try:
                     data = json.loads(res.stdout)
-                    # "status" might be "play", "pause", or "stop"
-                    state = data.get("status", "").lower()
-
-                    if state == "play":
-                        self.status_led_state = LED.PLAY.value
-                    elif state in ["pause", "stop"]:
-                        self.status_led_state = LED.PAUSE.value
-                    else:
-                        self.status_led_state = 0
-
-                    self.control_leds()
+                    self.set_status_led(data.get("status", ""))
                 except json.JSONDecodeError:
                     # 3) Fallback if not valid JSON (rare)
                     text = res.stdout.lower()
@@ -237,41 +344,60 @@ class ButtonsLEDController:
     # -----------------------------------------------------------------
     def handle_button_press(self, btn_id):
         """
-        Button 1 => 'volumio play' or 'toggle'?
-        Button 2 => 'volumio pause'
-        etc.
+        Button 1 => play
+        Button 2 => pause
+        etc. Transport goes to Volumio over the listener's socket.io
+        connection, so the button loop never waits on a volumio CLI process.
         """
         try:
             if btn_id == 1:
                 # "Play"
-                subprocess.run(["volumio","play"], check=False)
+                self._transport("play")
                 self.light_button_led_for(LED.PLAY, 0.5)
             elif btn_id == 2:
                 # "Pause"
-                subprocess.run(["volumio","pause"], check=False)
+                self._transport("pause")
                 self.light_button_led_for(LED.PAUSE, 0.5)
             elif btn_id == 3:
-                subprocess.run(["volumio","previous"], check=False)
+                self._transport("previous")
                 self.light_button_led_for(LED.PREV, 0.5)
             elif btn_id == 4:
-                subprocess.run(["volumio","next"], check=False)
+                self._transport("next")
                 self.light_button_led_for(LED.NEXT, 0.5)
             elif btn_id == 5:
-                subprocess.run(["volumio","random"], check=False)
+                self._transport("random")
                 self.light_button_led_for(LED.SHUFF, 0.5)
             elif btn_id == 6:
-                subprocess.run(["volumio","repeat"], check=False)
+                self._transport("repeat")
                 self.light_button_led_for(LED.REPEAT, 0.5)
             elif btn_id == 7:
                 self.light_button_led_for(LED.SPARE, 0.5)
             elif btn_id == 8:
-                subprocess.run(["sudo","systemctl","restart","quadify"], check=False)
+                subprocess.Popen(["sudo","systemctl","restart","quadify"])
                 self.light_button_led_for(LED.RELOAD, 0.5)
             else:
                 self.logger.warning(f"No action for button {btn_id}")
         except Exception as e:
             self.logger.error(f"handle_button_press => {e}")
 
+    def _transport(self, action):
+        """
+        Runs a transport action through VolumioListener; without one (e.g. when
+        run standalone) falls back to the volumio CLI without waiting for it.
+        """
+        if self.volumio_listener is None:
+            subprocess.Popen(["volumio", action])
+            return
+        actions = {
+            "play": self.volumio_listener.play,
+            "pause": self.volumio_listener.pause,
+            "previous": self.volumio_listener.previous_track,
+            "next": self.volumio_listener.next_track,
+            "random": self.volumio_listener.toggle_random,
+            "repeat": self.volumio_listener.toggle_repeat,
+        }
+        actions[action]()
+
     # -----------------------------------------------------------------
     # Ephemeral LED override
     # -----------------------------------------------------------------
@@ -282,8 +408,7 @@ class ButtonsLEDController:
         """
         self.current_button_led_state = led_enum.value
         self.control_leds()
-        t = threading.Timer(duration, self.reset_button_led)
-        t.start()
+        scheduler.call_later(duration, self.reset_button_led)
 
     def reset_button_led(self):
         self.current_button_led_state = 0
@@ -293,24 +418,29 @@ class ButtonsLEDController:
         """
         If ephemeral LED is active => show only ephemeral
         else => show the status_led_state (play or pause).
-        """
-        if self.current_button_led_state != 0:
-            total_state = self.current_button_led_state
-        else:
-            total_state = self.status_led_state
 
-        if total_state != self.current_led_state:
-            if self.bus:
-                try:
-                    self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, total_state)
-                    self.current_led_state = total_state
-                    self.logger.info(f"LED state => {bin(total_state)}")
-                except Exception as e:
-                    self.logger.error(f"Error setting LEDs: {e}")
+        GPIOA is only written when the resulting mask differs from what the
+        hardware already shows; the lock keeps callers on different threads
+        (state pushes, button presses, LED timers) from racing on that check.
+        """
+        with self.led_lock:
+            if self.current_button_led_state != 0:
+                total_state = self.current_button_led_state
             else:
-                self.logger.error("No bus => cannot set LED.")
-        else:
-            self.logger.debug("No LED change needed.")
+                total_state = self.status_led_state
+
+            if total_state != self.current_led_state:
+                if self.bus:
+                    try:
+                        self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, total_state)
+                        self.current_led_state = total_state
+                        self.logger.info(f"LED state => {bin(total_state)}")
+                    except Exception as e:
+                        self.logger.error(f"Error setting LEDs: {e}")
+                else:
+                    self.logger.error("No bus => cannot set LED.")
+            else:
+                self.logger.debug("No LED change needed.")
 
     def shutdown_leds(self):
         """
@@ -320,7 +450,9 @@ class ButtonsLEDController:
         if self.bus:
             try:
                 # Clear LED outputs on port A (assuming LEDs are connected to GPIOA)
-                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, 0x00)
+                with self.led_lock:
+                    self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, 0x00)
+                    self.current_led_state = 0
                 # Optionally, you could also reset GPIOB if needed (e.g. setting columns to their inactive state)
                 self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, 0x03)
                 self.logger.info("MCP23017 shutdown: All LEDs turned off.")
@@ -2,29 +2,121 @@
 import socket
 import time
 import os
-import subprocess
+import json
+import threading
 
 # Global dictionary for debouncing
 last_processed_time = {}
 DEBOUNCE_TIME = 0.3  # seconds, adjust as needed
 
-def send_command(command, retries=5, delay=0.5):
-    sock_path = "/tmp/quadify.sock"
-    for attempt in range(retries):
+# Modes showing a scrollable list; holding up/down there fast-scrolls and left/right jump by letter
+LIST_MODES = ["tidal", "qobuz", "spotify", "library", "usblibrary", "playlists", "radiomanager",
+              "radioparadise", "motherearthradio"]
+
+
+class QuadifyConnection:
+    """
+    Persistent connection to Quadify's command server on /tmp/quadify.sock.
+
+    Commands are written as newline-framed JSON without waiting for a reply,
+    so repeated keys are pipelined over the one connection. The server pushes
+    {"event": "mode", ...} whenever the mode changes; a reader thread keeps
+    `mode` up to date from those, so key handling needs no file read.
+    """
+
+    def __init__(self, sock_path="/tmp/quadify.sock", reconnect_delay=1.0):
+        self.sock_path = sock_path
+        self.reconnect_delay = reconnect_delay
+        self.sock = None
+        self.mode = None
+        self.lock = threading.Lock()
+        self.last_attempt = 0.0
+
+    def _connect(self):
+        """Opens the connection if needed; returns the socket or None. Call with lock held."""
+        if self.sock is not None:
+            return self.sock
+        now = time.monotonic()
+        if now - self.last_attempt < self.reconnect_delay:
+            return None  # Quadify is (re)starting; don't stall key handling on it
+        self.last_attempt = now
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self.sock_path)
+        except OSError as e:
+            print(f"Cannot connect to Quadify at {self.sock_path}: {e}")
+            return None
+        self.sock = sock
+        threading.Thread(target=self._read_loop, args=(sock,), daemon=True).start()
+        print("Connected to Quadify command server.")
+        return sock
+
+    def _drop(self, sock):
+        with self.lock:
+            if self.sock is sock:
+                self.sock = None
+                self.mode = None
         try:
-            s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            s.connect(sock_path)
-            s.sendall(command.encode("utf-8"))
-            s.close()
-            return  # Success
-        except Exception as e:
-            print(f"Attempt {attempt+1}: Error sending command '{command}': {e}")
-            time.sleep(delay)
-    print(f"Failed to send command '{command}' after {retries} attempts.")
-
-
-def process_key(key, current_mode):
+            sock.close()
+        except OSError:
+            pass
+
+    def _read_loop(self, sock):
+        buffer = b""
+        try:
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        continue
+                    if message.get("event") == "mode":
+                        self.mode = message.get("mode")
+        except OSError:
+            pass
+        self._drop(sock)
+
+    def ensure_connected(self):
+        with self.lock:
+            return self._connect() is not None
+
+    def send(self, command, **params):
+        payload = (json.dumps({"cmd": command, **params}) + "\n").encode("utf-8")
+        for _ in range(2):  # a stale connection gets one immediate reconnect
+            with self.lock:
+                sock = self._connect()
+            if sock is None:
+                break
+            try:
+                sock.sendall(payload)
+                return True
+            except OSError as e:
+                print(f"Error sending command '{command}': {e}")
+                self._drop(sock)
+                self.last_attempt = 0.0
+        print(f"Failed to send command '{command}'.")
+        return False
+
+
+quadify = QuadifyConnection()
+
+
+def send_command(command, **params):
+    quadify.send(command, **params)
+
+
+def process_key(key, current_mode, repeat=0):
     """Decide what command to run based on the key and current mode, with debouncing."""
+    if repeat and key in ("KEY_UP", "KEY_DOWN") and current_mode in LIST_MODES:
+        # Held key: Quadify speeds the scroll up with the repeat count
+        send_command("scroll_up" if key == "KEY_UP" else "scroll_down", repeat=repeat)
+        return
+
     now = time.time()
     if key in last_processed_time and (now - last_processed_time[key]) < DEBOUNCE_TIME:
         print(f"Ignoring duplicate key: {key}")
@@ -58,12 +150,16 @@ def process_key(key, current_mode):
             send_command("skip_previous")
         elif current_mode in ["menu", "configmenu"]:
             send_command("scroll_left")
+        elif current_mode in LIST_MODES:
+            send_command("letter_prev")
 
     elif key == "KEY_RIGHT":
         if current_mode in ["original", "minimal", "modern", "webradio"]:
             send_command("skip_next")
         elif current_mode in ["menu", "configmenu"]:
             send_command("scroll_right")
+        elif current_mode in LIST_MODES:
+            send_command("letter_next")
 
 
     elif key == "KEY_VOLUMEUP":
@@ -76,8 +172,8 @@ def process_key(key, current_mode):
     elif key == "KEY_UP":
         if current_mode in ["original", "modern", "minimal", "webradio"]:
             send_command("seek_plus")
-        elif current_mode in ["tidal", "qobuz", "spotify", "library", "playlists", "radiomanager", 
-                            "displaymenu", "clockmenu", "remotemenu", "screensavermenu", "systeminfo", "systemupdate", "radioparadise", "motherearthradio"]:
+        elif current_mode in LIST_MODES + ["displaymenu", "clockmenu", "remotemenu", "screensavermenu",
+                                           "systeminfo", "systemupdate"]:
             send_command("scroll_up")
         else:
             print("No mapping for KEY_UP in current mode.")
@@ -85,8 +181,8 @@ def process_key(key, current_mode):
     elif key == "KEY_DOWN":
         if current_mode in ["original", "modern", "minimal", "webradio"]:
             send_command("seek_minus")
-        elif current_mode in ["tidal", "qobuz", "spotify", "library", "playlists", "radiomanager", 
-                            "displaymenu", "clockmenu", "remotemenu", "screensavermenu", "systeminfo", "systemupdate", "radioparadise", "motherearthradio"]:
+        elif current_mode in LIST_MODES + ["displaymenu", "clockmenu", "remotemenu", "screensavermenu",
+                                           "systeminfo", "systemupdate"]:
             send_command("scroll_down")
         else:
             print("No mapping for KEY_DOWN in current mode.")
@@ -103,9 +199,12 @@ def process_key(key, current_mode):
 
 def get_current_mode():
     """
-    Reads the current Quadify mode from a file.
-    Ensure your Quadify application writes the current mode to /tmp/quadify_mode.
+    Returns the current Quadify mode as pushed over the command connection,
+    falling back to the file Quadify writes to /tmp/quadify_mode while not connected.
     """
+    quadify.ensure_connected()
+    if quadify.mode:
+        return quadify.mode
     try:
         with open("/tmp/quadify_mode", "r") as f:
             return f.read().strip()
@@ -125,29 +224,35 @@ def ir_event_listener():
     # Create a Unix socket and connect to LIRC daemon
     s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     s.connect(sock_path)
-    s.setblocking(False)
     print("IR listener connected to LIRC socket.")
 
+    # Connect to Quadify up front so the first key doesn't pay for it
+    quadify.ensure_connected()
+
+    buffer = b""
     try:
         while True:
-            try:
-                data = s.recv(1024)
-                if data:
-                    # LIRC events are typically sent as lines of text.
-                    lines = data.decode("utf-8").splitlines()
-                    for line in lines:
-                        # Expected line format:
-                        # "0000000000000001 00 KEY_POWER /home/volumio/lircd.conf"
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            key = parts[2]
-                            current_mode = get_current_mode()
-                            print(f"IR event: {key} (mode: {current_mode})")
-                            process_key(key, current_mode)
-                else:
-                    time.sleep(0.1)
-            except BlockingIOError:
-                time.sleep(0.1)
+            # Blocking read: keys are handled as soon as LIRC sends them
+            data = s.recv(1024)
+            if not data:
+                print("LIRC socket closed.")
+                break
+            buffer += data
+            # LIRC events are sent as lines of text; keep any partial line for the next read.
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                # Expected line format:
+                # "0000000000000001 00 KEY_POWER /home/volumio/lircd.conf"
+                parts = line.decode("utf-8", errors="replace").split()
+                if len(parts) >= 3:
+                    key = parts[2]
+                    try:
+                        repeat = int(parts[1], 16)  # 0 for a press, counts up while the key is held
+                    except ValueError:
+                        repeat = 0
+                    current_mode = get_current_mode()
+                    print(f"IR event: {key} (mode: {current_mode}, repeat: {repeat})")
+                    process_key(key, current_mode, repeat)
     finally:
         s.close()
 
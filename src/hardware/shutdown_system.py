@@ -1,7 +1,7 @@
 import os
 import time
 import RPi.GPIO as GPIO
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 def reset_oled():
     """
@@ -29,12 +29,8 @@ def display_shutdown_text(display_manager):
         image = Image.new("RGB", (width, height), "black")
         draw = ImageDraw.Draw(image)
         
-        try:
-            # Adjust the font path and size as needed.
-            font = ImageFont.truetype("/home/volumio/Quadify/src/assets/fonts/OpenSans-Regular.ttf", 22)
-        except Exception as e:
-            display_manager.logger.error(f"Error loading custom font: {e}")
-            font = ImageFont.load_default()
+        # Adjust the font path and size as needed; falls back to the default font if it can't be loaded
+        font = display_manager.font_registry.get("/home/volumio/Quadify/src/assets/fonts/OpenSans-Regular.ttf", 22)
         
         text = "Shutting Down..."
         text_width, text_height = draw.textsize(text, font=font)
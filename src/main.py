@@ -12,7 +12,6 @@ import subprocess
 import lirc
 import os
 import sys
-from PIL import Image, ImageSequence
 
 # GS Added debug log output, resets on each Quadify restart 
 logging.basicConfig(
@@ -36,11 +35,16 @@ from display.screensavers.snake_screensaver import SnakeScreensaver
 from display.screensavers.geo_screensaver import GeoScreensaver
 from display.screensavers.bouncing_text_screensaver import BouncingTextScreensaver
 from display.display_manager import DisplayManager
+from display.animation import AnimationPlayer
 from managers.menu_manager import MenuManager
 from managers.mode_manager import ModeManager
 from managers.manager_factory import ManagerFactory
+from managers.fast_scroll import FastScroller
+from managers.startup_orchestrator import StartupOrchestrator
 from controls.rotary_control import RotaryControl
 from network.volumio_listener import VolumioListener
+from network.command_server import CommandServer
+from network.library_index import LibraryIndex, DEFAULT_ROOTS
 from display.screens.clock import Clock
 
 def load_config(config_path='/config.yaml'):
@@ -73,114 +77,181 @@ def main():
     config_path = os.path.join(script_dir, '..', 'config.yaml')
     config = load_config(config_path)
 
-    # 3) Initialize DisplayManager
+    # 3) Initialize DisplayManager; fonts and icons are loaded by a startup stage below
     display_config = config.get('display', {})
-    display_manager = DisplayManager(display_config)
+    display_manager = DisplayManager(display_config, load_assets=False)
 
-    # 4) Display a startup logo for 5 seconds
-    logger.info("Displaying startup logo...")
-    display_manager.show_logo()
-    logger.info("Startup logo displayed for 5 seconds.")
-    time.sleep(5)
-    display_manager.clear_screen()
-    logger.info("Screen cleared after logo display.")
-
-    # 5) Setup readiness events
-    volumio_ready_event = threading.Event()
-    min_loading_event = threading.Event()
-    MIN_LOADING_DURATION = 5  # seconds
+    # 4) Startup stages run in parallel, each as soon as what it needs is ready
+    startup_cfg = config.get('startup', {})
+    boot = StartupOrchestrator()
+    boot_done = threading.Event()
 
-    def set_min_loading_event():
-        time.sleep(MIN_LOADING_DURATION)
-        min_loading_event.set()
-        logger.info("Minimum loading duration has elapsed.")
-
-    threading.Thread(target=set_min_loading_event, daemon=True).start()
+    # 5) Splash: the logo at once, then the loading GIF until every stage is done
+    logger.info("Displaying startup logo...")
+    display_manager.show_logo(timeout=None)
+    boot.mark("logo shown")
 
     def show_loading():
+        # A quick boot goes straight from the logo to the clock
+        if boot_done.wait(startup_cfg.get('logo_seconds', 1.5)):
+            return
         loading_gif_path = display_config.get('loading_gif_path', 'loading.gif')
         try:
-            image = Image.open(loading_gif_path)
-            if not getattr(image, "is_animated", False):
-                logger.warning(f"Loading GIF '{loading_gif_path}' is not animated.")
-                return
+            animation = display_manager.load_animation(loading_gif_path)
         except IOError:
             logger.error(f"Failed to load loading GIF '{loading_gif_path}'.")
             return
+        if not animation.is_animated:
+            logger.warning(f"Loading GIF '{loading_gif_path}' is not animated.")
+            return
 
         logger.info("Displaying loading GIF during startup.")
-        display_manager.clear_screen()
-        time.sleep(0.1)
-
-        while not (volumio_ready_event.is_set() and min_loading_event.is_set()):
-            for frame in ImageSequence.Iterator(image):
-                if volumio_ready_event.is_set() and min_loading_event.is_set():
-                    logger.info("Volumio ready & min load done, stopping loading GIF.")
-                    return
-                display_manager.oled.display(frame.convert(display_manager.oled.mode))
-                frame_duration = frame.info.get('duration', 100) / 1000.0
-                time.sleep(frame_duration)
+        boot.mark("loading GIF")
+        display_manager.stop_animation()  # in case the logo is animated
+        AnimationPlayer(display_manager, animation, loops=0, stop_event=boot_done).play()
 
-        logger.info("Exiting loading GIF display thread.")
+        logger.info("Startup finished, stopping loading GIF.")
 
-    threading.Thread(target=show_loading, daemon=True).start()
+    splash_thread = threading.Thread(target=show_loading, daemon=True)
+    splash_thread.start()
 
-    # 6) Initialize VolumioListener
+    # 6) Stage functions; each gets the results of the stages it runs after
     volumio_cfg = config.get('volumio', {})
     volumio_host = volumio_cfg.get('host', 'localhost')
     volumio_port = volumio_cfg.get('port', 3000)
-    volumio_listener = VolumioListener(host=volumio_host, port=volumio_port)
-
-    def on_state_changed(sender, state):
-        logger.info(f"Volumio state changed: {state}")
-        if state.get('status') in ['play', 'stop', 'pause', 'unknown']:
-            logger.info("Volumio is considered ready now.")
-            volumio_ready_event.set()
-            # Optionally disconnect the callback
-            volumio_listener.state_changed.disconnect(on_state_changed)
-
-    volumio_listener.state_changed.connect(on_state_changed)
-
-    # 7) Wait for both events
-    logger.info("Waiting for Volumio readiness & min load time.")
-    volumio_ready_event.wait()
-    min_loading_event.wait()
-    logger.info("Volumio is ready & min loading time passed, proceeding...")
-
-    # 8) Initialize Clock
-    clock_config = config.get('clock', {})
-    clock = Clock(display_manager, clock_config, volumio_listener)
-    clock.logger = logging.getLogger("Clock")
-    clock.logger.setLevel(logging.INFO)
-
-    # 9) Initialize ModeManager (Quadify style)
-    # Use trigger() calls later for transitions.
-    mode_manager = ModeManager(
-        display_manager   = display_manager,
-        clock             = clock,
-        volumio_listener  = volumio_listener,
-        preference_file_path="../preference.json",  # or your chosen path
-        config            = config
-    )
+    volumio_ready_event = threading.Event()
 
-    # 10) Create ManagerFactory & set up managers/screens
-    manager_factory = ManagerFactory(
-        display_manager   = display_manager,
-        volumio_listener  = volumio_listener,
-        mode_manager      = mode_manager,
-        config            = config
-    )
-    manager_factory.setup_mode_manager()
+    def connect_volumio():
+        listener = VolumioListener(host=volumio_host, port=volumio_port,
+                                   browse_cache_ttls=volumio_cfg.get('browse_cache_ttl'))
+
+        def on_state_changed(sender, state, **kwargs):
+            logger.info(f"Volumio state changed: {state}")
+            if state.get('status') in ['play', 'stop', 'pause', 'unknown']:
+                logger.info("Volumio is considered ready now.")
+                volumio_ready_event.set()
+                listener.state_changed.disconnect(on_state_changed)
+
+        # Strong reference: nothing else keeps this closure alive once the stage returns
+        listener.state_changed.connect(on_state_changed, weak=False)
+        # The first pushState may have arrived while connecting, before the handler was attached
+        listener.request_state()
+        return listener
+
+    def wait_for_volumio(listener):
+        logger.info("Waiting for Volumio readiness.")
+        volumio_ready_event.wait()
+        return listener
+
+    def open_library_index(listener):
+        # Crawls the NAS/USB library in the background so the library menus load from disk
+        index_cfg = config.get('library_index', {})
+        if not index_cfg.get('enabled', True):
+            return None
+        try:
+            library_index = LibraryIndex(
+                db_path=index_cfg.get('path', '/home/volumio/Quadify/cache/library_index.db'),
+                base_url=f"http://{volumio_host}:{volumio_port}",
+                roots=index_cfg.get('roots') or DEFAULT_ROOTS,
+                requests_per_second=index_cfg.get('requests_per_second', 4),
+                refresh_interval=index_cfg.get('refresh_hours', 12) * 3600
+            )
+            library_index.start()
+            return library_index
+        except Exception as e:
+            logger.error(f"Library index unavailable, browsing Volumio directly: {e}")
+            return None
+
+    def create_clock(listener):
+        clock = Clock(display_manager, config.get('clock', {}), listener)
+        clock.logger = logging.getLogger("Clock")
+        clock.logger.setLevel(logging.INFO)
+        return clock
+
+    def create_mode_manager(listener, clock):
+        # ModeManager loads preference.json while Volumio is still connecting
+        mode_manager = ModeManager(
+            display_manager   = display_manager,
+            clock             = clock,
+            volumio_listener  = listener,
+            preference_file_path="../preference.json",  # or your chosen path
+            config            = config
+        )
+        # Playback can't switch modes until the managers exist; allowed again once the clock is up
+        mode_manager.suppress_state_change()
+        return mode_manager
+
+    def create_managers(mode_manager, listener, _assets):
+        manager_factory = ManagerFactory(
+            display_manager   = display_manager,
+            volumio_listener  = listener,
+            mode_manager      = mode_manager,
+            config            = config
+        )
+        manager_factory.setup_mode_manager()
+        return manager_factory
+
+    # 7) Start them: fonts/icons, the Volumio connection and the managers overlap
+    boot.add("assets", display_manager.load_assets)
+    boot.add("volumio", connect_volumio)
+    boot.add("volumio_ready", wait_for_volumio, after=("volumio",))
+    boot.add("library_index", open_library_index, after=("volumio_ready",))
+    boot.add("clock", create_clock, after=("volumio",))
+    boot.add("mode_manager", create_mode_manager, after=("volumio", "clock"))
+    boot.add("managers", create_managers, after=("mode_manager", "volumio", "assets"))
+
+    failed = boot.wait()
+    if failed:
+        boot.log_timeline(logger)
+        raise RuntimeError(f"Startup failed in stage(s): {', '.join(failed)}")
+
+    volumio_listener = boot.result("volumio")
+    clock = boot.result("clock")
+    mode_manager = boot.result("mode_manager")
+    manager_factory = boot.result("managers")
+    manager_factory.set_library_index(boot.result("library_index"))
+
+    # Optional floor on the splash, for anyone who wants to see the animation
+    remaining = startup_cfg.get('min_splash_seconds', 0) - (time.monotonic() - boot.started)
+    if remaining > 0:
+        time.sleep(remaining)
+    boot_done.set()
+    splash_thread.join(timeout=2)
+    display_manager.stop_animation()
+    # Not shown again until the next boot
+    display_manager.animations.discard(display_config.get('loading_gif_path', 'loading.gif'))
+    logger.info("All startup stages done, proceeding...")
 
     # 11) Assign the ModeManager to volumio_listener
     volumio_listener.mode_manager = mode_manager
 
+    # Long lists (streaming folders, radio stations, the library) get accelerated scrolling
+    fast_scroller = FastScroller(display_manager)
+    list_managers = {
+        'tidal': mode_manager.tidal_manager,
+        'qobuz': mode_manager.qobuz_manager,
+        'spotify': mode_manager.spotify_manager,
+        'playlists': mode_manager.playlist_manager,
+        'radiomanager': mode_manager.radio_manager,
+        'motherearthradio': mode_manager.motherearth_manager,
+        'radioparadise': mode_manager.radioparadise_manager,
+        'library': mode_manager.library_manager,
+        'usblibrary': mode_manager.usb_library_manager,
+    }
+
     # Use the trigger() method for transitions so the mode stack gets updated.
     mode_manager.trigger("to_clock")
+    mode_manager.allow_state_change()
     logger.info("Forced system into 'clock' mode after all initialization.")
+    # A play state published while suppressed was dropped; replay the current one
+    current_state = volumio_listener.get_current_state()
+    if current_state:
+        mode_manager.process_state_change(volumio_listener, state=current_state)
+    boot.mark("clock shown")
+    boot.log_timeline(logger)
 
 #     # 12) ButtonsLEDs – GS Button Matrix fully disabled for clean logs
-#     buttons_leds = ButtonsLEDController(config_path=config_path)
+#     buttons_leds = ButtonsLEDController(config_path=config_path, volumio_listener=volumio_listener)
 #     buttons_leds.start()
 
     # 13) Define RotaryControl callbacks
@@ -218,24 +289,8 @@ def main():
             mode_manager.screensaver_menu.scroll_selection(direction)
         elif current_mode == 'displaymenu':
             mode_manager.display_menu.scroll_selection(direction)
-        elif current_mode == 'tidal':
-            mode_manager.tidal_manager.scroll_selection(direction)
-        elif current_mode == 'qobuz':
-            mode_manager.qobuz_manager.scroll_selection(direction)
-        elif current_mode == 'spotify':
-            mode_manager.spotify_manager.scroll_selection(direction)
-        elif current_mode == 'playlists':
-            mode_manager.playlist_manager.scroll_selection(direction)
-        elif current_mode == 'radiomanager':
-            mode_manager.radio_manager.scroll_selection(direction)
-        elif current_mode == 'motherearthradio':
-            mode_manager.motherearth_manager.scroll_selection(direction)
-        elif current_mode == 'radioparadise':
-            mode_manager.radioparadise_manager.scroll_selection(direction)
-        elif current_mode == 'library':
-            mode_manager.library_manager.scroll_selection(direction)
-        elif current_mode == 'usblibrary':
-            mode_manager.usb_library_manager.scroll_selection(direction)
+        elif current_mode in list_managers:
+            fast_scroller.rotate(list_managers[current_mode], direction)
         else:
             logger.warning(f"Unhandled mode: {current_mode}; no rotary action performed.")
 
@@ -315,33 +370,19 @@ def main():
         rotation_callback     = on_rotate,
         button_callback       = on_button_press_inner,
         long_press_callback   = on_long_press,
-        long_press_threshold  = 2
+        long_press_threshold  = 2,
+        mode                  = config.get('pins', {}).get('rotary_mode', 'interrupt')
     )
 
     threading.Thread(target=rotary_control.start, daemon=True).start()
 
 
-    def quadify_command_server(mode_manager, volumio_listener):
+    def build_command_handler(mode_manager, volumio_listener):
         """
-        A Unix socket server that listens on /tmp/quadify.sock for commands
-        from the IR listener and processes them using the provided mode_manager
-        and volumio_listener.
+        Returns the handler for commands arriving on /tmp/quadify.sock from the
+        IR listener, processing them using the provided mode_manager and
+        volumio_listener.
         """
-        import os
-        import socket
-        import subprocess
-
-        sock_path = "/tmp/quadify.sock"
-        try:
-            os.remove(sock_path)
-        except OSError:
-            pass
-
-        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        server_socket.bind(sock_path)
-        server_socket.listen(1)
-        print(f"Quadify command server listening on {sock_path}")
-
         select_mapping = {
             "menu": lambda: mode_manager.menu_manager.select_item(),
             "tidal": lambda: mode_manager.tidal_manager.select_item(),
@@ -398,85 +439,95 @@ def main():
             }
         }
 
-        while True:
-            try:
-                conn, _ = server_socket.accept()
-                with conn:
-                    data = conn.recv(1024)
-                    if not data:
-                        continue
-                    command = data.decode("utf-8").strip()
-                    print(f"Command received: {command}")
-                    current_mode = mode_manager.get_mode()
-
-                    if command == "home":
-                        mode_manager.trigger("to_clock")
-                    elif command == "shutdown":
-                        shutdown_system(display_manager, buttons_leds, mode_manager)
-                    elif command == "menu":
-                        if current_mode == "clock":
-                            mode_manager.trigger("to_menu")
-                    elif command == "toggle":
-                        mode_manager.toggle_play_pause()
-
-                    elif command == "repeat":
-                        print("Repeat command received. (Implement as needed)")
-                    elif command == "select":
-                        if current_mode in select_mapping:
-                            select_mapping[current_mode]()
-                        else:
-                            print(f"No select mapping for mode: {current_mode}")
-
-                    elif command in ["scroll_up", "scroll_down"]:
-                        if current_mode in scroll_mapping[command]:
-                            scroll_mapping[command][current_mode]()
-                        else:
-                            print(f"No scroll mapping for command: {command} in mode: {current_mode}")
-
-                    elif command == "scroll_left":
-                        if current_mode in ["menu", "configmenu"]:
-                            active_menu = mode_manager.menu_manager if current_mode == "menu" else mode_manager.config_menu
-                            active_menu.scroll_selection(-1)
-                        else:
-                            print(f"No mapping for scroll_left in mode: {current_mode}")
-
-                    elif command == "scroll_right":
-                        if current_mode in ["menu", "configmenu"]:
-                            active_menu = mode_manager.menu_manager if current_mode == "menu" else mode_manager.config_menu
-                            active_menu.scroll_selection(1)
-                        else:
-                            print(f"No mapping for scroll_right in mode: {current_mode}")
-
-                    elif command == "seek_plus":
-                        print("Seeking forward 10 seconds.")
-                        subprocess.run(["volumio", "seek", "plus"], check=False)
-                        
-                    elif command == "seek_minus":
-                        print("Seeking backward 10 seconds.")
-                        subprocess.run(["volumio", "seek", "minus"], check=False)
-
-                    elif command == "skip_next":
-                        print("Skipping to next track.")
-                        subprocess.run(["volumio", "next"], check=False)
-
-                    elif command == "skip_previous":
-                        print("Skipping to previous track.")
-                        subprocess.run(["volumio", "previous"], check=False)
-
-                    elif command == "volume_plus":
-                        volumio_listener.increase_volume()
-                    elif command == "volume_minus":
-                        volumio_listener.decrease_volume()
-                    elif command == "back":
-                        mode_manager.trigger("back")
-                    else:
-                        print(f"No mapping for command: {command}")
-            except Exception as e:
-                print(f"Error in command server: {e}")
-
-
-    threading.Thread(target=quadify_command_server, args=(mode_manager, volumio_listener), daemon=True).start()
-    print("Quadify command server thread started.")
+        def handle_command(command, repeat=0, **kwargs):
+            print(f"Command received: {command}")
+            current_mode = mode_manager.get_mode()
+
+            if command == "home":
+                mode_manager.trigger("to_clock")
+            elif command == "shutdown":
+                shutdown_system(display_manager, buttons_leds, mode_manager)
+            elif command == "menu":
+                if current_mode == "clock":
+                    mode_manager.trigger("to_menu")
+            elif command == "toggle":
+                mode_manager.toggle_play_pause()
+
+            elif command == "repeat":
+                print("Repeat command received. (Implement as needed)")
+            elif command == "select":
+                if current_mode in select_mapping:
+                    select_mapping[current_mode]()
+                else:
+                    print(f"No select mapping for mode: {current_mode}")
+
+            elif command in ["scroll_up", "scroll_down"]:
+                if current_mode in list_managers:
+                    fast_scroller.repeat(list_managers[current_mode], -1 if command == "scroll_up" else 1, repeat)
+                elif current_mode in scroll_mapping[command]:
+                    scroll_mapping[command][current_mode]()
+                else:
+                    print(f"No scroll mapping for command: {command} in mode: {current_mode}")
+
+            elif command in ["letter_prev", "letter_next"]:
+                if current_mode in list_managers:
+                    fast_scroller.jump_letter(list_managers[current_mode], -1 if command == "letter_prev" else 1)
+                else:
+                    print(f"No mapping for {command} in mode: {current_mode}")
+
+            elif command == "scroll_left":
+                if current_mode in ["menu", "configmenu"]:
+                    active_menu = mode_manager.menu_manager if current_mode == "menu" else mode_manager.config_menu
+                    active_menu.scroll_selection(-1)
+                else:
+                    print(f"No mapping for scroll_left in mode: {current_mode}")
+
+            elif command == "scroll_right":
+                if current_mode in ["menu", "configmenu"]:
+                    active_menu = mode_manager.menu_manager if current_mode == "menu" else mode_manager.config_menu
+                    active_menu.scroll_selection(1)
+                else:
+                    print(f"No mapping for scroll_right in mode: {current_mode}")
+
+            elif command == "seek_plus":
+                print("Seeking forward 10 seconds.")
+                volumio_listener.seek_relative(10)
+
+            elif command == "seek_minus":
+                print("Seeking backward 10 seconds.")
+                volumio_listener.seek_relative(-10)
+
+            elif command == "skip_next":
+                print("Skipping to next track.")
+                volumio_listener.next_track()
+
+            elif command == "skip_previous":
+                print("Skipping to previous track.")
+                volumio_listener.previous_track()
+
+            elif command == "volume_plus":
+                volumio_listener.increase_volume()
+            elif command == "volume_minus":
+                volumio_listener.decrease_volume()
+            elif command == "back":
+                mode_manager.trigger("back")
+            else:
+                print(f"No mapping for command: {command}")
+
+        return handle_command
+
+
+    # Volumio transport commands get their own lane so they never hold up navigation
+    transport_commands = {"seek_plus", "seek_minus", "skip_next", "skip_previous",
+                          "volume_plus", "volume_minus", "toggle"}
+    command_server = CommandServer(
+        build_command_handler(mode_manager, volumio_listener),
+        initial_mode=mode_manager.get_mode(),
+        lane_for=lambda command: "transport" if command in transport_commands else "ui"
+    )
+    mode_manager.add_mode_listener(command_server.broadcast_mode)
+    command_server.start()
+    print("Quadify command server started.")
 
 
 
@@ -492,6 +543,7 @@ def main():
         rotary_control.stop()
         volumio_listener.stop_listener()
         clock.stop()
+        manager_factory.stop()
         display_manager.clear_screen()
         logger.info("Quadify shut down gracefully.")
 
@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 import logging
 import threading
 
+# Volumio state fields shown by the menu managers' update_song_info()
+SONG_INFO_FIELDS = ("service", "samplerate", "bitdepth", "volume")
+
 class SingletonMeta(type):
     """
     A thread-safe implementation of Singleton.
@@ -0,0 +1,144 @@
+# src/managers/dwell_prefetcher.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from managers.timer_scheduler import scheduler
+
+
+class DwellPrefetcher:
+    """
+    Loads what the highlighted menu item would open before it is selected.
+
+    Managers call on_selection(key) whenever the highlight moves. Once the
+    highlight has rested on the same key for `dwell` seconds, `fetch(key)` is
+    run on a background thread. Moving again before then restarts the wait,
+    so a fast scroll through a long list costs nothing.
+
+    At most one fetch runs at a time; if the highlight settles somewhere else
+    while one is running, only the newest key is queued behind it (anything
+    in between is dropped). `fetch` may return the result directly or a
+    Future, which is waited on for up to `timeout` seconds.
+
+    With `max_entries` > 0 results are also kept here (least recently used
+    first, for `ttl` seconds) and handed out by get(); managers whose fetch
+    fills a cache of its own (VolumioListener.browse_cache) leave it at 0.
+    """
+
+    def __init__(self, fetch, dwell=0.35, max_entries=0, ttl=120, timeout=10.0, name="DwellPrefetcher",
+                 worker_idle=30.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.fetch = fetch
+        self.dwell = dwell
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.timeout = timeout
+        self.name = name
+        self.worker_idle = worker_idle  # seconds the worker waits for work before exiting
+
+        self.lock = threading.Condition()
+        self.timer = None
+        self.pending = None      # newest key waiting for the worker
+        self.in_flight = None    # key the worker is fetching
+        self.worker = None
+        self.entries = OrderedDict()  # key -> (result, stored_at)
+
+    # ------------------------------------------------------------------
+    #   Selection
+    # ------------------------------------------------------------------
+    def on_selection(self, key):
+        """The highlight moved to `key` (None for an item with nothing to prefetch)."""
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            if key is None or key == self.in_flight or self._cached(key):
+                return
+            self.timer = scheduler.call_later(self.dwell, self._dwelled, key)
+
+    def cancel(self):
+        """Forget the queued key and any pending dwell (e.g. when the mode stops)."""
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            self.pending = None
+
+    def _dwelled(self, key):
+        with self.lock:
+            self.timer = None
+            if key == self.in_flight:
+                return
+            self.pending = key
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._run, daemon=True)
+                self.worker.start()
+            self.lock.notify()
+
+    # ------------------------------------------------------------------
+    #   Worker
+    # ------------------------------------------------------------------
+    def _run(self):
+        # Exits when idle so it doesn't keep an unused manager (and its fetch) alive
+        while True:
+            with self.lock:
+                if self.pending is None:
+                    self.lock.wait(self.worker_idle)
+                if self.pending is None:
+                    self.worker = None
+                    return
+                key, self.pending = self.pending, None
+                self.in_flight = key
+
+            started = time.monotonic()
+            try:
+                result = self.fetch(key)
+                if isinstance(result, Future):
+                    result = result.result(timeout=self.timeout)
+                self.logger.debug(f"{self.name}: prefetched {key} in {(time.monotonic() - started) * 1000:.0f} ms")
+                if result is not None:
+                    self.put(key, result)
+            except Exception as e:
+                self.logger.debug(f"{self.name}: prefetch of {key} failed => {e}")
+            finally:
+                with self.lock:
+                    self.in_flight = None
+
+    # ------------------------------------------------------------------
+    #   Results
+    # ------------------------------------------------------------------
+    def get(self, key):
+        """A prefetched result for `key`, or None."""
+        with self.lock:
+            entry = self._cached(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def invalidate(self):
+        with self.lock:
+            self.entries.clear()
+
+    def _cached(self, key):
+        """The live entry for `key`, dropping it if expired. Call with the lock held."""
+        entry = self.entries.get(key)
+        if entry is not None and time.monotonic() - entry[1] > self.ttl:
+            del self.entries[key]
+            return None
+        return entry
+
+    def put(self, key, result):
+        """Keeps a result fetched elsewhere so a later get() can reuse it."""
+        if not self.max_entries:
+            return
+        with self.lock:
+            self.entries[key] = (result, time.monotonic())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
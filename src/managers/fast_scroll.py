@@ -0,0 +1,197 @@
+# src/managers/fast_scroll.py
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+
+from PIL import ImageFont
+
+from managers.timer_scheduler import scheduler
+
+# Lists shorter than this always move one item per step
+MIN_ACCELERATED_LENGTH = 40
+
+# (detents per second, fraction of the list per detent, minimum items per detent)
+ROTATION_TIERS = (
+    (8.0, 1 / 400, 2),
+    (15.0, 1 / 150, 4),
+    (25.0, 1 / 40, 8),
+)
+
+# Same idea for a held IR key, keyed on LIRC's repeat count (~9 repeats a second)
+REPEAT_TIERS = (
+    (10, 1 / 400, 2),
+    (20, 1 / 150, 4),
+    (30, 1 / 40, 8),
+)
+HOLD_DELAY_REPEATS = 3  # repeats ignored before a held key starts scrolling
+
+
+def initial(item):
+    """Upper-cased first letter of an item's title; digits and symbols are '#'."""
+    title = item if isinstance(item, str) else (item.get("title") or "")
+    for ch in title:
+        if ch.isalpha():
+            return ch.upper()
+        if ch.isalnum():
+            return "#"
+    return "#"
+
+
+def step_for(tiers, level, list_length):
+    step = 1
+    for threshold, fraction, minimum in tiers:
+        if level >= threshold:
+            step = max(minimum, int(list_length * fraction))
+    return step
+
+
+class ScrollAccelerator:
+    """
+    Turns rotary detents into list steps that grow with rotation speed.
+
+    The speed is the number of detents in the same direction within the last
+    `window` seconds; reversing or pausing starts again at one item per detent.
+    """
+
+    def __init__(self, window=0.5):
+        self.window = window
+        self.times = deque()
+        self.direction = 0
+
+    def step(self, direction, list_length):
+        now = time.monotonic()
+        if direction != self.direction:
+            self.times.clear()
+            self.direction = direction
+        self.times.append(now)
+        while self.times and now - self.times[0] > self.window:
+            self.times.popleft()
+
+        if list_length < MIN_ACCELERATED_LENGTH:
+            return 1
+        return step_for(ROTATION_TIERS, len(self.times) / self.window, list_length)
+
+
+class LetterIndex:
+    """Offsets at which the first letter of the titles changes - the letter sections of a sorted list."""
+
+    def __init__(self, items):
+        self.starts = []
+        self.letters = []
+        previous = None
+        for offset, item in enumerate(items):
+            letter = initial(item)
+            if letter != previous:
+                self.starts.append(offset)
+                self.letters.append(letter)
+                previous = letter
+
+    def jump(self, index, direction):
+        """Start of the next (direction > 0) or current/previous section from `index`."""
+        if not self.starts:
+            return index
+        if direction > 0:
+            position = bisect.bisect_right(self.starts, index)
+            return self.starts[position] if position < len(self.starts) else index
+        position = bisect.bisect_left(self.starts, index) - 1
+        return self.starts[max(0, position)]
+
+
+class FastScroller:
+    """
+    Accelerated scrolling and letter jumps for the list managers.
+
+    Works with any manager exposing `current_menu_items`,
+    `current_selection_index`, `scroll_selection(delta)` and `display_menu()`.
+    Whenever a move skips items, the first letter of the item landed on is
+    shown over the menu for `overlay_duration` seconds, so the user can see
+    where in the alphabet they are.
+    """
+
+    def __init__(self, display_manager, overlay_duration=0.8):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.display_manager = display_manager
+        self.overlay_duration = overlay_duration
+        self.accelerator = ScrollAccelerator()
+
+        self.lock = threading.Lock()
+        self.overlay_timer = None
+        self.letter_index = None
+        self.letter_index_key = None  # (id, length) of the list letter_index was built for
+
+    # ------------------------------------------------------------------
+    #   Inputs
+    # ------------------------------------------------------------------
+    def rotate(self, manager, direction):
+        """One rotary detent."""
+        step = self.accelerator.step(direction, len(manager.current_menu_items))
+        self._move(manager, direction * step, show_letter=step > 1)
+
+    def repeat(self, manager, direction, repeat=0):
+        """An IR up/down key; `repeat` is LIRC's repeat count while it is held."""
+        if repeat == 0:
+            self._move(manager, direction, show_letter=False)
+        elif repeat >= HOLD_DELAY_REPEATS:
+            step = 1
+            if len(manager.current_menu_items) >= MIN_ACCELERATED_LENGTH:
+                step = step_for(REPEAT_TIERS, repeat, len(manager.current_menu_items))
+            self._move(manager, direction * step, show_letter=step > 1)
+
+    def jump_letter(self, manager, direction):
+        """Moves to the next / previous letter section."""
+        items = manager.current_menu_items
+        index = self._letter_index(items).jump(manager.current_selection_index, direction)
+        self._move(manager, index - manager.current_selection_index, show_letter=True)
+
+    # ------------------------------------------------------------------
+    #   Moving
+    # ------------------------------------------------------------------
+    def _letter_index(self, items):
+        key = (id(items), len(items))
+        with self.lock:
+            if key != self.letter_index_key:
+                self.letter_index = LetterIndex(items)
+                self.letter_index_key = key
+            return self.letter_index
+
+    def _move(self, manager, delta, show_letter):
+        items = manager.current_menu_items
+        if not items or not delta:
+            return
+        if show_letter:
+            target = max(0, min(manager.current_selection_index + delta, len(items) - 1))
+            self._show_letter(manager, initial(items[target]))
+        manager.scroll_selection(delta)
+
+    # ------------------------------------------------------------------
+    #   Letter Overlay
+    # ------------------------------------------------------------------
+    def _show_letter(self, manager, letter):
+        def draw_letter(draw_obj):
+            width, height = self.display_manager.oled.width, self.display_manager.oled.height
+            font = self.display_manager.fonts.get('playback_medium', ImageFont.load_default())
+            box = (width - 44, height // 2 - 18, width - 8, height // 2 + 18)
+            draw_obj.rectangle(box, fill="black", outline="white")
+            draw_obj.text(((box[0] + box[2]) // 2, (box[1] + box[3]) // 2), letter,
+                          font=font, fill="white", anchor="mm")
+
+        with self.lock:
+            if self.overlay_timer:
+                self.overlay_timer.cancel()
+            self.display_manager.overlay = draw_letter
+            self.overlay_timer = scheduler.call_later_blocking(self.overlay_duration, self._hide_letter,
+                                                               manager, draw_letter)
+
+    def _hide_letter(self, manager, draw_letter):
+        with self.lock:
+            if self.display_manager.overlay is not draw_letter:
+                return
+            self.display_manager.overlay = None
+            self.overlay_timer = None
+        if manager.is_active:
+            manager.display_menu()
@@ -0,0 +1,107 @@
+# src/managers/lazy_component.py
+
+import logging
+import threading
+import time
+
+
+class LazyComponent:
+    """
+    Stands in for a manager or screen that has not been built yet.
+
+    ModeManager holds one of these where it used to hold the object itself.
+    The first attribute access (start_mode, select_item, ...) calls `create`
+    and forwards to the result from then on, so nothing is imported,
+    constructed or subscribed to Volumio until its mode is actually used.
+
+    Two kinds of access never build it: `is_active` (ModeManager polls it
+    for every component on each mode change) reads False, and the stop
+    calls in `IDLE_NOOPS` do nothing, since an unbuilt component has nothing
+    to stop.
+
+    release() drops the built object again if it is inactive and not the
+    current mode; the next access builds a fresh one.
+    """
+
+    IDLE_NOOPS = ("stop_mode", "stop_screensaver")
+
+    __slots__ = ("_name", "_create", "_modes", "_lock", "_instance", "_last_used", "_logger")
+
+    def __init__(self, name, create, modes=()):
+        """
+        :param name:    Label for the logs (e.g. "tidal_manager")
+        :param create:  Callable returning the real object
+        :param modes:   ModeManager states in which the object is in use
+        """
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_create", create)
+        object.__setattr__(self, "_modes", tuple(modes))
+        object.__setattr__(self, "_lock", threading.RLock())
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_last_used", 0.0)
+        object.__setattr__(self, "_logger", logging.getLogger(self.__class__.__name__))
+        self._logger.setLevel(logging.INFO)
+
+    # ------------------------------------------------------------------
+    #   Building
+    # ------------------------------------------------------------------
+    @property
+    def built(self):
+        return self._instance is not None
+
+    @property
+    def instance(self):
+        """The real object, building it if needed."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    started = time.monotonic()
+                    instance = self._create()
+                    object.__setattr__(self, "_instance", instance)
+                    self._logger.info(f"LazyComponent: built {self._name} in "
+                                      f"{(time.monotonic() - started) * 1000:.0f} ms")
+        object.__setattr__(self, "_last_used", time.monotonic())
+        return instance
+
+    def __getattr__(self, attr):
+        # Only reached for names not defined on the proxy itself
+        instance = self._instance
+        if instance is None:
+            if attr == "is_active":
+                return False
+            if attr in self.IDLE_NOOPS:
+                return lambda *args, **kwargs: None
+        return getattr(self.instance, attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self.instance, attr, value)
+
+    def __repr__(self):
+        state = "built" if self._instance is not None else "not built"
+        return f"<LazyComponent {self._name} ({state})>"
+
+    # ------------------------------------------------------------------
+    #   Releasing
+    # ------------------------------------------------------------------
+    def idle_for(self):
+        """Seconds since the built object was last used, or None if it isn't built."""
+        if self._instance is None:
+            return None
+        return time.monotonic() - self._last_used
+
+    def release(self, current_mode=None):
+        """
+        Drops the built object unless it is active or `current_mode` is one of
+        its modes. Its Volumio signal handlers are weak references and go with it.
+        """
+        with self._lock:
+            instance = self._instance
+            if instance is None:
+                return False
+            if getattr(instance, "is_active", False) or current_mode in self._modes:
+                return False
+            object.__setattr__(self, "_instance", None)
+        self._logger.info(f"LazyComponent: released idle {self._name}")
+        return True
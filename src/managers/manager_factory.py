@@ -1,6 +1,10 @@
 # src/managers/manager_factory.py
 
+import gc
 import logging
+import threading
+
+from managers.lazy_component import LazyComponent
 
 
 class ManagerFactory:
@@ -8,17 +12,26 @@ class ManagerFactory:
     Responsible for creating and configuring all screens/managers needed by Quadify (Volumio edition).
     """
 
-    def __init__(self, display_manager, volumio_listener, mode_manager, config):
+    def __init__(self, display_manager, volumio_listener, mode_manager, config, library_index=None):
         """
         :param display_manager:   DisplayManager instance
         :param volumio_listener:  VolumioListener instance
         :param mode_manager:      ModeManager instance (to be set with created managers/screens)
         :param config:            Merged config dict from YAML, etc.
+        :param library_index:     LibraryIndex shared by the library managers, or None
         """
         self.display_manager   = display_manager
         self.volumio_listener  = volumio_listener
         self.mode_manager      = mode_manager
         self.config            = config
+        self.library_index     = library_index
+
+        # LazyComponent handles, and the thread that releases idle ones
+        self.lazy              = True
+        self.idle_release      = 0
+        self.components        = []
+        self.stop_event        = threading.Event()
+        self.release_thread    = None
 
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
@@ -27,37 +40,44 @@ class ManagerFactory:
     def setup_mode_manager(self):
         """
         Create and configure all managers/screens, then assign them to ModeManager (or other places).
+
+        With lazy_components enabled (the default) ModeManager gets LazyComponent
+        handles instead, and each object is built the first time its mode is used.
         """
-        # ----- Create each object -----
+        lazy_cfg = self.config.get('lazy_components', {})
+        self.lazy = lazy_cfg.get('enabled', True)
+        self.idle_release = lazy_cfg.get('idle_release_minutes', 10) * 60
+
+        # ----- Create each object (or its handle) -----
 
         # Quadify "menu" managers
-        menu_manager         = self.create_menu_manager()
-        tidal_manager        = self.create_tidal_manager()
-        qobuz_manager        = self.create_qobuz_manager()
-        playlist_manager     = self.create_playlist_manager()
-        motherearth_manager  = self.create_motherearth_manager()
-        radioparadise_manager = self.create_radioparadise_manager()
-        radio_manager        = self.create_radio_manager()
-        spotify_manager      = self.create_spotify_manager()
-        library_manager      = self.create_library_manager()
-        usb_library_manager  = self.create_usb_library_manager()
+        menu_manager         = self.component("menu_manager", self.create_menu_manager, "menu")
+        tidal_manager        = self.component("tidal_manager", self.create_tidal_manager, "tidal")
+        qobuz_manager        = self.component("qobuz_manager", self.create_qobuz_manager, "qobuz")
+        playlist_manager     = self.component("playlist_manager", self.create_playlist_manager, "playlists")
+        motherearth_manager  = self.component("motherearth_manager", self.create_motherearth_manager, "motherearthradio")
+        radioparadise_manager = self.component("radioparadise_manager", self.create_radioparadise_manager, "radioparadise")
+        radio_manager        = self.component("radio_manager", self.create_radio_manager, "radiomanager")
+        spotify_manager      = self.component("spotify_manager", self.create_spotify_manager, "spotify")
+        library_manager      = self.component("library_manager", self.create_library_manager, "library")
+        usb_library_manager  = self.component("usb_library_manager", self.create_usb_library_manager, "usblibrary")
 
         # Quoode/Quadify common screens
-        webradio_screen      = self.create_webradio_screen()
-        modern_screen        = self.create_modern_screen()
-        minimal_screen        = self.create_minimal_screen()
-        original_screen      = self.create_original_screen()
-        airplay_screen      = self.create_airplay_screen()
+        webradio_screen      = self.component("webradio_screen", self.create_webradio_screen, "webradio")
+        modern_screen        = self.component("modern_screen", self.create_modern_screen, "modern")
+        minimal_screen        = self.component("minimal_screen", self.create_minimal_screen, "minimal")
+        original_screen      = self.component("original_screen", self.create_original_screen, "original")
+        airplay_screen      = self.component("airplay_screen", self.create_airplay_screen, "airplay")
 
         # Additional items referenced by new ModeManager states
-        config_menu          = self.create_config_menu()
-        clock_menu           = self.create_clock_menu()
-        remote_menu           = self.create_remote_menu()
-        display_menu         = self.create_display_menu()
-        screensaver_menu     = self.create_screensaver_menu()
-        screensaver          = self.create_screensaver()
-        system_info_screen   = self.create_system_info_screen()
-        system_update_menu   = self.create_system_update_menu()
+        config_menu          = self.component("config_menu", self.create_config_menu, "configmenu")
+        clock_menu           = self.component("clock_menu", self.create_clock_menu, "clockmenu")
+        remote_menu           = self.component("remote_menu", self.create_remote_menu, "remotemenu")
+        display_menu         = self.component("display_menu", self.create_display_menu, "displaymenu")
+        screensaver_menu     = self.component("screensaver_menu", self.create_screensaver_menu, "screensavermenu")
+        screensaver          = self.component("screensaver", self.create_screensaver, "screensaver")
+        system_info_screen   = self.component("system_info_screen", self.create_system_info_screen, "systeminfo")
+        system_update_menu   = self.component("system_update_menu", self.create_system_update_menu, "systemupdate")
 
         # ----- Assign them to ModeManager via the set_* methods -----
         self.mode_manager.set_menu_manager(menu_manager)
@@ -88,6 +108,53 @@ class ManagerFactory:
 
         self.logger.info("ManagerFactory: ModeManager fully configured with managers & screens.")
 
+        if self.lazy and self.idle_release > 0:
+            self.release_thread = threading.Thread(target=self._release_idle_loop, daemon=True)
+            self.release_thread.start()
+
+    # ----------------------------------------------------------------
+    #  Lazy construction
+    # ----------------------------------------------------------------
+
+    def component(self, name, create, *modes):
+        """Returns a LazyComponent for `create`, or the built object when lazy construction is off."""
+        if not self.lazy:
+            return create()
+        handle = LazyComponent(name, create, modes)
+        self.components.append(handle)
+        return handle
+
+    def release_idle(self):
+        """Drops built components that have been unused for longer than idle_release."""
+        current_mode = self.mode_manager.get_mode()
+        released = 0
+        for handle in self.components:
+            idle = handle.idle_for()
+            if idle is not None and idle > self.idle_release and handle.release(current_mode):
+                released += 1
+        if released:
+            gc.collect()
+        return released
+
+    def _release_idle_loop(self):
+        interval = max(5.0, self.idle_release / 4)
+        while not self.stop_event.wait(interval):
+            try:
+                self.release_idle()
+            except Exception as e:
+                self.logger.warning(f"ManagerFactory: idle release failed => {e}")
+
+    def set_library_index(self, library_index):
+        """Hands the library managers an index that became available after setup_mode_manager()."""
+        self.library_index = library_index
+        for manager in (self.mode_manager.library_manager, self.mode_manager.usb_library_manager):
+            if manager is not None and (not isinstance(manager, LazyComponent) or manager.built):
+                manager.library_index = library_index
+
+    def stop(self):
+        self.stop_event.set()
+
+
     # ----------------------------------------------------------------
     #  Create Methods for each manager/screen
     # ----------------------------------------------------------------
@@ -176,7 +243,8 @@ class ManagerFactory:
         return LibraryManager(
             display_manager   = self.display_manager,
             volumio_config    = self.config.get('volumio', {}),
-            mode_manager      = self.mode_manager
+            mode_manager      = self.mode_manager,
+            library_index     = self.library_index
         )
 
     def create_usb_library_manager(self):
@@ -184,7 +252,8 @@ class ManagerFactory:
         return USBLibraryManager(
             display_manager   = self.display_manager,
             volumio_listener  = self.volumio_listener,
-            mode_manager      = self.mode_manager
+            mode_manager      = self.mode_manager,
+            library_index     = self.library_index
         )
 
     def create_webradio_screen(self):
@@ -275,6 +344,13 @@ class ManagerFactory:
             )
 
 
+        elif screensaver_type == "gif":
+            from display.screensavers.gif_screensaver import GifScreensaver
+            self.logger.info("ManagerFactory: Using GifScreensaver.")
+            return GifScreensaver(
+                display_manager=self.display_manager
+            )
+
         elif screensaver_type in ("quadify", "bouncing_text"):
             from display.screensavers.bouncing_text_screensaver import BouncingTextScreensaver
             self.logger.info("ManagerFactory: Using BouncingTextScreensaver.")
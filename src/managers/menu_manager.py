@@ -25,20 +25,20 @@ class MenuManager:
         self.library_menu_items = ["NAS", "USB"]
         self.display_menu_items = ["Display", "Screensavers", "Clock", "Contrast"]
         self.icons = {
-            "Stream": self.display_manager.icons.get("stream"),
-            "Library": self.display_manager.icons.get("library"),
-            "Radio": self.display_manager.icons.get("webradio"),
-            "RadioP": self.display_manager.icons.get("radio_paradise"),
-            "MotherE": self.display_manager.icons.get("motherearthradio"),
-            "Playlists": self.display_manager.icons.get("playlists"),
-            "Tidal": self.display_manager.icons.get("tidal"),
-            "Qobuz": self.display_manager.icons.get("qobuz"),
-            "Spotify": self.display_manager.icons.get("spop"),
-            "NAS": self.display_manager.icons.get("nas"), 
-            "USB": self.display_manager.icons.get("usb"),
-            "Config": self.display_manager.icons.get("config"),
-            "Original": self.display_manager.icons.get("display"),
-            "Modern": self.display_manager.icons.get("display")
+            "Stream": "stream",
+            "Library": "library",
+            "Radio": "webradio",
+            "RadioP": "radio_paradise",
+            "MotherE": "motherearthradio",
+            "Playlists": "playlists",
+            "Tidal": "tidal",
+            "Qobuz": "qobuz",
+            "Spotify": "spop",
+            "NAS": "nas", 
+            "USB": "usb",
+            "Config": "config",
+            "Original": "display",
+            "Modern": "display"
         }
         self.current_selection_index = 0
         self.is_active = False
@@ -109,16 +109,7 @@ class MenuManager:
             # Iterate over visible items to draw icons
             for i, item in enumerate(visible_items):
                 actual_index = self.window_start_index + i
-                icon = self.icons.get(item, self.display_manager.default_icon)
-
-                # Handle transparency for icons with an alpha channel
-                if icon.mode == "RGBA":
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-
-                # Resize the icon with anti-aliasing
-                icon = icon.resize((icon_size, icon_size), Image.ANTIALIAS)
+                icon = self.display_manager.get_icon(self.icons.get(item), icon_size, use_default=True)
 
                 # Calculate x-coordinate for the current icon
                 x = x_offset + i * (icon_size + spacing)
@@ -37,12 +37,12 @@ class ConfigMenu(BaseManager):
         # Map each menu item to an icon.
         # The keys for display_manager.icons should match your asset names.
         self.icons = {
-            "Display": self.display_manager.icons.get("displaysettings"),
-            "Clock": self.display_manager.icons.get("clocksettings"),
-            "Screen+": self.display_manager.icons.get("screensaversettings"),
-            "System": self.display_manager.icons.get("systeminfo"),
-            "Update": self.display_manager.icons.get("systemupdate"),
-            "Back": self.display_manager.icons.get("back")  # Use an appropriate icon
+            "Display": "displaysettings",
+            "Clock": "clocksettings",
+            "Screen+": "screensaversettings",
+            "System": "systeminfo",
+            "Update": "systemupdate",
+            "Back": "back"  # Use an appropriate icon
         }
 
     def get_visible_window(self, items, window_size):
@@ -96,16 +96,7 @@ class ConfigMenu(BaseManager):
             # Iterate over visible items and draw icons with labels
             for i, item in enumerate(visible_items):
                 actual_index = self.window_start_index + i
-                icon = self.icons.get(item, self.display_manager.default_icon)
-
-                # Handle transparency if the icon is RGBA
-                if icon.mode == "RGBA":
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-
-                # Resize the icon
-                icon = icon.resize((icon_size, icon_size), Image.ANTIALIAS)
+                icon = self.display_manager.get_icon(self.icons.get(item), icon_size, use_default=True)
 
                 # Calculate the x-coordinate for this icon
                 x = x_offset + i * (icon_size + spacing)
@@ -11,11 +11,52 @@ from urllib.parse import quote
 from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont
 from managers.base_manager import BaseManager  # Adjust import based on your project structure
+from managers.dwell_prefetcher import DwellPrefetcher
+from managers.timer_scheduler import scheduler
+
+FOLDER_TYPES = ("folder", "streaming-category", "streaming-folder", "remdisk")
+PAGE_SIZE = 200  # folder entries converted per step; the menu is drawn after the first
+
+
+class LibraryItem:
+    """
+    One entry of a browsed folder. NAS folders can hold thousands of these,
+    so they are slotted records rather than dicts; get()/[]/in keep the
+    dict-style access the menu code (and the option submenus) use.
+    """
+
+    __slots__ = ("title", "uri", "type", "service", "albumart")
+
+    def __init__(self, entry):
+        self.title = entry.get("title", "Untitled")
+        self.uri = entry.get("uri", "")
+        self.type = entry.get("type", "").lower()
+        self.service = entry.get("service", "").lower()
+        self.albumart = entry.get("albumart", None)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __repr__(self):
+        return f"LibraryItem(title={self.title!r}, uri={self.uri!r}, type={self.type!r})"
+
 
 class LibraryManager(BaseManager):
-    def __init__(self, display_manager, volumio_config, mode_manager, window_size=3, y_offset=0, line_spacing=16):
+    def __init__(self, display_manager, volumio_config, mode_manager, window_size=3, y_offset=0, line_spacing=16,
+                 library_index=None):
         super().__init__(display_manager, volumio_config, mode_manager)
 
+        # Local index of the library (network/library_index.py); folders it has crawled load from disk
+        self.library_index = library_index
+
         # REST API setup
         self.volumio_host = volumio_config.get('host', 'localhost')
         self.volumio_port = volumio_config.get('port', 3000)
@@ -35,6 +76,14 @@ class LibraryManager(BaseManager):
         # Thread-safety lock
         self.selection_lock = threading.Lock()
 
+        # Bumped for every navigation; a fetch thread whose generation is no
+        # longer current drops its result instead of replacing the menu
+        self.fetch_generation = 0
+
+        # Folder contents fetched while the highlight rests on them (and by the
+        # album check), so opening the folder doesn't wait on the REST call
+        self.prefetcher = DwellPrefetcher(self.load_navigation, max_entries=32, ttl=60, name="LibraryManager")
+
         # Initialize state variables
         self.current_menu_items = []
         self.current_selection_index = 0
@@ -108,8 +157,7 @@ class LibraryManager(BaseManager):
         self.logger.debug(f"LibraryManager: Mode active: {self.is_active}, Selection Index: {self.current_selection_index}, Window Start Index: {self.window_start_index}")
 
         # Start timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(3.0, self.library_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(3.0, self.library_timeout)
 
     def library_timeout(self):
         """Called when library navigation has not loaded within the timeout period."""
@@ -132,9 +180,8 @@ class LibraryManager(BaseManager):
 
             self.display_manager.draw_custom(draw)
             
-            # Automatically navigate back to the menu after 5 seconds.
-            import threading
-            threading.Timer(5.0, self.mode_manager.to_menu).start()
+            # Automatically navigate back to the menu after 5 seconds.
+            scheduler.call_later_blocking(5.0, self.mode_manager.to_menu)
 
 
     def stop_mode(self):
@@ -142,27 +189,61 @@ class LibraryManager(BaseManager):
             self.logger.debug("LibraryManager: Library mode already inactive.")
             return
         self.is_active = False
+        self.next_generation()  # a fetch still running must not draw over the next mode
+        self.prefetcher.cancel()
         self.display_manager.clear_screen()
         self.logger.info("LibraryManager: Stopped Library mode and cleared display.")
 
+    def request_navigation(self, uri):
+        """GETs the browse result for `uri`; returns its navigation dict, or None on a non-200 reply."""
+        response = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(uri)}")
+        self.logger.debug(f"LibraryManager: Received Status Code: {response.status_code} for URI: {uri}")
+        if response.status_code != 200:
+            self.logger.error(f"LibraryManager: Failed to fetch data for {uri}. Status Code: {response.status_code}")
+            return None
+        navigation = response.json().get("navigation", {})
+        self.prefetcher.put(uri, navigation)
+        return navigation
+
+    def load_navigation(self, uri):
+        """Navigation for `uri` from the library index if it has the folder, else from Volumio."""
+        if self.library_index is not None:
+            items = self.library_index.children(uri)
+            if items is not None:
+                self.logger.debug(f"LibraryManager: Serving {uri} from the library index.")
+                self.library_index.refresh(uri)
+                return {"lists": [{"items": items}]}
+        return self.request_navigation(uri)
+
+    def get_navigation(self, uri):
+        """Navigation for `uri`, taken from the prefetch cache when it is there."""
+        navigation = self.prefetcher.get(uri)
+        if navigation is not None:
+            self.logger.debug(f"LibraryManager: Using prefetched navigation for URI: {uri}")
+            return navigation
+        return self.load_navigation(uri)
+
+    def next_generation(self):
+        with self.selection_lock:
+            self.fetch_generation += 1
+            return self.fetch_generation
+
     def fetch_navigation(self, uri):
-        """Fetch navigation data dynamically for any folder in the music library."""
+        """Fetch navigation data for any folder in the music library on a worker thread."""
         self.logger.info(f"LibraryManager: Fetching navigation data for URI: {uri}")
+        generation = self.next_generation()
+        Thread(target=self._fetch_navigation_thread, args=(uri, generation), daemon=True).start()
+
+    def _fetch_navigation_thread(self, uri, generation):
+        """Loads `uri` and fills the menu page by page; gives up if a newer navigation started."""
         try:
-            # API request to fetch navigation data
-            response = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(uri)}")
-            self.logger.debug(f"LibraryManager: Received Status Code: {response.status_code}")
-            self.logger.debug(f"LibraryManager: Received Response: {response.text}")
-
-            # Handle non-200 status codes
-            if response.status_code != 200:
-                self.logger.error(f"LibraryManager: Failed to fetch data. Status Code: {response.status_code}")
-                self.display_error_message("Fetch Error", f"Failed to fetch data: {response.status_code}")
+            navigation = self.get_navigation(uri)
+            if generation != self.fetch_generation or not self.is_active:
+                return
+            if navigation is None:
+                self.display_error_message("Fetch Error", "Failed to fetch data.")
                 return
 
-            # Parse the response JSON
-            data = response.json()
-            navigation = data.get("navigation", {})
             lists = navigation.get("lists", [])
 
             if not lists:
@@ -177,28 +258,35 @@ class LibraryManager(BaseManager):
                 self.display_no_items()
                 return
 
-            # Update current menu items
-            self.current_menu_items = [
-                {
-                    "title": item.get("title", "Untitled"),
-                    "uri": item.get("uri", ""),
-                    "type": item.get("type", "").lower(),
-                    "service": item.get("service", "").lower(),
-                    "albumart": item.get("albumart", None)
-                }
-                for item in items
-            ]
-
-            self.logger.info(f"LibraryManager: Fetched {len(self.current_menu_items)} items for URI: {uri}")
-            if self.is_active:
-                self.display_menu()
+            menu_items = None  # the folder's list; a submenu pushed meanwhile keeps its own
+            for start in range(0, len(items), PAGE_SIZE):
+                page = [LibraryItem(item) for item in items[start:start + PAGE_SIZE]]
+                with self.selection_lock:
+                    if generation != self.fetch_generation:
+                        return
+                    if start == 0:
+                        if not self.menu_stack and self.library_index is not None:
+                            page.insert(0, {"title": "Search A-Z", "action": "search"})
+                        menu_items = self.current_menu_items = page
+                        self.current_selection_index = 0
+                        self.window_start_index = 0
+                    else:
+                        menu_items.extend(page)
+
+                # Later pages land below the window, so only the first needs drawing
+                if start == 0 and self.is_active:
+                    self.display_menu()
+
+            self.logger.info(f"LibraryManager: Fetched {len(items)} items for URI: {uri}")
 
         except ValueError as ve:
             self.logger.error(f"LibraryManager: JSON decoding failed: {ve}")
-            self.display_error_message("Fetch Error", f"Invalid response format: {ve}")
+            if generation == self.fetch_generation and self.is_active:
+                self.display_error_message("Fetch Error", f"Invalid response format: {ve}")
         except Exception as e:
             self.logger.error(f"LibraryManager: Exception occurred while fetching navigation: {str(e)}")
-            self.display_error_message("Fetch Error", f"An error occurred: {str(e)}")
+            if generation == self.fetch_generation and self.is_active:
+                self.display_error_message("Fetch Error", f"An error occurred: {str(e)}")
 
     def select_item(self):
         """Handle the selection of the current menu item."""
@@ -217,19 +305,12 @@ class LibraryManager(BaseManager):
         else:
             item_type = selected_item.get("type", "").lower()
 
-            if item_type in ["folder", "streaming-category", "streaming-folder", "remdisk"]:
-                # Check if the selected item is an album
-                if self.is_album_folder(selected_item):
-                    # Display album options (submenu)
-                    self.logger.info(f"LibraryManager: Displaying options for album: {selected_item.get('title')}")
-                    self.display_folder_or_album_options(selected_item)
-                else:
-                    # Navigate into the folder
-                    self.logger.info(f"LibraryManager: Navigating into: {selected_item.get('title')}")
-                    self.menu_stack.append(self.current_path)  # Save the current path
-                    self.current_path = selected_item.get("uri")
+            if item_type in FOLDER_TYPES:
+                # The album check needs the folder's contents; fetch them off the input thread
+                if self.prefetcher.get(selected_item.get("uri")) is None:
                     self.display_loading_screen()
-                    self.fetch_navigation(self.current_path)
+                generation = self.next_generation()
+                Thread(target=self._open_folder_thread, args=(selected_item, generation), daemon=True).start()
 
             elif item_type == "song":
                 # Play the selected song
@@ -245,6 +326,22 @@ class LibraryManager(BaseManager):
                 self.logger.warning(f"LibraryManager: Unknown item type '{item_type}'.")
                 self.display_error_message("Invalid Selection", "Selected item is not recognized.")
 
+    def _open_folder_thread(self, folder_item, generation):
+        is_album = self.is_album_folder(folder_item)
+        if generation != self.fetch_generation or not self.is_active:
+            return
+
+        if is_album:
+            # Display album options (submenu)
+            self.logger.info(f"LibraryManager: Displaying options for album: {folder_item.get('title')}")
+            self.display_folder_or_album_options(folder_item)
+        else:
+            # Navigate into the folder; its contents are cached by the album check
+            self.logger.info(f"LibraryManager: Navigating into: {folder_item.get('title')}")
+            self.menu_stack.append(self.current_path)  # Save the current path
+            self.current_path = folder_item.get("uri")
+            self.fetch_navigation(self.current_path)
+
     def is_album_folder(self, item):
         """Determine if the folder represents an album."""
         # Adjust the logic based on your folder structure
@@ -254,14 +351,13 @@ class LibraryManager(BaseManager):
             return False
 
         try:
-            # Fetch the contents of the folder
-            response = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(folder_uri)}")
-            if response.status_code != 200:
+            # Fetch the contents of the folder (usually already prefetched)
+            navigation = self.get_navigation(folder_uri)
+            if navigation is None:
                 self.logger.warning(f"LibraryManager: Failed to fetch contents for album check: {folder_uri}")
                 return False
 
-            folder_data = response.json()
-            items = folder_data.get("navigation", {}).get("lists", [{}])[0].get("items", [])
+            items = (navigation.get("lists") or [{}])[0].get("items", [])
 
             # If all items are songs, or there are no subfolders, consider it an album
             has_songs = any(item.get("type", "").lower() == "song" for item in items)
@@ -299,6 +395,20 @@ class LibraryManager(BaseManager):
             self.current_path = data.get("uri")
             self.display_loading_screen()
             self.fetch_navigation(self.current_path)
+        elif action == "search":
+            letters = self.library_index.initials()
+            if not letters:
+                self.display_error_message("Search", "Library still indexing.")
+                return
+            options = [{"title": letter, "action": "search_letter", "data": letter} for letter in letters]
+            self.push_menu(options, menu_title="Search A-Z")
+        elif action == "search_letter":
+            albums = [LibraryItem(album) for album in self.library_index.albums_starting_with(data)]
+            self.logger.info(f"LibraryManager: {len(albums)} indexed album(s) under '{data}'.")
+            if not albums:
+                self.display_no_items()
+                return
+            self.push_menu(albums, menu_title=f"Albums: {data}")
         elif action == "back":
             self.logger.info("LibraryManager: Going back to the previous menu.")
             self.pop_menu()
@@ -430,12 +540,21 @@ class LibraryManager(BaseManager):
                 )
 
         self.display_manager.draw_custom(draw)
+        self.prefetch_selection()
+
+    def prefetch_selection(self):
+        """Queues the highlighted folder's contents for prefetching."""
+        if not self.is_active or not 0 <= self.current_selection_index < len(self.current_menu_items):
+            return
+        item = self.current_menu_items[self.current_selection_index]
+        is_folder = 'action' not in item and item.get("type", "") in FOLDER_TYPES
+        self.prefetcher.on_selection(item.get("uri") if is_folder else None)
 
     def push_menu(self, menu_items, menu_title=""):
         """Push a new menu onto the stack and display it."""
-        # Save the current menu state
+        # Save the current menu state; no copy needed, a menu list isn't changed once replaced
         self.menu_stack.append({
-            "menu_items": self.current_menu_items.copy(),
+            "menu_items": self.current_menu_items,
             "selection_index": self.current_selection_index,
             "window_start_index": self.window_start_index,
             "menu_title": menu_title if menu_title else "Options"
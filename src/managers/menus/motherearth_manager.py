@@ -1,7 +1,7 @@
 from managers.base_manager import BaseManager
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 import time
 
 class MotherEarthManager(BaseManager):
@@ -84,12 +84,10 @@ class MotherEarthManager(BaseManager):
         self.fetch_stations()
 
         # Start a periodic refresh timer (e.g. every 30 seconds)
-        self.refresh_timer = threading.Timer(30.0, self.periodic_refresh)
-        self.refresh_timer.start()
+        self.refresh_timer = scheduler.call_later_blocking(30.0, self.periodic_refresh)
 
         # Start timeout timer (e.g. 5 seconds) to check if station data has been received
-        self.timeout_timer = threading.Timer(5.0, self.mother_earth_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(5.0, self.mother_earth_timeout)
 
     def mother_earth_timeout(self):
         """Called when station data hasn't loaded within the timeout period."""
@@ -111,7 +109,7 @@ class MotherEarthManager(BaseManager):
             self.display_manager.draw_custom(draw_callback)
 
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(3.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(3.0, self.mode_manager.to_menu)
 
     def periodic_refresh(self):
         """
@@ -128,13 +126,13 @@ class MotherEarthManager(BaseManager):
         else:
             self.logger.warning("MotherEarthManager: Volumio is not connected during refresh attempt.")
         # Restart the timer for the next refresh
-        self.refresh_timer = threading.Timer(30.0, self.periodic_refresh)
-        self.refresh_timer.start()
+        self.refresh_timer = scheduler.call_later_blocking(30.0, self.periodic_refresh)
 
     def stop_mode(self):
         """Deactivate Mother Earth mode and clear the display."""
         self.logger.info("MotherEarthManager: Stopping Mother Earth mode.")
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests("mer")
         self.display_manager.clear_screen()
         try:
             self.volumio_listener.navigation_received.disconnect(self.handle_navigation)
@@ -335,8 +333,7 @@ class MotherEarthManager(BaseManager):
                 current_y += text_height + 2
         self.display_manager.draw_custom(draw_callback)
         # After 3 seconds, refresh the station menu (thus clearing the toast overlay).
-        import threading
-        threading.Timer(3.0, self.display_menu).start()
+        scheduler.call_later_blocking(3.0, self.display_menu)
 
     def play_station(self, title, uri, albumart_url=None):
         """Send a command to play the selected Mother Earth station."""
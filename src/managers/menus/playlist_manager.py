@@ -1,7 +1,7 @@
-from managers.base_manager import BaseManager
+from managers.base_manager import BaseManager, SONG_INFO_FIELDS
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 
 class PlaylistManager(BaseManager):
     def __init__(self, display_manager, volumio_listener, mode_manager, window_size=4, y_offset=5, line_spacing=15):
@@ -61,21 +61,21 @@ class PlaylistManager(BaseManager):
         self.volumio_listener.toast_message_received.connect(self.handle_toast_message)
         self.logger.debug("PlaylistManager: Connected to 'navigation_received' and 'toast_message_received' signals.")
 
-        self.volumio_listener.state_changed.connect(self.handle_state_change)
+        self.volumio_listener.subscribe(self.handle_state_change, fields=SONG_INFO_FIELDS)
         self.volumio_listener.track_changed.connect(self.handle_track_change)
 
         self.display_loading_screen()
         self.fetch_navigation()  # Fetch root playlists navigation
 
         # Start a timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(5.0, self.playlist_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(5.0, self.playlist_timeout)
 
     def stop_mode(self):
         if not self.is_active:
             self.logger.debug("PlaylistManager: Playlist mode already inactive.")
             return
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests(("playlists", "playlist://"))
         self.display_manager.clear_screen()
         self.logger.info("PlaylistManager: Stopped Playlist mode and cleared display.")
 
@@ -84,7 +84,7 @@ class PlaylistManager(BaseManager):
         self.volumio_listener.toast_message_received.disconnect(self.handle_toast_message)
         self.logger.debug("PlaylistManager: Disconnected from 'navigation_received' and 'toast_message_received' signals.")
 
-        self.volumio_listener.state_changed.disconnect(self.handle_state_change)
+        self.volumio_listener.unsubscribe(self.handle_state_change)
         self.volumio_listener.track_changed.disconnect(self.handle_track_change)
 
         # Cancel the timeout timer if it's still running
@@ -178,7 +178,7 @@ class PlaylistManager(BaseManager):
                 )
             self.display_manager.draw_custom(draw)
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(3.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(3.0, self.mode_manager.to_menu)
 
     def display_loading_screen(self):
         """Show a loading screen."""
@@ -255,7 +255,7 @@ class PlaylistManager(BaseManager):
                 self.mode_manager.suppress_state_change()
                 self.volumio_listener.socketIO.emit('playPlaylist', {'name': name})
                 self.logger.info(f"PlaylistManager: Sent playPlaylist command for playlist name: {name}")
-                threading.Timer(1.0, self.mode_manager.allow_state_change).start()
+                scheduler.call_later(1.0, self.mode_manager.allow_state_change)
             except Exception as e:
                 self.logger.error(f"PlaylistManager: Failed to play playlist '{name}': {e}")
                 self.display_error_message("Playback Error", f"Could not play playlist: {e}")
@@ -1,8 +1,9 @@
 # src/managers/qobuz_manager.py
-from managers.base_manager import BaseManager
+from managers.base_manager import BaseManager, SONG_INFO_FIELDS
+from managers.dwell_prefetcher import DwellPrefetcher
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 import time
 
 class QobuzManager(BaseManager):
@@ -29,6 +30,9 @@ class QobuzManager(BaseManager):
         # Timeout timer attribute
         self.timeout_timer = None
 
+        # Loads the highlighted folder into the browse cache once the highlight settles
+        self.prefetcher = DwellPrefetcher(self.prefetch_navigation, timeout=2.0, name="QobuzManager")
+
         # Register mode change callback
         if hasattr(self.mode_manager, "add_on_mode_change_callback"):
             self.mode_manager.add_on_mode_change_callback(self.handle_mode_change)
@@ -48,15 +52,14 @@ class QobuzManager(BaseManager):
         self.volumio_listener.toast_message_received.connect(self.handle_toast_message)
         self.logger.debug("QobuzManager: Connected to 'navigation_received' and 'toast_message_received' signals.")
 
-        self.volumio_listener.state_changed.connect(self.handle_state_change)
+        self.volumio_listener.subscribe(self.handle_state_change, fields=SONG_INFO_FIELDS)
         self.volumio_listener.track_changed.connect(self.handle_track_change)
 
         self.display_loading_screen()
         self.fetch_qobuz_navigation()  # Fetch Qobuz root navigation
 
         # Start a timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(5.0, self.qobuz_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(5.0, self.qobuz_timeout)
 
     def qobuz_timeout(self):
         """Called when Qobuz navigation has not produced any menu items within the timeout period."""
@@ -78,7 +81,7 @@ class QobuzManager(BaseManager):
             self.display_manager.draw_custom(draw)
 
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(5.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(5.0, self.mode_manager.to_menu)
 
 
     def stop_mode(self):
@@ -86,6 +89,8 @@ class QobuzManager(BaseManager):
             self.logger.debug("QobuzManager: Qobuz mode already inactive.")
             return
         self.is_active = False
+        self.prefetcher.cancel()
+        self.volumio_listener.cancel_browse_requests("qobuz://")
         self.display_manager.clear_screen()
         self.logger.info("QobuzManager: Stopped Qobuz mode and cleared display.")
 
@@ -94,7 +99,7 @@ class QobuzManager(BaseManager):
         self.volumio_listener.toast_message_received.disconnect(self.handle_toast_message)
         self.logger.debug("QobuzManager: Disconnected from 'navigation_received' and 'toast_message_received' signals.")
 
-        self.volumio_listener.state_changed.disconnect(self.handle_state_change)
+        self.volumio_listener.unsubscribe(self.handle_state_change)
         self.volumio_listener.track_changed.disconnect(self.handle_track_change)
 
         # Cancel the timeout timer if it's still running
@@ -240,6 +245,21 @@ class QobuzManager(BaseManager):
                 )
 
         self.display_manager.draw_custom(draw)
+        self.prefetch_selection()
+
+    def prefetch_selection(self):
+        """Queues the highlighted item's contents for prefetching; songs have none."""
+        if not self.is_active or not 0 <= self.current_selection_index < len(self.current_menu_items):
+            return
+        item = self.current_menu_items[self.current_selection_index]
+        uri = item.get("uri")
+        if not uri or uri.startswith("qobuz://song/") or item.get("type", "").lower() == "song":
+            uri = None
+        self.prefetcher.on_selection(uri)
+
+    def prefetch_navigation(self, uri):
+        # Short timeout: a selection made meanwhile is held until this is answered
+        return self.volumio_listener.fetch_browse_library(uri, quiet=True, timeout=self.prefetcher.timeout)
 
     def scroll_selection(self, direction):
         """Scroll through the menu items."""
@@ -296,7 +316,7 @@ class QobuzManager(BaseManager):
                 self.logger.info(f"QobuzManager: Sent replaceAndPlay command for '{song_title}' to Volumio.")
 
                 # Allow state changes after a short delay
-                threading.Timer(1.0, self.mode_manager.allow_state_change).start()
+                scheduler.call_later(1.0, self.mode_manager.allow_state_change)
             except Exception as e:
                 self.logger.error(f"QobuzManager: Failed to play track {uri}: {e}")
                 self.display_error_message("Playback Error", f"Could not play track: {e}")
@@ -1,9 +1,9 @@
 # src/managers/radio_manager.py
 
 from managers.base_manager import BaseManager
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 import time
 
 
@@ -97,11 +97,24 @@ class RadioManager(BaseManager):
             self.logger.warning("RadioManager: Mode is already inactive.")
             return
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests("radio")
         self.display_manager.clear_screen()
 
         # Disconnect signals
         self.disconnect_signals()
 
+    @property
+    def current_menu_items(self):
+        """Items of the menu being shown: category names or station dicts."""
+        return self.categories if self.current_menu == "categories" else self.stations
+
+    def display_menu(self):
+        """Redraw whichever menu is showing."""
+        if self.current_menu == "categories":
+            self.display_categories()
+        elif self.current_menu == "stations":
+            self.display_radio_stations()
+
     def display_categories(self):
         """Display radio categories."""
         self.logger.info("RadioManager: Displaying categories.")
@@ -294,44 +307,29 @@ class RadioManager(BaseManager):
             self.logger.warning("RadioManager: Scroll attempted while inactive.")
             return
 
-        current_time = time.time()
-        if current_time - self.last_action_time < self.debounce_interval:
-            self.logger.debug("RadioManager: Scroll action ignored due to debounce.")
-            return
-        self.last_action_time = current_time
-
-        if self.current_menu == "categories":
-            options = self.categories
-        elif self.current_menu == "stations":
-            options = [station['title'] for station in self.stations]
-        else:
+        # No debounce here: rotary and IR input are debounced upstream, and FastScroller
+        # sends several steps a second while the dial spins or a remote key is held
+        if self.current_menu not in ("categories", "stations"):
             self.logger.warning("RadioManager: Unknown menu state.")
             return
 
+        options = self.current_menu_items
         if not options:
             self.logger.warning("RadioManager: No options available to scroll.")
             return
 
         previous_index = self.current_selection_index
 
-        # Ensure direction is an integer and handle scroll up/down correctly
-        if isinstance(direction, int) and direction > 0:  # Scroll down
-            if self.current_selection_index < len(options) - 1:
-                self.current_selection_index += 1
-        elif isinstance(direction, int) and direction < 0:  # Scroll up
-            if self.current_selection_index > 0:
-                self.current_selection_index -= 1
-        else:
+        # Direction is a signed number of items (more than one when fast-scrolling)
+        if not isinstance(direction, int) or direction == 0:
             self.logger.warning("RadioManager: Invalid scroll direction provided.")
             return
+        self.current_selection_index = max(0, min(self.current_selection_index + direction, len(options) - 1))
 
         # Update the window based on the new selection
         if previous_index != self.current_selection_index:
             self.logger.debug(f"RadioManager: Scrolled to index: {self.current_selection_index}")
-            if self.current_menu == "categories":
-                self.display_categories()
-            elif self.current_menu == "stations":
-                self.display_radio_stations()
+            self.display_menu()
         else:
             self.logger.debug("RadioManager: Reached the end/start of the list. Scroll input ignored.")
 
@@ -498,7 +496,7 @@ class RadioManager(BaseManager):
                     self.logger.info(f"RadioManager: Sent replaceAndPlay command with URI: {uri}")
 
                     # Allow state changes after a short delay
-                    threading.Timer(1.0, self.mode_manager.allow_state_change).start()
+                    scheduler.call_later(1.0, self.mode_manager.allow_state_change)
                     self.logger.debug("RadioManager: Allowed state changes after delay.")
                 except Exception as e:
                     self.logger.error(f"RadioManager: Failed to emit replaceAndPlay - {e}")
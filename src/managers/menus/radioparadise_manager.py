@@ -1,7 +1,7 @@
 from managers.base_manager import BaseManager
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 import time
 
 class RadioParadiseManager(BaseManager):
@@ -75,8 +75,7 @@ class RadioParadiseManager(BaseManager):
         self.fetch_stations()
 
         # Start timeout timer (e.g. 5 seconds) to check if station data has been received
-        self.timeout_timer = threading.Timer(3.0, self.radio_paradise_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(3.0, self.radio_paradise_timeout)
 
     def radio_paradise_timeout(self):
         """Called when station data hasn't loaded within the timeout period."""
@@ -98,12 +97,13 @@ class RadioParadiseManager(BaseManager):
             self.display_manager.draw_custom(draw_callback)
 
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(3.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(3.0, self.mode_manager.to_menu)
 
     def stop_mode(self):
         """Deactivate Radio Paradise mode and clear the display."""
         self.logger.info("RadioParadiseManager: Stopping Radio Paradise mode.")
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests("rparadise")
         self.display_manager.clear_screen()
         try:
             self.volumio_listener.navigation_received.disconnect(self.handle_navigation)
@@ -304,9 +304,8 @@ class RadioParadiseManager(BaseManager):
                 draw_obj.text((x, current_y), line, font=self.font, fill="white")
                 current_y += text_height + 2
         self.display_manager.draw_custom(draw_callback)
-        # After 5 seconds, refresh the station menu to remove the toast overlay.
-        import threading
-        threading.Timer(5.0, self.display_menu).start()
+        # After 5 seconds, refresh the station menu to remove the toast overlay.
+        scheduler.call_later_blocking(5.0, self.display_menu)
 
     def play_station(self, title, uri, albumart_url=None):
         """Send a command to play the selected Radio Paradise station and force an immediate state update."""
@@ -329,9 +328,8 @@ class RadioParadiseManager(BaseManager):
                 self.volumio_listener.socketIO.emit('replaceAndPlay', payload)
                 self.logger.info("RadioParadiseManager: Sent replaceAndPlay command.")
                 
-                # Allow state changes after 1 second to let Volumio update properly
-                import threading
-                threading.Timer(1.0, self.mode_manager.allow_state_change).start()
+                # Allow state changes after 1 second to let Volumio update properly
+                scheduler.call_later(1.0, self.mode_manager.allow_state_change)
                 self.logger.debug("RadioParadiseManager: Scheduled allow_state_change after delay.")
             else:
                 self.logger.error("RadioParadiseManager: Not connected to Volumio.")
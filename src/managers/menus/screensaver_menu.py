@@ -5,17 +5,18 @@ from managers.menus.base_manager import BaseManager
 
 class ScreensaverMenu(BaseManager):
     """
-    A scrollable menu for choosing a screensaver (None, Snake, Geo, Quadify, Timer),
+    A scrollable menu for choosing a screensaver (None, Snake, Geo, Quadify, GIF, Timer),
     plus a sub-menu (Timer) to pick your idle timeout. The sub-menu has no 'Back' item;
     picking a time automatically returns to the main menu.
 
-    Main Items (6 total):
+    Main Items (7 total):
       1) None
       2) Snake
       3) Geo
       4) Quadify
-      5) Timer
-      6) Back  (goes to Config Menu)
+      5) GIF
+      6) Timer
+      7) Back  (goes to Config Menu)
 
     Timer Sub-Menu (no Back):
       [ "1 min", "2 min", "5 min", "10 min", "1 hour" ]
@@ -56,6 +57,7 @@ class ScreensaverMenu(BaseManager):
             "Snake",
             "Geo",
             "Quadify",
+            "GIF",
             "Timer",
             "Back"
         ]
@@ -176,7 +178,8 @@ class ScreensaverMenu(BaseManager):
             "None":    "none",
             "Snake":   "snake",
             "Geo":     "geo",
-            "Quadify": "quadify"
+            "Quadify": "quadify",
+            "GIF":     "gif"
         }
         chosen = saver_map.get(selected_name, "none")
         self.mode_manager.config["screensaver_type"] = chosen
@@ -1,8 +1,8 @@
 # src/managers/spotify_manager.py
-from managers.base_manager import BaseManager
+from managers.base_manager import BaseManager, SONG_INFO_FIELDS
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 
 class SpotifyManager(BaseManager):
     def __init__(self, display_manager, volumio_listener, mode_manager, window_size=4, y_offset=5, line_spacing=15):
@@ -45,7 +45,7 @@ class SpotifyManager(BaseManager):
         # Connect signals
         self.volumio_listener.navigation_received.connect(self.handle_navigation)
         self.volumio_listener.toast_message_received.connect(self.handle_toast_message)
-        self.volumio_listener.state_changed.connect(self.handle_state_change)
+        self.volumio_listener.subscribe(self.handle_state_change, fields=SONG_INFO_FIELDS)
         self.volumio_listener.track_changed.connect(self.handle_track_change)
 
         self.logger.debug("SpotifyManager: Connected to Volumio signals.")
@@ -54,8 +54,7 @@ class SpotifyManager(BaseManager):
         self.fetch_spotify_navigation()  # Fetch Spotify root navigation
 
         # Start a timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(5.0, self.spotify_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(5.0, self.spotify_timeout)
 
     def spotify_timeout(self):
         """Called when Spotify navigation has not produced any menu items within the timeout period."""
@@ -76,20 +75,21 @@ class SpotifyManager(BaseManager):
                 )
             self.display_manager.draw_custom(draw)
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(5.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(5.0, self.mode_manager.to_menu)
 
     def stop_mode(self):
         if not self.is_active:
             self.logger.debug("SpotifyManager: Spotify mode already inactive.")
             return
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests(("spotify", "spop"))
         self.display_manager.clear_screen()
         self.logger.info("SpotifyManager: Stopped Spotify mode and cleared display.")
 
         # Disconnect signals
         self.volumio_listener.navigation_received.disconnect(self.handle_navigation)
         self.volumio_listener.toast_message_received.disconnect(self.handle_toast_message)
-        self.volumio_listener.state_changed.disconnect(self.handle_state_change)
+        self.volumio_listener.unsubscribe(self.handle_state_change)
         self.volumio_listener.track_changed.disconnect(self.handle_track_change)
         self.logger.debug("SpotifyManager: Disconnected from Volumio signals.")
 
@@ -290,7 +290,7 @@ class SpotifyManager(BaseManager):
                     "service": "spop",
                     "uri": uri
                 })
-                threading.Timer(1.0, self.mode_manager.allow_state_change).start()
+                scheduler.call_later(1.0, self.mode_manager.allow_state_change)
             except Exception as e:
                 self.logger.error(f"SpotifyManager: Failed to play item {uri}: {e}")
                 self.display_error_message("Playback Error", f"Could not play item: {e}")
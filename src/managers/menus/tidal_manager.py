@@ -1,9 +1,10 @@
 # src/managers/tidal_manager.py
 
-from managers.base_manager import BaseManager
+from managers.base_manager import BaseManager, SONG_INFO_FIELDS
+from managers.dwell_prefetcher import DwellPrefetcher
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 import time
 
 class TidalManager(BaseManager):
@@ -36,6 +37,9 @@ class TidalManager(BaseManager):
         # Timeout timer attribute
         self.timeout_timer = None
 
+        # Loads the highlighted folder into the browse cache once the highlight settles
+        self.prefetcher = DwellPrefetcher(self.prefetch_navigation, timeout=2.0, name="TidalManager")
+
         # Register mode change callback
         if hasattr(self.mode_manager, "add_on_mode_change_callback"):
             self.mode_manager.add_on_mode_change_callback(self.handle_mode_change)
@@ -56,15 +60,14 @@ class TidalManager(BaseManager):
         self.volumio_listener.toast_message_received.connect(self.handle_toast_message)
         self.logger.debug("TidalManager: Connected to 'tidal_navigation_received' and 'toast_message_received' signals.")
         self.volumio_listener.navigation_received.connect(self.handle_navigation)
-        self.volumio_listener.state_changed.connect(self.handle_state_change)
+        self.volumio_listener.subscribe(self.handle_state_change, fields=SONG_INFO_FIELDS)
         self.volumio_listener.track_changed.connect(self.handle_track_change)
 
         self.display_loading_screen()
         self.fetch_tidal_navigation()  # Fetch Tidal root navigation
 
         # Start timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(5.0, self.tidal_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(5.0, self.tidal_timeout)
 
     def tidal_timeout(self):
         """Called when Tidal navigation has not loaded within the timeout period."""
@@ -88,7 +91,7 @@ class TidalManager(BaseManager):
             self.display_manager.draw_custom(draw)
             
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(3.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(3.0, self.mode_manager.to_menu)
 
 
     def stop_mode(self):
@@ -97,6 +100,8 @@ class TidalManager(BaseManager):
             self.logger.debug("TidalManager: Tidal mode already inactive.")
             return
         self.is_active = False
+        self.prefetcher.cancel()
+        self.volumio_listener.cancel_browse_requests("tidal://")
         self.display_manager.clear_screen()
         self.logger.info("TidalManager: Stopped Tidal mode and cleared display.")
 
@@ -104,7 +109,7 @@ class TidalManager(BaseManager):
         self.volumio_listener.tidal_navigation_received.disconnect(self.update_tidal_menu)
         self.volumio_listener.toast_message_received.disconnect(self.handle_toast_message)
         self.logger.debug("TidalManager: Disconnected from 'tidal_navigation_received' and 'toast_message_received' signals.")
-        self.volumio_listener.state_changed.disconnect(self.handle_state_change)
+        self.volumio_listener.unsubscribe(self.handle_state_change)
         self.volumio_listener.track_changed.disconnect(self.handle_track_change)
 
         # Cancel the timeout timer if it is still running
@@ -260,6 +265,21 @@ class TidalManager(BaseManager):
                 )
 
         self.display_manager.draw_custom(draw)
+        self.prefetch_selection()
+
+    def prefetch_selection(self):
+        """Queues the highlighted item's contents for prefetching; songs have none."""
+        if not self.is_active or not 0 <= self.current_selection_index < len(self.current_menu_items):
+            return
+        item = self.current_menu_items[self.current_selection_index]
+        uri = item.get("uri")
+        if not uri or uri.startswith("tidal://song/") or item.get("type", "").lower() == "song":
+            uri = None
+        self.prefetcher.on_selection(uri)
+
+    def prefetch_navigation(self, uri):
+        # Short timeout: a selection made meanwhile is held until this is answered
+        return self.volumio_listener.fetch_browse_library(uri, quiet=True, timeout=self.prefetcher.timeout)
 
     def scroll_selection(self, direction):
         """Scroll through the menu items."""
@@ -1,13 +1,15 @@
 # usb_library_manager.py
 
 from managers.base_manager import BaseManager
+from managers.timer_scheduler import scheduler
 import logging
 from PIL import ImageFont
-import threading
 
 class USBLibraryManager(BaseManager):
-    def __init__(self, display_manager, volumio_listener, mode_manager, window_size=4, y_offset=5, line_spacing=15):
+    def __init__(self, display_manager, volumio_listener, mode_manager, window_size=4, y_offset=5, line_spacing=15,
+                 library_index=None):
         super().__init__(display_manager, volumio_listener, mode_manager)
+        self.library_index = library_index
         self.mode_name = "usblibrary"
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
@@ -39,7 +41,7 @@ class USBLibraryManager(BaseManager):
             self.logger.info("Exiting USB Library mode.")
             self.stop_mode()
 
-    def start_mode(self):
+    def start_mode(self, start_uri=None):
         if self.is_active:
             self.logger.debug("USBLibraryManager: USB Library mode already active.")
             return
@@ -51,11 +53,10 @@ class USBLibraryManager(BaseManager):
 
         # Fetch USB navigation
         self.display_loading_screen()
-        self.fetch_navigation("music-library/USB")
+        self.fetch_navigation(start_uri or "music-library/USB")
 
         # Start timeout timer (e.g. 5 seconds)
-        self.timeout_timer = threading.Timer(3.0, self.library_timeout)
-        self.timeout_timer.start()
+        self.timeout_timer = scheduler.call_later_blocking(3.0, self.library_timeout)
 
     def library_timeout(self):
         """Called when library navigation has not loaded within the timeout period."""
@@ -79,18 +80,27 @@ class USBLibraryManager(BaseManager):
             self.display_manager.draw_custom(draw)
             
             # Automatically navigate back to the menu after 5 seconds.
-            threading.Timer(5.0, self.mode_manager.to_menu).start()
+            scheduler.call_later_blocking(5.0, self.mode_manager.to_menu)
 
     def stop_mode(self):
         if not self.is_active:
             self.logger.debug("USBLibraryManager: USB Library mode already inactive.")
             return
         self.is_active = False
+        self.volumio_listener.cancel_browse_requests("music-library/USB")
         self.display_manager.clear_screen()
         self.logger.info("USBLibraryManager: Stopped USB Library mode and cleared display.")
 
     def fetch_navigation(self, uri):
         self.logger.info(f"USBLibraryManager: Fetching navigation data for URI: {uri}")
+        items = self.library_index.children(uri) if self.library_index is not None else None
+        if items is not None:
+            self.logger.debug(f"USBLibraryManager: Serving {uri} from the library index.")
+            self.library_index.refresh(uri)
+            self.current_selection_index = 0
+            self.window_start_index = 0
+            self.update_library_menu({"lists": [{"items": items}]})
+            return
         if self.volumio_listener.is_connected():
             try:
                 self.volumio_listener.fetch_browse_library(uri)
@@ -6,6 +6,8 @@ import time
 import subprocess
 from transitions import Machine
 
+from managers.timer_scheduler import scheduler
+
 class ModeManager:
     """
     GS modified +0.5
@@ -129,12 +131,15 @@ class ModeManager:
         self._define_transitions()
 
         if self.volumio_listener is not None:
-            self.volumio_listener.state_changed.connect(self.process_state_change)
-            self.logger.debug("ModeManager: Connected to volumio_listener.state_changed signal.")
+            # Unfiltered: a state dropped while suppressed or in the cooldown must still be
+            # followed by the next publish, and the idle timer is reset on any playing push
+            self.volumio_listener.subscribe(self.process_state_change)
+            self.logger.debug("ModeManager: Subscribed to Volumio state changes.")
         else:
             self.logger.warning("ModeManager: volumio_listener is None, no state_changed signal linked.")
 
         self.lock = threading.Lock()
+        self.mode_listeners = []
 
     # --- Callback to push the current state before a transition ---
     def push_current_state(self, event):
@@ -304,14 +309,17 @@ class ModeManager:
         if not self.config.get("screensaver_enabled", True):
             self._cancel_idle_timer()
             return
-        self._cancel_idle_timer()
         self._start_idle_timer()
 
     def _start_idle_timer(self):
         if self.idle_timeout <= 0:
+            self._cancel_idle_timer()
             return
-        self.idle_timer = threading.Timer(self.idle_timeout, self._idle_timeout_reached)
-        self.idle_timer.start()
+        # Called on every playing state push: moving the existing handle creates nothing
+        if self.idle_timer:
+            self.idle_timer.reschedule(self.idle_timeout)
+        else:
+            self.idle_timer = scheduler.call_later_blocking(self.idle_timeout, self._idle_timeout_reached)
         self.logger.debug(f"ModeManager: Idle timer started for {self.idle_timeout}s.")
 
     def _cancel_idle_timer(self):
@@ -735,11 +743,10 @@ class ModeManager:
         self.is_track_changing = True
         self.track_change_in_progress = True
         if not self.pause_stop_timer:
-            self.pause_stop_timer = threading.Timer(
+            self.pause_stop_timer = scheduler.call_later_blocking(
                 self.pause_stop_delay,
                 self.switch_to_clock_if_still_stopped_or_paused
             )
-            self.pause_stop_timer.start()
             self.logger.debug("ModeManager: Started stop verification timer.")
 
     def _handle_playback_states(self, status, service, state_data):
@@ -801,11 +808,10 @@ class ModeManager:
 
     def _start_pause_timer(self):
         if not self.pause_stop_timer:
-            self.pause_stop_timer = threading.Timer(
+            self.pause_stop_timer = scheduler.call_later_blocking(
                 self.pause_stop_delay,
                 self.switch_to_clock_if_still_stopped_or_paused
             )
-            self.pause_stop_timer.start()
             self.logger.debug("ModeManager: Started pause/stop timer.")
         else:
             self.logger.debug("ModeManager: Pause/stop timer already running.")
@@ -829,12 +835,22 @@ class ModeManager:
                 self.logger.debug("Playback resumed or changed; staying in current mode.")
             self.pause_stop_timer = None
 
+    def add_mode_listener(self, callback):
+        """Registers `callback(mode)`, called after every transition (e.g. to push the mode to IR clients)."""
+        self.mode_listeners.append(callback)
+
     def update_current_mode(self):
+        mode = self.get_mode()
         try:
             with open("/tmp/quadify_mode", "w") as f:
-                f.write(self.get_mode())
+                f.write(mode)
         except Exception as e:
             self.logger.error(f"Failed to update mode file: {e}")
+        for callback in list(self.mode_listeners):
+            try:
+                callback(mode)
+            except Exception as e:
+                self.logger.error(f"ModeManager: mode listener failed => {e}")
 
     def toggle_play_pause(self):
         current_mode = self.get_mode()
@@ -0,0 +1,123 @@
+# src/managers/startup_orchestrator.py
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+
+class Stage:
+    """One startup step; `future` resolves to what its function returned."""
+
+    def __init__(self, name, func, after):
+        self.name = name
+        self.func = func
+        self.after = after
+        self.future = Future()
+        self.started_at = None
+        self.finished_at = None
+
+
+class StartupOrchestrator:
+    """
+    Runs the startup stages as soon as what they depend on is done.
+
+    Each stage added with add() gets its own thread, which waits for the
+    stages named in `after` and then calls `func` with their results, in
+    that order. Independent stages (loading fonts, connecting to Volumio,
+    building ModeManager...) therefore overlap instead of queueing behind
+    each other. A stage whose dependency failed fails too, without running.
+
+    Times are recorded against the orchestrator's creation and written out
+    by log_timeline(); mark() adds one-off moments such as "clock shown".
+    """
+
+    def __init__(self, name="Boot"):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.name = name
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.marks = []  # (label, monotonic time)
+
+    # ------------------------------------------------------------------
+    #   Stages
+    # ------------------------------------------------------------------
+    def add(self, name, func, after=()):
+        """Starts stage `name`; dependencies must have been added first."""
+        with self.lock:
+            if name in self.stages:
+                raise ValueError(f"Stage '{name}' already added")
+            missing = [dep for dep in after if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{name}' depends on unknown stages {missing}")
+            stage = Stage(name, func, tuple(after))
+            self.stages[name] = stage
+        threading.Thread(target=self._run, args=(stage,), name=f"boot-{name}", daemon=True).start()
+        return stage.future
+
+    def _run(self, stage):
+        try:
+            args = [self.stages[dep].future.result() for dep in stage.after]
+        except Exception as e:
+            stage.started_at = stage.finished_at = time.monotonic()
+            stage.future.set_exception(RuntimeError(f"dependency of '{stage.name}' failed: {e}"))
+            return
+
+        stage.started_at = time.monotonic()
+        try:
+            result = stage.func(*args)
+        except Exception as e:
+            stage.finished_at = time.monotonic()
+            self.logger.error(f"StartupOrchestrator: stage '{stage.name}' failed => {e}")
+            stage.future.set_exception(e)
+            return
+        stage.finished_at = time.monotonic()
+        self.logger.debug(f"StartupOrchestrator: stage '{stage.name}' done in "
+                          f"{(stage.finished_at - stage.started_at) * 1000:.0f} ms")
+        stage.future.set_result(result)
+
+    def result(self, name, timeout=None):
+        """Waits for stage `name` and returns its result (re-raising its error)."""
+        return self.stages[name].future.result(timeout=timeout)
+
+    def done(self, name):
+        return self.stages[name].future.done()
+
+    def wait(self, timeout=None):
+        """Waits for every stage; returns the names of those that failed or are still running."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        failed = []
+        for name, stage in list(self.stages.items()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                stage.future.result(timeout=remaining)
+            except Exception:
+                failed.append(name)
+        return failed
+
+    # ------------------------------------------------------------------
+    #   Timeline
+    # ------------------------------------------------------------------
+    def mark(self, label):
+        with self.lock:
+            self.marks.append((label, time.monotonic()))
+
+    def log_timeline(self, logger=None):
+        logger = logger or self.logger
+        offset = lambda t: f"+{t - self.started:6.2f} s" if t is not None else "    pending"
+        lines = []
+        for stage in sorted(self.stages.values(), key=lambda s: s.started_at or float("inf")):
+            if not stage.future.done():
+                status = "running"
+            elif stage.future.exception() is not None:
+                status = "FAILED"
+            else:
+                status = f"{(stage.finished_at - stage.started_at) * 1000:7.0f} ms"
+            lines.append(f"  {stage.name:<16} {offset(stage.started_at)} -> {offset(stage.finished_at)}  {status}")
+        for label, at in self.marks:
+            lines.append(f"  {label:<16} {offset(at)}")
+        total = time.monotonic() - self.started
+        logger.info(f"{self.name} timeline ({total:.2f} s):\n" + "\n".join(lines))
@@ -0,0 +1,167 @@
+# src/managers/timer_scheduler.py
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TimerHandle:
+    """A pending call from TimerScheduler.call_later(); cancel() or reschedule() it."""
+
+    __slots__ = ("scheduler", "callback", "args", "kwargs", "due", "generation", "cancelled", "fired")
+
+    def __init__(self, scheduler, callback, args, kwargs, due):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.due = due
+        self.generation = 0
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def active(self):
+        return not (self.cancelled or self.fired)
+
+    def cancel(self):
+        self.scheduler.cancel(self)
+
+    def reschedule(self, delay):
+        """Moves the call to `delay` seconds from now, even if it was cancelled or has fired."""
+        self.scheduler.reschedule(self, delay)
+        return self
+
+    def __repr__(self):
+        name = getattr(self.callback, "__qualname__", repr(self.callback))
+        return f"<TimerHandle {name} due={self.due:.3f} active={self.active}>"
+
+
+class TimerScheduler:
+    """
+    One thread that runs every delayed call, instead of a threading.Timer
+    (and an OS thread) per timeout.
+
+    Pending calls sit in a heap ordered by due time (time.monotonic()).
+    Cancelling just flags the handle. Pushing a deadline later, which is
+    what resetting an idle timer does, only updates the handle: its heap
+    entry is re-filed when it comes up. Only moving a call earlier adds a
+    heap entry, and the old one is skipped by its generation number.
+
+    Callbacks run on the scheduler thread one after another, so they must
+    be short: flag flips, queue puts, a timer re-arm. Anything that can block
+    (mode transitions, drawing, stop_mode joins, publishing state to
+    subscribers) goes through call_later_blocking(), which runs it on a
+    separate worker thread, so the other timers stay on time.
+    """
+
+    def __init__(self, name="TimerScheduler"):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.name = name
+        self.condition = threading.Condition()
+        self.heap = []  # (due, tie-breaker, generation, handle)
+        self.counter = itertools.count()
+        self.thread = None
+        self.running = True
+        # One worker keeps blocking callbacks (mostly mode transitions) in order
+        self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-worker")
+
+    # ------------------------------------------------------------------
+    #   Scheduling
+    # ------------------------------------------------------------------
+    def call_later(self, delay, callback, *args, **kwargs):
+        """Runs callback(*args, **kwargs) after `delay` seconds; returns its TimerHandle."""
+        handle = TimerHandle(self, callback, args, kwargs, time.monotonic() + delay)
+        with self.condition:
+            self._push(handle)
+        return handle
+
+    def call_later_blocking(self, delay, callback, *args, **kwargs):
+        """Like call_later(), but callback runs on the worker thread instead of the scheduler's."""
+        return self.call_later(delay, self._submit, callback, args, kwargs)
+
+    def _submit(self, callback, args, kwargs):
+        self.worker.submit(self._call, callback, args, kwargs)
+
+    def cancel(self, handle):
+        if handle is None:
+            return
+        with self.condition:
+            handle.cancelled = True
+
+    def reschedule(self, handle, delay):
+        due = time.monotonic() + delay
+        with self.condition:
+            filed = handle.active
+            later = due >= handle.due
+            handle.due = due
+            handle.cancelled = handle.fired = False
+            if not (filed and later):
+                # Not in the heap any more, or needed sooner than its entry says
+                handle.generation += 1
+                self._push(handle)
+
+    def _push(self, handle):
+        """Files `handle` at handle.due. Call with the condition held."""
+        first = not self.heap or handle.due < self.heap[0][0]
+        heapq.heappush(self.heap, (handle.due, next(self.counter), handle.generation, handle))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self.thread.start()
+        elif first:
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.worker.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    #   Worker
+    # ------------------------------------------------------------------
+    def _next_due(self):
+        """Pops and returns the next handle to run, or None to stop. Call with the condition held."""
+        while self.running:
+            if not self.heap:
+                self.condition.wait()
+                continue
+            due, _, generation, handle = self.heap[0]
+            if handle.cancelled or handle.fired or generation != handle.generation:
+                heapq.heappop(self.heap)  # cancelled, or superseded by an earlier entry
+                continue
+            if handle.due > due:
+                # Pushed back since it was filed: re-file at the new time
+                heapq.heapreplace(self.heap, (handle.due, next(self.counter), generation, handle))
+                continue
+            wait = due - time.monotonic()
+            if wait > 0:
+                self.condition.wait(wait)
+                continue
+            heapq.heappop(self.heap)
+            handle.fired = True
+            return handle
+        return None
+
+    def _run(self):
+        while True:
+            with self.condition:
+                handle = self._next_due()
+            if handle is None:
+                return
+            self._call(handle.callback, handle.args, handle.kwargs)
+
+    def _call(self, callback, args, kwargs):
+        try:
+            callback(*args, **kwargs)
+        except Exception as e:
+            self.logger.exception(f"TimerScheduler: {callback!r} raised => {e}")
+
+
+# Shared by every manager, screen and listener
+scheduler = TimerScheduler()
@@ -0,0 +1,86 @@
+# src/network/browse_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+# Seconds a browsed folder is served straight from the cache, per service.
+# Past that it is still shown immediately but refreshed in the background.
+DEFAULT_TTLS = {
+    "tidal": 600,
+    "qobuz": 600,
+    "spotify": 600,
+    "webradio": 1800,
+    "radioparadise": 1800,
+    "motherearthradio": 1800,
+    "playlists": 60,
+    "library": 300,
+    "usblibrary": 60,
+}
+
+
+class BrowseCache:
+    """
+    browseLibrary results keyed by URI, least recently used first.
+
+    get() returns (navigation, service, fresh): `fresh` is False once the
+    entry is older than its service's TTL, meaning the caller should show
+    it but ask Volumio again. Entries older than `max_stale` are dropped.
+    Size is bounded both by entry count and by the total number of items
+    across all cached folders, since one big library folder can outweigh a
+    hundred small menus.
+    """
+
+    def __init__(self, ttls=None, default_ttl=120, max_stale=6 * 3600, max_entries=128, max_items=20000):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.max_items = max_items
+
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # uri -> (navigation, service, stored_at, item_count)
+        self.total_items = 0
+
+    @staticmethod
+    def _count_items(navigation):
+        return sum(len(lst.get("items", [])) for lst in navigation.get("lists", []) if isinstance(lst, dict))
+
+    def get(self, uri):
+        with self.lock:
+            entry = self.entries.get(uri)
+            if entry is None:
+                return None
+            navigation, service, stored_at, _ = entry
+            age = time.monotonic() - stored_at
+            if age > self.max_stale:
+                self._remove(uri)
+                return None
+            self.entries.move_to_end(uri)
+            return navigation, service, age < self.ttls.get(service, self.default_ttl)
+
+    def put(self, uri, navigation, service):
+        """Stores a result; returns False if it is identical to what was cached."""
+        count = self._count_items(navigation)
+        with self.lock:
+            previous = self.entries.get(uri)
+            changed = previous is None or previous[0] != navigation
+            if previous is not None:
+                self._remove(uri)
+            if count > self.max_items:
+                return changed  # too big to be worth keeping
+            self.entries[uri] = (navigation, service, time.monotonic(), count)
+            self.total_items += count
+            while len(self.entries) > self.max_entries or self.total_items > self.max_items:
+                self._remove(next(iter(self.entries)))
+        return changed
+
+    def invalidate(self, prefix=None):
+        """Drops every entry, or those whose URI starts with `prefix` (str or tuple)."""
+        with self.lock:
+            for uri in [u for u in self.entries if prefix is None or u.startswith(prefix)]:
+                self._remove(uri)
+
+    def _remove(self, uri):
+        entry = self.entries.pop(uri)
+        self.total_items -= entry[3]
@@ -0,0 +1,190 @@
+# src/network/browse_requests.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from managers.timer_scheduler import scheduler
+
+
+class BrowseRequest:
+    """One outstanding browseLibrary request; `future` resolves to the navigation dict."""
+
+    def __init__(self, request_id, uri, service, timeout, revalidate=False, quiet=False):
+        self.id = request_id
+        self.uri = uri
+        self.service = service
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.quiet = quiet  # cache and resolve only, no navigation_received
+        self.announced = False
+        self.sent = False   # False while held behind a prefetch
+        self.sent_at = time.monotonic()
+        self.deadline = self.sent_at + timeout
+        self.future = Future()
+
+    @property
+    def cancelled(self):
+        return self.future.cancelled()
+
+
+class BrowseRequestRegistry:
+    """
+    Correlates pushBrowseLibrary responses with the browseLibrary requests
+    that caused them, so several can be in flight at once.
+
+    A response is matched to the pending request for the URI it reports;
+    Volumio doesn't always echo the URI, so failing that it goes to the
+    oldest request sent (Volumio answers in order). Cancelled requests
+    stay registered until their response arrives or they time out, so a
+    late answer to an abandoned request is swallowed instead of being
+    attributed to the next one.
+
+    Streaming plugins can answer out of order, which would hand a prefetch's
+    folder to the menu's request (and cache each under the other URI). So a
+    quiet request is only ever in flight on its own: it is refused while
+    anything else is pending, and requests registered while it is pending
+    are held back and sent by `send(request)` once it is answered, times
+    out (after `prefetch_timeout` unless the caller asks otherwise) or is
+    cancelled. A cancelled prefetch can then only claim its late answer by
+    URI, never as the oldest request.
+    """
+
+    def __init__(self, send, default_timeout=10.0, prefetch_timeout=2.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.send = send
+        self.default_timeout = default_timeout
+        self.prefetch_timeout = prefetch_timeout
+        self.lock = threading.Lock()
+        self.pending = OrderedDict()  # id -> BrowseRequest, oldest first
+        self.next_id = 1
+        self.reaper = None
+
+    def register(self, uri, service, callback=None, timeout=None, revalidate=False, quiet=False):
+        """
+        Registers a request and sends it, or holds it while a prefetch is in
+        flight. Returns None for a quiet request while others are pending.
+        """
+        with self.lock:
+            expired = self._expire()
+            if quiet and self.pending:
+                request = None
+            else:
+                if timeout is None:
+                    timeout = self.prefetch_timeout if quiet else self.default_timeout
+                request = BrowseRequest(self.next_id, uri, service, timeout,
+                                        revalidate=revalidate, quiet=quiet)
+                self.next_id += 1
+                request.sent = not self._prefetch_in_flight()
+                self.pending[request.id] = request
+                self._schedule_reaper()
+        self._fail(expired)
+        if request is None:
+            return None
+        if callback:
+            request.future.add_done_callback(callback)
+        if request.sent:
+            self.send(request)
+        return request
+
+    def resolve(self, navigation, data=None):
+        """Pops and returns the request this response answers, or None if nothing was sent."""
+        candidates = {
+            (navigation.get("uri") or "").strip(),
+            (navigation.get("info", {}).get("uri") or "").strip(),
+            ((data or {}).get("uri") or "").strip(),
+        } - {""}
+        with self.lock:
+            expired = self._expire()
+            sent = [r for r in self.pending.values() if r.sent]
+            match = next((r for r in sent if r.uri in candidates), None)
+            if match is None:
+                match = next((r for r in sent if not (r.quiet and r.cancelled)), None)
+            if match is not None:
+                del self.pending[match.id]
+            released = self._release()
+            self._schedule_reaper()
+        self._fail(expired)
+        self._send(released)
+        return match
+
+    def cancel(self, prefix=None):
+        """Cancels pending requests (all, or those whose URI starts with `prefix`; a tuple works too)."""
+        with self.lock:
+            requests = [r for r in self.pending.values() if prefix is None or r.uri.startswith(prefix)]
+        for request in requests:
+            request.future.cancel()
+        # A cancelled prefetch no longer holds back the requests behind it
+        with self.lock:
+            released = self._release()
+            self._schedule_reaper()
+        self._send(released)
+        return len(requests)
+
+    def _prefetch_in_flight(self):
+        """Call with the lock held."""
+        return any(r.quiet and r.sent and not r.cancelled for r in self.pending.values())
+
+    def _release(self):
+        """Marks the held requests sent once no prefetch is in flight and returns them. Call with the lock held."""
+        if self._prefetch_in_flight():
+            return []
+        released = []
+        now = time.monotonic()
+        for request in [r for r in self.pending.values() if not r.sent]:
+            if request.cancelled:
+                del self.pending[request.id]  # never sent, so no answer to swallow
+                continue
+            request.sent = True
+            request.sent_at = now
+            request.deadline = now + request.timeout
+            released.append(request)
+        return released
+
+    def _send(self, released):
+        for request in released:
+            self.logger.debug(f"BrowseRequestRegistry: sending held request #{request.id} for {request.uri}.")
+            self.send(request)
+
+    def outstanding(self, uri):
+        """The pending, not cancelled request for `uri`, if any."""
+        with self.lock:
+            return next((r for r in self.pending.values() if r.uri == uri and not r.cancelled), None)
+
+    # ------------------------------------------------------------------
+    #   Timeouts
+    # ------------------------------------------------------------------
+    def _expire(self):
+        """Removes overdue requests and returns them. Call with the lock held."""
+        now = time.monotonic()
+        expired = [r for r in self.pending.values() if r.sent and r.deadline <= now]  # held ones wait
+        for request in expired:
+            del self.pending[request.id]
+        return expired
+
+    def _fail(self, expired):
+        # Outside the lock: done-callbacks may call back into the registry
+        for request in expired:
+            if not request.future.done():
+                self.logger.warning(f"BrowseRequestRegistry: browseLibrary for {request.uri} timed out.")
+                request.future.set_exception(TimeoutError(f"browseLibrary {request.uri} timed out"))
+
+    def _schedule_reaper(self):
+        deadlines = [r.deadline for r in self.pending.values() if r.sent]
+        if self.reaper is not None or not deadlines:
+            return
+        delay = max(0.0, min(deadlines) - time.monotonic())
+        self.reaper = scheduler.call_later_blocking(delay + 0.01, self._reap)
+
+    def _reap(self):
+        with self.lock:
+            self.reaper = None
+            expired = self._expire()
+            released = self._release()
+            self._schedule_reaper()
+        self._fail(expired)
+        self._send(released)
@@ -0,0 +1,199 @@
+# src/network/command_server.py
+
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+
+
+class CommandServer:
+    """
+    Unix socket command channel used by the IR listener (and anything else
+    local that wants to drive Quadify).
+
+    Connections are persistent and framed as one JSON object per line:
+
+      client -> server   {"cmd": "scroll_down"}            fire and forget
+                         {"cmd": "select", "id": 7}        answered with an ack
+                         {"cmd": "scroll_down", "repeat": 12}  other fields become handler kwargs
+      server -> client   {"event": "mode", "mode": "tidal"} on connect and on every mode change
+                         {"event": "ack", "id": 7, "ok": true}
+
+    Clients may write any number of commands without waiting. Commands are run
+    on per-lane worker threads - `lane_for(command)` picks the lane - so a slow
+    command only holds up later commands in its own lane (e.g. a Volumio
+    transport call never delays menu scrolling). Within a lane, commands run in
+    the order they arrived. A bare text line ("home\\n") is accepted as a
+    command too, as is the old one-shot style of writing a command without a
+    newline and closing the connection.
+    """
+
+    def __init__(self, handler, sock_path="/tmp/quadify.sock", initial_mode=None, lane_for=None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.handler = handler
+        self.sock_path = sock_path
+        self.current_mode = initial_mode
+        self.lane_for = lane_for or (lambda command: "default")
+
+        self.lanes_lock = threading.Lock()
+        self.lanes = {}  # lane name -> queue of (conn, command, request_id, params)
+
+        self.clients_lock = threading.Lock()
+        self.send_lock = threading.Lock()  # keeps pushed events and acks whole on the wire
+        self.clients = set()
+        self.server_socket = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    #   Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        try:
+            os.remove(self.sock_path)
+        except OSError:
+            pass
+
+        self.server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server_socket.bind(self.sock_path)
+        self.server_socket.listen(8)
+        self._running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        self.logger.info(f"CommandServer: listening on {self.sock_path}")
+
+    def stop(self):
+        self._running = False
+        if self.server_socket:
+            try:
+                self.server_socket.close()
+            except OSError:
+                pass
+        with self.lanes_lock:
+            for lane in self.lanes.values():
+                lane.put(None)
+            self.lanes = {}
+        with self.clients_lock:
+            clients, self.clients = list(self.clients), set()
+        for conn in clients:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    #   Mode Updates
+    # ------------------------------------------------------------------
+    def broadcast_mode(self, mode):
+        """Pushes the new mode to every connected client."""
+        if mode == self.current_mode:
+            return
+        self.current_mode = mode
+        message = self._encode({"event": "mode", "mode": mode})
+        with self.clients_lock:
+            clients = list(self.clients)
+        for conn in clients:
+            self._send(conn, message)
+
+    # ------------------------------------------------------------------
+    #   Connections
+    # ------------------------------------------------------------------
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, _ = self.server_socket.accept()
+            except OSError as e:
+                if self._running:
+                    self.logger.error(f"CommandServer: accept failed => {e}")
+                continue
+            with self.clients_lock:
+                self.clients.add(conn)
+            threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+
+    def _serve_client(self, conn):
+        if self.current_mode is not None:
+            self._send(conn, self._encode({"event": "mode", "mode": self.current_mode}))
+
+        buffer = b""
+        try:
+            while self._running:
+                data = conn.recv(4096)
+                if not data:
+                    break
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    self._handle_line(conn, line)
+            # One-shot clients close without a trailing newline
+            if buffer.strip():
+                self._handle_line(conn, buffer)
+        except OSError as e:
+            self.logger.debug(f"CommandServer: client connection error => {e}")
+        finally:
+            with self.clients_lock:
+                self.clients.discard(conn)
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def _handle_line(self, conn, line):
+        line = line.decode("utf-8", errors="replace").strip()
+        if not line:
+            return
+
+        request_id = None
+        params = {}
+        if line.startswith("{"):
+            try:
+                message = json.loads(line)
+            except ValueError:
+                self.logger.warning(f"CommandServer: ignoring malformed message: {line}")
+                return
+            command = message.pop("cmd", None)
+            request_id = message.pop("id", None)
+            params = message
+        else:
+            command = line
+
+        self._lane(self.lane_for(command)).put((conn, command, request_id, params))
+
+    # ------------------------------------------------------------------
+    #   Command Lanes
+    # ------------------------------------------------------------------
+    def _lane(self, name):
+        with self.lanes_lock:
+            lane = self.lanes.get(name)
+            if lane is None:
+                lane = self.lanes[name] = queue.Queue()
+                threading.Thread(target=self._lane_worker, args=(name, lane), daemon=True).start()
+            return lane
+
+    def _lane_worker(self, name, lane):
+        while True:
+            item = lane.get()
+            if item is None:
+                break
+            conn, command, request_id, params = item
+            ok = True
+            try:
+                self.handler(command, **params)
+            except Exception as e:
+                ok = False
+                self.logger.error(f"CommandServer: command '{command}' failed in lane '{name}' => {e}")
+
+            if request_id is not None:
+                self._send(conn, self._encode({"event": "ack", "id": request_id, "ok": ok}))
+
+    def _encode(self, message):
+        return (json.dumps(message) + "\n").encode("utf-8")
+
+    def _send(self, conn, message):
+        try:
+            with self.send_lock:
+                conn.sendall(message)
+        except OSError:
+            with self.clients_lock:
+                self.clients.discard(conn)
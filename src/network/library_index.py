@@ -0,0 +1,315 @@
+# src/network/library_index.py
+
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import string
+import threading
+import time
+from urllib.parse import quote
+
+import requests
+
+SCHEMA_VERSION = 1
+DEFAULT_ROOTS = ("music-library/NAS", "music-library/USB")
+FOLDER_TYPES = ("folder", "streaming-category", "streaming-folder", "remdisk")
+
+# Queue priorities: folders the user is looking at jump ahead of the crawl
+PRIORITY_VISIBLE = 0
+PRIORITY_CRAWL = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    uri        TEXT PRIMARY KEY,
+    parent     TEXT,
+    title      TEXT,
+    sort_key   TEXT,
+    albumart   TEXT,
+    signature  TEXT NOT NULL,
+    is_album   INTEGER NOT NULL DEFAULT 0,
+    crawled_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    parent   TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    uri      TEXT NOT NULL,
+    title    TEXT NOT NULL,
+    type     TEXT NOT NULL,
+    service  TEXT,
+    albumart TEXT,
+    PRIMARY KEY (parent, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS folders_by_album_title ON folders (is_album, sort_key);
+"""
+
+
+def sort_key(title):
+    """Case-insensitive key that files "The Beatles" under B."""
+    key = (title or "").strip().casefold()
+    return key[4:] if key.startswith("the ") else key
+
+
+class LibraryIndex:
+    """
+    SQLite index of the Volumio music library (NAS and USB folders), so the
+    library menus can be served from local disk instead of one REST call per
+    folder, and albums can be listed alphabetically.
+
+    A background thread walks the browse tree from `roots` at no more than
+    `requests_per_second`. Each folder is stored with a signature of its
+    listing: when a re-crawl finds the same listing nothing is rewritten,
+    and folders that disappeared are pruned with everything under them.
+    Folders crawled less than `refresh_interval` seconds ago are not
+    fetched again - their stored children are walked instead - so a restart
+    resumes where the last crawl left off, and the whole tree is refreshed
+    once per interval. Folders the user opens are re-checked straight away
+    (see refresh()).
+
+    Reads go through their own connection and never wait on the crawler
+    (the database is in WAL mode).
+    """
+
+    def __init__(self, db_path, base_url, roots=DEFAULT_ROOTS, requests_per_second=4.0,
+                 refresh_interval=12 * 3600, visible_refresh_interval=60):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.db_path = db_path
+        self.base_url = base_url.rstrip("/")
+        self.roots = tuple(roots)
+        self.min_request_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.refresh_interval = refresh_interval
+        self.visible_refresh_interval = visible_refresh_interval
+
+        self.session = requests.Session()
+        self.queue = queue.PriorityQueue()  # (priority, seq, uri, title, parent, max_age, recursive)
+        self.queued_lock = threading.Lock()
+        self.queued = set()
+        self.seq = 0
+        self.last_request = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.read_lock = threading.Lock()
+        self.db = self._connect()
+        self._ensure_schema(self.db)
+
+    # ------------------------------------------------------------------
+    #   Database
+    # ------------------------------------------------------------------
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_schema(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.logger.info(f"LibraryIndex: (re)creating index schema v{SCHEMA_VERSION} at {self.db_path}")
+            conn.executescript("DROP TABLE IF EXISTS folders; DROP TABLE IF EXISTS entries;")
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    #   Queries
+    # ------------------------------------------------------------------
+    def children(self, uri):
+        """The indexed listing of `uri` as browse-style item dicts, or None if it isn't indexed yet."""
+        with self.read_lock:
+            if self.db.execute("SELECT 1 FROM folders WHERE uri = ?", (uri,)).fetchone() is None:
+                return None
+            rows = self.db.execute(
+                "SELECT title, uri, type, service, albumart FROM entries WHERE parent = ? ORDER BY position",
+                (uri,),
+            ).fetchall()
+        return [
+            {"title": title, "uri": item_uri, "type": item_type, "service": service, "albumart": albumart}
+            for title, item_uri, item_type, service, albumart in rows
+        ]
+
+    def initials(self):
+        """Sorted first letters of indexed album titles; anything not A-Z is grouped as '#'."""
+        with self.read_lock:
+            rows = self.db.execute(
+                "SELECT DISTINCT substr(sort_key, 1, 1) FROM folders WHERE is_album = 1"
+            ).fetchall()
+        letters = {(r[0] or "").upper() for r in rows}
+        found = sorted(letters & set(string.ascii_uppercase))
+        return found + ["#"] if letters - set(string.ascii_uppercase) else found
+
+    def albums_starting_with(self, letter, limit=1000):
+        """Indexed albums whose title starts with `letter` ('#' for digits and symbols), A-Z."""
+        with self.read_lock:
+            if letter == "#":
+                rows = self.db.execute(
+                    "SELECT title, uri, albumart FROM folders WHERE is_album = 1 "
+                    "AND substr(sort_key, 1, 1) NOT BETWEEN 'a' AND 'z' ORDER BY sort_key LIMIT ?",
+                    (limit,),
+                ).fetchall()
+            else:
+                low = letter.lower()
+                rows = self.db.execute(
+                    "SELECT title, uri, albumart FROM folders WHERE is_album = 1 "
+                    "AND sort_key >= ? AND sort_key < ? ORDER BY sort_key LIMIT ?",
+                    (low, chr(ord(low) + 1), limit),
+                ).fetchall()
+        return [
+            {"title": title, "uri": uri, "type": "folder", "service": "mpd", "albumart": albumart}
+            for title, uri, albumart in rows
+        ]
+
+    # ------------------------------------------------------------------
+    #   Crawling
+    # ------------------------------------------------------------------
+    def start(self):
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._crawl_loop, daemon=True)
+        self.thread.start()
+        self.logger.info(f"LibraryIndex: indexing {', '.join(self.roots)}")
+
+    def stop(self):
+        self.stop_event.set()
+        self.queue.put((-1, 0, None, None, None, 0, False))
+
+    def refresh(self, uri):
+        """Re-checks one folder ahead of the crawl (used when it is opened from the index)."""
+        self._enqueue(uri, None, None, self.visible_refresh_interval, False, PRIORITY_VISIBLE)
+
+    def _enqueue(self, uri, title, parent, max_age, recursive, priority=PRIORITY_CRAWL):
+        with self.queued_lock:
+            if (uri, priority) in self.queued:
+                return
+            self.queued.add((uri, priority))
+            self.seq += 1
+            seq = self.seq
+        self.queue.put((priority, seq, uri, title, parent, max_age, recursive))
+
+    def _enqueue_roots(self):
+        for root in self.roots:
+            self._enqueue(root, root.rsplit("/", 1)[-1], None, self.refresh_interval, True)
+
+    def _crawl_loop(self):
+        conn = self._connect()
+        self._enqueue_roots()
+        started = time.monotonic()
+        fetched = 0
+        while not self.stop_event.is_set():
+            try:
+                item = self.queue.get(timeout=self.refresh_interval)
+            except queue.Empty:
+                # Idle for a whole interval: time for the next pass over the tree
+                self._enqueue_roots()
+                started, fetched = time.monotonic(), 0
+                continue
+
+            priority, _, uri, title, parent, max_age, recursive = item
+            if uri is None:
+                break
+            with self.queued_lock:
+                self.queued.discard((uri, priority))
+            try:
+                fetched += self._index_folder(conn, uri, title, parent, max_age, recursive)
+            except Exception as e:
+                self.logger.warning(f"LibraryIndex: failed to index {uri} => {e}")
+
+            if priority == PRIORITY_CRAWL and self.queue.empty():
+                self.logger.info(f"LibraryIndex: pass finished, {fetched} folder(s) fetched "
+                                 f"in {time.monotonic() - started:.0f} s")
+                started, fetched = time.monotonic(), 0
+        conn.close()
+
+    def _index_folder(self, conn, uri, title, parent, max_age, recursive):
+        """Indexes one folder; returns 1 if it was fetched from Volumio, 0 if the stored copy was fresh."""
+        row = conn.execute("SELECT signature, crawled_at, title, parent FROM folders WHERE uri = ?", (uri,)).fetchone()
+        if row is not None:
+            title = title if title is not None else row[2]
+            parent = parent if parent is not None else row[3]
+
+        if row is not None and time.time() - row[1] < max_age:
+            fetched = 0
+            children = conn.execute(
+                "SELECT uri, title FROM entries WHERE parent = ? AND type IN (%s)" % ",".join("?" * len(FOLDER_TYPES)),
+                (uri, *FOLDER_TYPES),
+            ).fetchall()
+        else:
+            items = self._fetch(uri)
+            if items is None:
+                return 1
+            fetched = 1
+            self._store_folder(conn, uri, title, parent, items, row[0] if row else None)
+            children = [(i.get("uri", ""), i.get("title", "")) for i in items
+                        if i.get("type", "").lower() in FOLDER_TYPES and i.get("uri")]
+
+        if recursive:
+            for child_uri, child_title in children:
+                self._enqueue(child_uri, child_title, uri, max_age, True)
+        return fetched
+
+    def _fetch(self, uri):
+        wait = self.last_request + self.min_request_interval - time.monotonic()
+        if wait > 0 and self.stop_event.wait(wait):
+            return None
+        self.last_request = time.monotonic()
+
+        response = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(uri)}", timeout=30)
+        if response.status_code != 200:
+            self.logger.warning(f"LibraryIndex: browse of {uri} returned {response.status_code}")
+            return None
+        lists = response.json().get("navigation", {}).get("lists", [])
+        return lists[0].get("items", []) if lists else []
+
+    def _store_folder(self, conn, uri, title, parent, items, previous_signature):
+        listing = "\n".join(
+            f"{i.get('type', '')}\t{i.get('uri', '')}\t{i.get('title', '')}\t{i.get('albumart', '')}" for i in items
+        )
+        signature = hashlib.sha1(listing.encode("utf-8")).hexdigest()
+        now = time.time()
+
+        with conn:
+            if signature == previous_signature:
+                conn.execute("UPDATE folders SET crawled_at = ? WHERE uri = ?", (now, uri))
+                return
+
+            new_uris = {i.get("uri", "") for i in items}
+            for (old_uri,) in conn.execute(
+                "SELECT uri FROM entries WHERE parent = ? AND type IN (%s)" % ",".join("?" * len(FOLDER_TYPES)),
+                (uri, *FOLDER_TYPES),
+            ).fetchall():
+                if old_uri not in new_uris:
+                    self._prune(conn, old_uri)
+
+            types = {i.get("type", "").lower() for i in items}
+            is_album = "song" in types and not types & set(FOLDER_TYPES)
+            albumart = next((i.get("albumart") for i in items if i.get("albumart")), None)
+
+            conn.execute("DELETE FROM entries WHERE parent = ?", (uri,))
+            conn.executemany(
+                "INSERT INTO entries (parent, position, uri, title, type, service, albumart) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (uri, position, i.get("uri", ""), i.get("title", "Untitled"), i.get("type", "").lower(),
+                     i.get("service", "").lower(), i.get("albumart"))
+                    for position, i in enumerate(items)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO folders (uri, parent, title, sort_key, albumart, signature, is_album, crawled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (uri, parent, title, sort_key(title), albumart, signature, int(is_album), now),
+            )
+        self.logger.debug(f"LibraryIndex: indexed {uri} ({len(items)} items)")
+
+    def _prune(self, conn, uri):
+        """Removes a folder that no longer exists, and everything indexed below it."""
+        prefix = uri + "/"
+        conn.execute("DELETE FROM entries WHERE parent = ? OR substr(parent, 1, ?) = ?", (uri, len(prefix), prefix))
+        conn.execute("DELETE FROM folders WHERE uri = ? OR substr(uri, 1, ?) = ?", (uri, len(prefix), prefix))
+        self.logger.info(f"LibraryIndex: pruned {uri}")
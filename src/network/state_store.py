@@ -0,0 +1,116 @@
+# src/network/state_store.py
+
+import logging
+import threading
+import time
+
+from managers.timer_scheduler import scheduler
+
+
+class StateStore:
+    """
+    Holds the last Volumio state and fans out changes to it.
+
+    Volumio tends to send pushState in bursts of near-identical payloads (every
+    seek or volume step produces several). update() coalesces them: the first
+    state after a quiet period is published straight away, anything arriving
+    within `coalesce_window` seconds of the last publish is merged into a
+    single trailing publish. A publish only happens when at least one field
+    differs from the previously published state.
+
+    Subscribers are called as ``callback(sender, state=state, changes=changes)``
+    - the same shape as the state_changed signal - where `changes` is the
+    frozenset of field names that differ. A subscriber registered with
+    `fields` is only called when one of those fields changed, or when the
+    publish was forced with force_next().
+    """
+
+    def __init__(self, sender, coalesce_window=0.05):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.sender = sender
+        self.coalesce_window = coalesce_window
+
+        self.lock = threading.Lock()
+        self.publish_lock = threading.Lock()  # keeps publishes in order
+        self.state = {}
+        self.pending = None
+        self.flush_timer = None
+        self.last_publish = 0.0
+        self.force = False
+        self.subscribers = []  # (callback, frozenset of fields or None)
+
+        # Counters, handy when checking how much a burst was reduced
+        self.updates_received = 0
+        self.updates_published = 0
+
+    # ------------------------------------------------------------------
+    #   Subscriptions
+    # ------------------------------------------------------------------
+    def subscribe(self, callback, fields=None):
+        """Calls `callback` on published changes; only those touching `fields` if given."""
+        fields = frozenset(fields) if fields else None
+        with self.lock:
+            self.subscribers = [(cb, f) for cb, f in self.subscribers if cb != callback]
+            self.subscribers.append((callback, fields))
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self.subscribers = [(cb, f) for cb, f in self.subscribers if cb != callback]
+
+    # ------------------------------------------------------------------
+    #   Updates
+    # ------------------------------------------------------------------
+    def update(self, state):
+        """Takes a full pushState payload; publishes now or after the coalesce window."""
+        with self.lock:
+            self.updates_received += 1
+            self.pending = dict(state)
+            if self.flush_timer is not None:
+                return  # a trailing publish is already scheduled
+            wait = self.coalesce_window - (time.monotonic() - self.last_publish)
+            if wait > 0:
+                self.flush_timer = scheduler.call_later_blocking(wait, self.flush)
+                return
+        self.flush()
+
+    def force_next(self):
+        """Publishes the next state even if nothing changed (e.g. the reply to getState)."""
+        with self.lock:
+            self.force = True
+
+    def flush(self):
+        """Publishes the pending state if it differs from the last published one."""
+        with self.publish_lock:
+            with self.lock:
+                self.flush_timer = None
+                state, self.pending = self.pending, None
+                if state is None:
+                    return
+                previous = self.state
+                changes = frozenset(
+                    key for key in previous.keys() | state.keys()
+                    if previous.get(key) != state.get(key)
+                )
+                forced, self.force = self.force, False
+                if not changes and not forced:
+                    return
+                self.state = state
+                self.last_publish = time.monotonic()
+                self.updates_published += 1
+                subscribers = list(self.subscribers)
+
+            self.logger.debug(f"StateStore: publishing changes to {sorted(changes)}")
+            for callback, fields in subscribers:
+                if fields is not None and not forced and not (fields & changes):
+                    continue
+                try:
+                    callback(self.sender, state=state, changes=changes)
+                except Exception as e:
+                    self.logger.error(f"StateStore: subscriber {callback} failed => {e}")
+
+    def get(self):
+        """Copy of the last published state."""
+        with self.lock:
+            return dict(self.state)
@@ -6,10 +6,16 @@ import time
 import threading
 from blinker import Signal
 
+from network.state_store import StateStore
+from network.browse_cache import BrowseCache
+from network.browse_requests import BrowseRequestRegistry
+from concurrent.futures import Future
+
 class VolumioListener:
-    def __init__(self, host='localhost', port=3000, reconnect_delay=5):
+    def __init__(self, host='localhost', port=3000, reconnect_delay=5, browse_cache_ttls=None):
         """
         Initialize the VolumioListener.
+        browse_cache_ttls optionally overrides the per-service browse cache TTLs (seconds).
         """
         self.logger = logging.getLogger("VolumioListener")
         self.logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed logs
@@ -41,14 +47,17 @@ class VolumioListener:
 
         # Internal state
         self.current_state = {}
+        self.current_volume = None
+        self.state_received_at = 0.0
         self.state_lock = threading.Lock()
+        self.state_store = StateStore(self, coalesce_window=0.05)
+        self.state_store.subscribe(self._on_state_published)
         self._running = True
         self._reconnect_attempt = 1
 
         # Tracking browseLibrary requests
-        self.browse_lock = threading.Lock()
-        self.last_browse_service = None
-        self.last_browse_uri = None
+        self.browse_requests = BrowseRequestRegistry(self._emit_browse_library, default_timeout=10.0)
+        self.browse_cache = BrowseCache(ttls=browse_cache_ttls)
 
         self.register_socketio_events()
         self.connect()
@@ -63,6 +72,9 @@ class VolumioListener:
         self.socketIO.on('pushTrack', self.on_push_track)
         self.socketIO.on('pushToastMessage', self.on_push_toast_message)
         self.socketIO.on('volume', self.set_volume)
+        # Sources or playlists changed => cached folders may be out of date
+        self.socketIO.on('pushBrowseSources', lambda *args: self.invalidate_browse_cache())
+        self.socketIO.on('pushListPlaylist', lambda *args: self.invalidate_browse_cache(("playlists", "playlist://")))
     
     def set_volume(self, value):
         """Set the volume to a specific value, increase/decrease, or mute/unmute."""
@@ -113,6 +125,58 @@ class VolumioListener:
         """Unmute the volume."""
         self.set_volume('unmute')
 
+    # ------------------------------------------------------------------
+    #   Transport (socket.io emits; no volumio CLI process per command)
+    # ------------------------------------------------------------------
+    def _emit(self, event, data=None):
+        if not self.socketIO.connected:
+            self.logger.warning(f"[VolumioListener] Cannot emit '{event}' - not connected to Volumio.")
+            return False
+        self.logger.info(f"[VolumioListener] Emitting '{event}' {data if data is not None else ''}")
+        if data is None:
+            self.socketIO.emit(event)
+        else:
+            self.socketIO.emit(event, data)
+        return True
+
+    def play(self):
+        return self._emit('play')
+
+    def pause(self):
+        return self._emit('pause')
+
+    def toggle_play_pause(self):
+        return self._emit('toggle')
+
+    def next_track(self):
+        return self._emit('next')
+
+    def previous_track(self):
+        return self._emit('prev')
+
+    def seek_relative(self, seconds):
+        """Seek `seconds` forward (or back if negative) from the current position."""
+        with self.state_lock:
+            state = self.current_state
+            position = (state.get('seek') or 0) / 1000.0
+            if state.get('status') == 'play':
+                position += time.monotonic() - self.state_received_at
+            duration = state.get('duration') or 0
+        target = max(0, int(position + seconds))
+        if duration:
+            target = min(target, int(duration))
+        return self._emit('seek', target)
+
+    def toggle_random(self):
+        with self.state_lock:
+            enabled = bool(self.current_state.get('random'))
+        return self._emit('setRandom', {'value': not enabled})
+
+    def toggle_repeat(self):
+        with self.state_lock:
+            enabled = bool(self.current_state.get('repeat'))
+        return self._emit('setRepeat', {'value': not enabled})
+
     def on_push_toast_message(self, data):
         """Handle 'pushToastMessage' events."""
         self.logger.info("[VolumioListener] Received pushToastMessage event.")
@@ -140,7 +204,7 @@ class VolumioListener:
         self.connected.send(self)
         self.logger.info("[VolumioListener] Connected to Volumio.")
         self._reconnect_attempt = 1  # Reset reconnect attempts
-        self.socketIO.emit('getState')
+        self.request_state()
 
     def is_connected(self):
         """Check if the client is connected to Volumio."""
@@ -167,11 +231,37 @@ class VolumioListener:
 
     def on_push_state(self, data):
         self.logger.info("[VolumioListener] Received pushState event.")
+        # Bursts are merged and unchanged states dropped; see _on_state_published
+        self.state_store.update(data)
+
+    def _on_state_published(self, sender, state, changes):
         with self.state_lock:
-            self.current_state = data  # Store the current state
-            if "volume" in data:
-                self.current_volume = data["volume"]
-        self.state_changed.send(self, state=data)
+            was_updating = self.current_state.get("updatedb")
+            self.current_state = state  # Store the current state
+            self.state_received_at = time.monotonic()
+            if "volume" in state:
+                self.current_volume = state["volume"]
+        if "updatedb" in changes and was_updating and not state.get("updatedb"):
+            # A NAS/USB rescan just finished => cached library folders may be out of date
+            self.invalidate_browse_cache("music-library/")
+        self.state_changed.send(self, state=state, changes=changes)
+
+    def subscribe(self, callback, fields=None):
+        """
+        Register `callback(sender, state, changes)` for state changes, optionally
+        only for changes to the given fields (e.g. ("status", "service")).
+        """
+        self.state_store.subscribe(callback, fields)
+
+    def unsubscribe(self, callback):
+        self.state_store.unsubscribe(callback)
+
+    def request_state(self):
+        """Ask Volumio for its state; the reply is published even if nothing changed."""
+        if not self.socketIO.connected:
+            return
+        self.state_store.force_next()
+        self.socketIO.emit('getState')
 
     def on_push_browse_library(self, data):
         """Handle 'pushBrowseLibrary' events."""
@@ -181,12 +271,26 @@ class VolumioListener:
             self.logger.warning("[VolumioListener] No navigation data received.")
             return
 
-        with self.browse_lock:
-            service = self.last_browse_service
-            uri = self.last_browse_uri
-            # Reset the tracking after using
-            self.last_browse_service = None
-            self.last_browse_uri = None
+        service = uri = None
+        request = self.browse_requests.resolve(navigation, data)
+        if request is not None:
+            service, uri = request.service, request.uri
+            elapsed_ms = (time.monotonic() - request.sent_at) * 1000
+            self.logger.debug(f"[VolumioListener] Response matched request #{request.id} for {uri} after {elapsed_ms:.0f} ms.")
+
+            changed = self.browse_cache.put(uri, navigation, service) if service else True
+            if request.cancelled:
+                self.logger.debug(f"[VolumioListener] Dropping response for cancelled request {uri}.")
+                return
+            try:
+                request.future.set_result(navigation)
+            except Exception:
+                pass  # cancelled in the meantime
+            if request.quiet:
+                return
+            if request.revalidate and not changed:
+                self.logger.debug(f"[VolumioListener] Cached navigation for {uri} is still current.")
+                return
 
         self.logger.debug(f"[VolumioListener] Using URI: {uri}, Service: {service}")
 
@@ -230,17 +334,91 @@ class VolumioListener:
         self.socketIO.disconnect()
         self.logger.info("[VolumioListener] Listener stopped.")
 
-    def fetch_browse_library(self, uri):
+    def fetch_browse_library(self, uri, use_cache=True, callback=None, timeout=None, quiet=False):
+        """
+        Requests navigation for `uri`. A cached result is delivered through
+        navigation_received straight away; if it has outlived its TTL Volumio
+        is asked again and the menu only updates if the answer differs.
+
+        Returns a Future resolving to the navigation dict (TimeoutError after
+        `timeout` seconds, cancelled by cancel_browse_requests); `callback(future)`
+        is added to it. A request for a URI already in flight shares that request.
+
+        With `quiet` the result only goes into the browse cache and the Future
+        (used to prefetch); navigation_received is not sent for it. A quiet
+        request is refused (the Future fails) while other requests are pending.
+        """
+        revalidate = False
+        if use_cache:
+            cached = self.browse_cache.get(uri)
+            if cached is not None:
+                navigation, service, fresh = cached
+                self.logger.debug(f"[VolumioListener] Browse cache hit for {uri} ({'fresh' if fresh else 'stale'}).")
+                if not quiet:
+                    self.navigation_received.send(self, navigation=navigation, service=service, uri=uri)
+                if fresh:
+                    future = Future()
+                    future.set_result(navigation)
+                    if callback:
+                        future.add_done_callback(callback)
+                    return future
+                revalidate = True
+
+        in_flight = self.browse_requests.outstanding(uri)
+        if in_flight is not None:
+            self.logger.debug(f"[VolumioListener] browseLibrary for {uri} already in flight (#{in_flight.id}).")
+            if in_flight.quiet and not quiet and not revalidate and not in_flight.announced:
+                # Selected while its prefetch was still loading: show it when it lands
+                in_flight.announced = True
+                in_flight.future.add_done_callback(lambda f, r=in_flight: self._announce_browse_result(r, f))
+            if callback:
+                in_flight.future.add_done_callback(callback)
+            return in_flight.future
+
         if self.socketIO.connected:
             service = self.get_service_from_uri(uri)
-            with self.browse_lock:
-                self.last_browse_service = service
-                self.last_browse_uri = uri
-                self.logger.debug(f"[VolumioListener] Tracking browseLibrary URI: {uri}, Service: {service}")
-            self.socketIO.emit("browseLibrary", {"uri": uri})
-            self.logger.debug(f"[VolumioListener] Emitted 'browseLibrary' for URI: {uri}")
-        else:
-            self.logger.warning("[VolumioListener] Cannot emit 'browseLibrary' - not connected to Volumio.")
+            request = self.browse_requests.register(uri, service, callback=callback, timeout=timeout,
+                                                    revalidate=revalidate, quiet=quiet)
+            if request is not None:
+                self.logger.debug(f"[VolumioListener] Tracking browseLibrary #{request.id} URI: {uri}, Service: {service}")
+                return request.future
+            self.logger.debug(f"[VolumioListener] Not prefetching {uri} while other browse requests are pending.")
+            future = Future()
+            future.set_exception(RuntimeError("browse requests pending"))
+            if callback:
+                future.add_done_callback(callback)
+            return future
+
+        self.logger.warning("[VolumioListener] Cannot emit 'browseLibrary' - not connected to Volumio.")
+        future = Future()
+        future.set_exception(ConnectionError("Not connected to Volumio"))
+        if callback:
+            future.add_done_callback(callback)
+        return future
+
+    def _emit_browse_library(self, request):
+        self.socketIO.emit("browseLibrary", {"uri": request.uri})
+        self.logger.debug(f"[VolumioListener] Emitted 'browseLibrary' for URI: {request.uri}")
+
+    def _announce_browse_result(self, request, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.navigation_received.send(self, navigation=future.result(), service=request.service, uri=request.uri)
+
+    def cancel_browse_requests(self, prefix=None):
+        """
+        Cancels outstanding browseLibrary requests - all, or those whose URI
+        starts with `prefix` (str or tuple). Their responses are then dropped.
+        """
+        cancelled = self.browse_requests.cancel(prefix)
+        if cancelled:
+            self.logger.debug(f"[VolumioListener] Cancelled {cancelled} browseLibrary request(s) for {prefix or 'all'}.")
+        return cancelled
+
+    def invalidate_browse_cache(self, prefix=None):
+        """Forget cached browse results (all, or those whose URI starts with `prefix`, str or tuple)."""
+        self.logger.info(f"[VolumioListener] Invalidating browse cache{f' for {prefix}' if prefix else ''}.")
+        self.browse_cache.invalidate(prefix)
 
     def get_service_from_uri(self, uri):
         self.logger.debug(f"Determining service for URI: {uri}")